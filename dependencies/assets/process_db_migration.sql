@@ -0,0 +1,82 @@
+-----------------------------------------------------
+-- Process DB Migration                            --
+-----------------------------------------------------
+
+-- Idempotent schema changes of the process database (PostgreSQL).
+-- Run against the process DB schema, `public` in DEV and `dq` otherwise, e.g.:
+--   $ psql -d mgdb -v ON_ERROR_STOP=1 -c "SET search_path TO dq" -f process_db_migration.sql
+
+
+-----------------------------------------------------
+-- Job And Task Configuration                      --
+-----------------------------------------------------
+
+ALTER TABLE data_quality_job_config
+    ADD COLUMN IF NOT EXISTS job_group     VARCHAR(100),
+    ADD COLUMN IF NOT EXISTS max_workers   INTEGER CHECK (max_workers >= 1),
+    ADD COLUMN IF NOT EXISTS max_processes INTEGER CHECK (max_processes >= 1),
+    ADD COLUMN IF NOT EXISTS is_async      BOOLEAN DEFAULT FALSE,
+    ADD COLUMN IF NOT EXISTS restart_mode  VARCHAR(20) DEFAULT 'TAIL';
+
+-- Task configurations are read through the `v_data_quality_task_config` view,
+-- which has to select the new columns of its base table once they are added
+ALTER TABLE data_quality_task_config
+    ADD COLUMN IF NOT EXISTS depends_on   INTEGER[],
+    ADD COLUMN IF NOT EXISTS is_cacheable BOOLEAN DEFAULT FALSE,
+    ADD COLUMN IF NOT EXISTS incremental  JSON;
+
+
+-----------------------------------------------------
+-- Task Watermark                                  --
+-----------------------------------------------------
+
+-- High watermarks of the last successfully validated window of each incremental task,
+-- upserted on the (job_id, task_id) key
+CREATE TABLE IF NOT EXISTS data_quality_task_watermark (
+    job_id        INTEGER NOT NULL,
+    task_id       INTEGER NOT NULL,
+    src_watermark TEXT,
+    tgt_watermark TEXT,
+    batch_id      VARCHAR(100),
+    dw_updated_ts TIMESTAMP,
+    PRIMARY KEY (job_id, task_id)
+);
+
+
+-----------------------------------------------------
+-- Task Result Cache                               --
+-----------------------------------------------------
+
+ALTER TABLE data_quality_task_log
+    ADD COLUMN IF NOT EXISTS origin_batch_id  VARCHAR(100),
+    ADD COLUMN IF NOT EXISTS config_hash      CHAR(64),
+    ADD COLUMN IF NOT EXISTS data_fingerprint CHAR(64),
+    ADD COLUMN IF NOT EXISTS is_cached        BOOLEAN DEFAULT FALSE;
+
+-- Cached results are looked up by configuration hash and data fingerprint before every cacheable task
+CREATE INDEX IF NOT EXISTS ix_data_quality_task_log_cache_key
+    ON data_quality_task_log (config_hash, data_fingerprint);
+
+
+-----------------------------------------------------
+-- Job Queue                                       --
+-----------------------------------------------------
+
+CREATE TABLE IF NOT EXISTS data_quality_job_queue (
+    request_id       BIGSERIAL PRIMARY KEY,
+    job_id           INTEGER NOT NULL,
+    is_scheduled     BOOLEAN DEFAULT FALSE,
+    request_status   VARCHAR(20) NOT NULL DEFAULT 'PENDING',
+    claimed_by       VARCHAR(255),
+    lease_expires_ts TIMESTAMP,
+    batch_id         VARCHAR(100),
+    dw_created_ts    TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    dw_updated_ts    TIMESTAMP
+);
+
+-- Claims of workers killed before closing their job request are reclaimed once their lease expires
+ALTER TABLE data_quality_job_queue
+    ADD COLUMN IF NOT EXISTS lease_expires_ts TIMESTAMP;
+
+CREATE INDEX IF NOT EXISTS ix_data_quality_job_queue_request_status
+    ON data_quality_job_queue (request_status, request_id);
@@ -3,10 +3,11 @@
 #####################################################
 
 from urllib.parse import quote
-from typing import Final, Optional
 from sqlalchemy import create_engine
 from sqlalchemy.engine.base import Engine
+from typing import Any, Dict, Final, List, Optional
 from dependencies.entities.interfaces.i_database import IDatabase
+from sqlalchemy.types import Boolean, Date, DateTime, Float, Integer, Numeric, TypeEngine
 
 
 #####################################################
@@ -30,9 +31,14 @@ class Mysql(IDatabase):
         return f"mysql+pymysql://{self.__username}:{self.__password}@{self.__hostname}{f':{self.__port}' if self.__port else ''}/{p_dbname}"
     
 
-    def create_engine(self, p_connection_string: str) -> Engine:
+    def async_connection_string(self, p_dbname: str) -> str:
+
+        return f"mysql+aiomysql://{self.__username}:{self.__password}@{self.__hostname}{f':{self.__port}' if self.__port else ''}/{p_dbname}"
+    
+
+    def create_engine(self, p_connection_string: str, **kwargs) -> Engine:
         
-        return create_engine(p_connection_string)
+        return create_engine(p_connection_string, **kwargs)
     
 
     def table_identifier(self, p_schema: Optional[str], p_table: str) -> str:
@@ -40,6 +46,75 @@ class Mysql(IDatabase):
         return p_table
     
 
-    def select_query(self, p_table_identifier: str) -> str:
+    def quote_identifier(self, p_identifier: str) -> str:
+
+        return "`" + p_identifier.replace("`", "``") + "`"
+    
+
+    def select_query(self, p_table_identifier: str, p_columns: Optional[List[str]] = None) -> str:
+
+        return f"SELECT {', '.join(map(self.quote_identifier, p_columns)) if p_columns else '*'} FROM {p_table_identifier};"
+    
+
+    def replica_lag_query(self) -> Optional[str]:
+
+        return "SHOW REPLICA STATUS;"
+    
+
+    def fingerprint_query(self, p_dbname: str, p_schema: Optional[str], p_table: str) -> Optional[str]:
+
+        # information_schema UPDATE_TIME and TABLE_ROWS are cached statistics, estimated or NULL for InnoDB tables,
+        # hence MySQL tables are only fingerprinted through a watermark column
+        return None
+    
+
+    def row_hash_expression(self, p_columns: Dict[str, Optional[TypeEngine]]) -> Optional[str]:
+
+        # Values are rendered alike across databases: numerics without trailing zeros, floats rounded to `FLOAT_HASH_SCALE` decimals,
+        # booleans as numbers, temporals as 'YYYY-MM-DD HH:MM:SS.ffffff' and NULLs as a record separator character
+        _values: List[str] = []
+
+        for _column, _type in p_columns.items():
+
+            _identifier: str = self.quote_identifier(_column)
+
+            # Float is a subclass of Numeric, so it's matched first
+            if isinstance(_type, Float):
+                _value: str = (
+                    f"TRIM(TRAILING '.' FROM TRIM(TRAILING '0' FROM "
+                    f"CAST(ROUND(CAST({_identifier} AS DECIMAL(65, 30)), {self.FLOAT_HASH_SCALE}) AS DECIMAL(65, {self.FLOAT_HASH_SCALE}))))"
+                )
+
+            elif isinstance(_type, (Integer, Numeric, Boolean)):
+                _value: str = f"TRIM(TRAILING '.' FROM TRIM(TRAILING '0' FROM CAST({_identifier} AS DECIMAL(65, 30))))"
+
+            elif isinstance(_type, (Date, DateTime)):
+                _value: str = f"DATE_FORMAT({_identifier}, '%Y-%m-%d %H:%i:%s.%f')"
+
+            else:
+                _value: str = f"CAST({_identifier} AS CHAR)"
+
+            _values.append(f"COALESCE({_value}, CHAR(30 USING utf8mb4))")
+
+        _concat_values: str = ", ".join(_values) if _values else "''"
+
+        return f"MD5(CONCAT_WS(CHAR(31 USING utf8mb4), {_concat_values}))"
+    
+
+    def hash_sum_expression(self, p_hash_expression: str) -> Optional[str]:
+
+        # Sums the leading 60 bits of the hashes, exactly as DECIMAL
+        return f"SUM(CAST(CONV(LEFT({p_hash_expression}, 15), 16, 10) AS UNSIGNED))"
+    
+
+    def result_column_type(self, p_type_code: Any) -> Optional[TypeEngine]:
+
+        # PyMySQL describes result columns by their protocol field type, other types are hashed as text
+        _type: Optional[type] = {
+            0: Numeric, 246: Numeric,
+            1: Integer, 2: Integer, 3: Integer, 8: Integer, 9: Integer, 13: Integer, 16: Integer,
+            4: Float, 5: Float,
+            10: Date, 14: Date, 7: DateTime, 12: DateTime
+        }.get(p_type_code)
 
-        return f"SELECT * FROM {p_table_identifier};"
\ No newline at end of file
+        return _type() if _type else None
\ No newline at end of file
@@ -3,10 +3,11 @@
 #####################################################
 
 from urllib.parse import quote
-from typing import Final, Optional
 from sqlalchemy import create_engine
 from sqlalchemy.engine.base import Engine
+from typing import Any, Dict, Final, List, Optional
 from dependencies.entities.interfaces.i_database import IDatabase
+from sqlalchemy.types import Boolean, Date, DateTime, Float, Integer, Numeric, TypeEngine
 
 
 #####################################################
@@ -30,9 +31,14 @@ class Postgre(IDatabase):
         return f"postgresql+psycopg2://{self.__username}:{self.__password}@{self.__hostname}{f':{self.__port}' if self.__port else ''}/{p_dbname}"
     
 
-    def create_engine(self, p_connection_string: str) -> Engine:
+    def async_connection_string(self, p_dbname: str) -> str:
+
+        return f"postgresql+asyncpg://{self.__username}:{self.__password}@{self.__hostname}{f':{self.__port}' if self.__port else ''}/{p_dbname}"
+    
+
+    def create_engine(self, p_connection_string: str, **kwargs) -> Engine:
         
-        return create_engine(p_connection_string)
+        return create_engine(p_connection_string, **kwargs)
     
 
     def table_identifier(self, p_schema: str, p_table: str) -> str:
@@ -40,6 +46,77 @@ class Postgre(IDatabase):
         return f"{p_schema}.{p_table}"
     
 
-    def select_query(self, p_table_identifier: str) -> str:
+    def quote_identifier(self, p_identifier: str) -> str:
+
+        return '"' + p_identifier.replace('"', '""') + '"'
+    
+
+    def select_query(self, p_table_identifier: str, p_columns: Optional[List[str]] = None) -> str:
+
+        return f"SELECT {', '.join(map(self.quote_identifier, p_columns)) if p_columns else '*'} FROM {p_table_identifier};"
+    
+
+    def replica_lag_query(self) -> Optional[str]:
+
+        return (
+            "SELECT CASE WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+            "ELSE EXTRACT(EPOCH FROM NOW() - pg_last_xact_replay_timestamp()) END AS lag_seconds;"
+        )
+    
+
+    def fingerprint_query(self, p_dbname: str, p_schema: str, p_table: str) -> str:
+
+        return f"SELECT n_tup_ins, n_tup_upd, n_tup_del, n_live_tup FROM pg_stat_user_tables WHERE schemaname = '{p_schema}' AND relname = '{p_table}';"
+    
+
+    def row_hash_expression(self, p_columns: Dict[str, Optional[TypeEngine]]) -> Optional[str]:
+
+        # Values are rendered alike across databases: numerics without trailing zeros, floats rounded to `FLOAT_HASH_SCALE` decimals,
+        # booleans as numbers, temporals as 'YYYY-MM-DD HH:MM:SS.ffffff' and NULLs as a record separator character.
+        # TRIM_SCALE requires PostgreSQL 13 or later
+        _values: List[str] = []
+
+        for _column, _type in p_columns.items():
+
+            _identifier: str = self.quote_identifier(_column)
+
+            if isinstance(_type, Boolean):
+                _value: str = f"CAST(CAST({_identifier} AS INTEGER) AS TEXT)"
+
+            # Float is a subclass of Numeric, so it's matched first
+            elif isinstance(_type, Float):
+                _value: str = f"CAST(TRIM_SCALE(ROUND(CAST({_identifier} AS NUMERIC), {self.FLOAT_HASH_SCALE})) AS TEXT)"
+
+            elif isinstance(_type, (Integer, Numeric)):
+                _value: str = f"CAST(TRIM_SCALE(CAST({_identifier} AS NUMERIC)) AS TEXT)"
+
+            elif isinstance(_type, (Date, DateTime)):
+                _value: str = f"TO_CHAR(CAST({_identifier} AS TIMESTAMP), 'YYYY-MM-DD HH24:MI:SS.US')"
+
+            else:
+                _value: str = f"CAST({_identifier} AS TEXT)"
+
+            _values.append(f"COALESCE({_value}, CHR(30))")
+
+        _concat_values: str = ", ".join(_values) if _values else "''"
+
+        return f"MD5(CONCAT_WS(CHR(31), {_concat_values}))"
+    
+
+    def hash_sum_expression(self, p_hash_expression: str) -> Optional[str]:
+
+        # Sums the leading 60 bits of the hashes, exactly as NUMERIC
+        return f"SUM(CAST(CAST('x' || LEFT({p_hash_expression}, 15) AS BIT(60)) AS BIGINT))"
+    
+
+    def result_column_type(self, p_type_code: Any) -> Optional[TypeEngine]:
+
+        # psycopg2 describes result columns by their type OID, other types are hashed as text
+        _type: Optional[type] = {
+            16: Boolean,
+            20: Integer, 21: Integer, 23: Integer,
+            700: Float, 701: Float, 1700: Numeric,
+            1082: Date, 1114: DateTime, 1184: DateTime
+        }.get(p_type_code)
 
-        return f"SELECT * FROM {p_table_identifier};"
\ No newline at end of file
+        return _type() if _type else None
\ No newline at end of file
@@ -0,0 +1,83 @@
+#####################################################
+# Packages                                          #
+#####################################################
+
+import os
+from sqlalchemy import create_engine
+from sqlalchemy.types import TypeEngine
+from sqlalchemy.engine.base import Engine
+from typing import Any, Dict, Final, List, Optional
+from dependencies.entities.interfaces.i_database import IDatabase
+
+
+#####################################################
+# Classes                                           #
+#####################################################
+
+class Sqlite(IDatabase):
+
+
+    def __init__(self, p_username: Optional[str], p_password: Optional[str], p_hostname: str, p_port: Optional[int] = None) -> None:
+
+        # Private Variables, the hostname is the directory holding the database files
+        self.__hostname: Final[str] = p_hostname
+
+
+    def connection_string(self, p_dbname: str) -> str:
+
+        return f"sqlite:///{os.path.join(self.__hostname, p_dbname)}"
+    
+
+    def async_connection_string(self, p_dbname: str) -> Optional[str]:
+
+        return f"sqlite+aiosqlite:///{os.path.join(self.__hostname, p_dbname)}"
+    
+
+    def create_engine(self, p_connection_string: str, **kwargs) -> Engine:
+        
+        return create_engine(p_connection_string, **kwargs)
+    
+
+    def table_identifier(self, p_schema: Optional[str], p_table: str) -> str:
+        
+        return p_table
+    
+
+    def quote_identifier(self, p_identifier: str) -> str:
+
+        return '"' + p_identifier.replace('"', '""') + '"'
+    
+
+    def select_query(self, p_table_identifier: str, p_columns: Optional[List[str]] = None) -> str:
+
+        return f"SELECT {', '.join(map(self.quote_identifier, p_columns)) if p_columns else '*'} FROM {p_table_identifier};"
+    
+
+    def replica_lag_query(self) -> Optional[str]:
+
+        # SQLite has no replication
+        return None
+    
+
+    def fingerprint_query(self, p_dbname: str, p_schema: Optional[str], p_table: str) -> Optional[str]:
+
+        # SQLite keeps no table modification statistics
+        return None
+    
+
+    def row_hash_expression(self, p_columns: Dict[str, Optional[TypeEngine]]) -> Optional[str]:
+
+        # SQLite has no canonical row hashing, its rows are compared in full
+        return None
+    
+
+    def hash_sum_expression(self, p_hash_expression: str) -> Optional[str]:
+
+        # SQLite has no canonical row hashing to sum
+        return None
+    
+
+    def result_column_type(self, p_type_code: Any) -> Optional[TypeEngine]:
+
+        # SQLite doesn't describe the types of result columns
+        return None
\ No newline at end of file
@@ -6,6 +6,7 @@ import logging
 from typing import Optional
 import great_expectations as gx
 from great_expectations.exceptions import DataContextError
+from dependencies.utilities.governor_util import GovernorUtil
 from dependencies.entities.factories.f_database import FDatabase
 from great_expectations.core.batch_definition import BatchDefinition
 from great_expectations.core.expectation_suite import ExpectationSuite
@@ -32,6 +33,8 @@ class SqlExpectation(IExpectation):
 
     def __init__(self, p_dbtype: str, p_dbname: str, p_schema: Optional[str], p_table: str, p_query: Optional[str]) -> None:
 
+        self.dbtype = p_dbtype.strip().upper()
+
         # Great Expectations component names
         self.data_source_name       = f"{p_dbtype}.{p_dbname}".lower()
         self.data_asset_name        = f"{p_schema + '.' + p_table if p_schema else p_table}".lower()
@@ -42,11 +45,14 @@ class SqlExpectation(IExpectation):
         # Get database connection string
         self.db_instance_conn_str = self._initialize_database(p_dbtype, p_dbname)
         
-        # Add or update SQL data source
-        self.data_source = self._setup_data_source()
+        # Data source and asset setup may reach the database
+        with GovernorUtil.slot(self.db_instance_conn_str):
+
+            # Add or update SQL data source
+            self.data_source = self._setup_data_source()
 
-        # Create a Table or Query Asset
-        self.data_asset = self._setup_data_asset(p_schema, p_table, p_query)
+            # Create a Table or Query Asset
+            self.data_asset = self._setup_data_asset(p_schema, p_table, p_query)
 
         # Define batch for processing
         self.batch_definition: BatchDefinition = self._define_batch()
@@ -60,14 +66,21 @@ class SqlExpectation(IExpectation):
 
     def _initialize_database(self, _dbtype: str, _dbname: str) -> str:
 
-        """Initializes and retrieves the database connection string."""
+        """Initializes and retrieves the database connection string, of a read replica if any is configured."""
         
-        return FDatabase(_dbtype).make_connection(_dbname).connection_string
+        return FDatabase(_dbtype).make_connection(_dbname, p_read_only = True).connection_string
 
     
     def _setup_data_source(self) -> SQLDatasource:
         
-        """Adds or updates an SQL data source in Great Expectations."""
+        """Adds or updates an SQL data source in Great Expectations, using the dialect specific data source if there is one."""
+
+        if self.dbtype == "SQLITE":
+
+            return self.context.data_sources.add_or_update_sqlite(
+                name = self.data_source_name,
+                connection_string = self.db_instance_conn_str
+            )
 
         return self.context.data_sources.add_or_update_sql(
             name = self.data_source_name,
@@ -132,9 +145,10 @@ class SqlExpectation(IExpectation):
 
     def run(self) -> ExpectationSuiteValidationResult:
 
-        """Runs the validation process and returns validation result."""
+        """Runs the validation process, holding an in-flight query slot of the database, and returns validation result."""
 
-        validation_result: ExpectationSuiteValidationResult = self.validation_definition.run()
+        with GovernorUtil.slot(self.db_instance_conn_str):
+            validation_result: ExpectationSuiteValidationResult = self.validation_definition.run()
 
         for validation_info in validation_result["results"]:
 
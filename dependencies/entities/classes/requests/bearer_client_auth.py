@@ -3,6 +3,7 @@
 #####################################################
 
 import requests
+from typing import Optional
 from dependencies.utilities.js_util import JsUtil
 from dependencies.utilities.cred_util import CredUtil
 from dependencies.entities.interfaces.i_request import IRequestAuth
@@ -32,6 +33,7 @@ class BearerClientAuth(IRequestAuth):
         response.raise_for_status()
 
         response_type: str = response.headers.get("Content-Type")
+        expires_in: Optional[int] = None
 
         if "text/plain" in response_type:
             access_token: str = response.text.strip()
@@ -43,7 +45,12 @@ class BearerClientAuth(IRequestAuth):
                 p_nested_keys = CredUtil.getenv(f"API_AUTH_RESPONSE_PATH_{auth_key}").split(".")
             )
 
+            # Lifetime of the token in seconds, as per OAuth 2.0 token responses
+            if isinstance(response.json(), dict) and response.json().get("expires_in") is not None:
+                expires_in = int(response.json()["expires_in"])
+
         return {
+            "expires_in": expires_in,
             "headers": {
                 "Authorization": f"Bearer {access_token}",
                 "Content-Type": "application/json",
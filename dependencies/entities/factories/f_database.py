@@ -2,17 +2,38 @@
 # Packages                                          #
 #####################################################
 
+import json
+import time
+import atexit
+import asyncio
 import logging
-from sqlalchemy import text
+import itertools
+import threading
+import numpy as np
+import pandas as pd
+from decimal import Decimal
 from collections import namedtuple
+from contextvars import ContextVar
+from sqlalchemy import inspect, text
+from contextlib import contextmanager
+from sqlalchemy.types import TypeEngine
 from sqlalchemy.orm import sessionmaker
-from typing import Dict, Final, Optional
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.exc import SQLAlchemyError
+from dependencies.utilities.df_util import DfUtil
 from dependencies.utilities.cred_util import CredUtil
+from dependencies.utilities.governor_util import GovernorUtil
 from dependencies.entities.classes.databases.mysql import Mysql
 from dependencies.entities.interfaces.i_database import IDatabase
+from dependencies.entities.classes.databases.sqlite import Sqlite
+from dependencies.entities.classes.databases.duckdb import Duckdb
 from dependencies.entities.classes.databases.postgre import Postgre
+from typing import TYPE_CHECKING, Any, Dict, Final, Iterator, List, Optional, Tuple
+
+
+# Optional dependency, only required by the asyncio execution mode
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
 
 
 #####################################################
@@ -27,55 +48,523 @@ class FDatabase:
     # Class Private Variables
     __DBINSTANCE: Final[Dict[str, IDatabase]] = {
         "MYSQL": Mysql,
-        "POSTGRE": Postgre
+        "POSTGRE": Postgre,
+        "SQLITE": Sqlite,
+        "DUCKDB": Duckdb
     }
 
+    # File-based databases, located by a directory instead of network credentials
+    __FILE_DBTYPES: Final[List[str]] = ["SQLITE", "DUCKDB"]
+
+    # Process-wide engine registry keyed by connection string, so that connection pools are shared across tasks
+    __ENGINES: Final[Dict[str, Engine]] = {}
+    __ENGINES_LOCK: Final[threading.Lock] = threading.Lock()
+
+    # Round-robin replica cursors per database type, and replication lag readings per replica connection string
+    __REPLICA_CURSORS: Final[Dict[str, Iterator[int]]] = {}
+    __REPLICA_LAGS: Final[Dict[str, Tuple[float, Optional[float]]]] = {}
+    __REPLICA_LAG_TTL_SECONDS: Final[float] = 30.0
+    __REPLICA_LAG_COLUMNS: Final[List[str]] = ["lag_seconds", "Seconds_Behind_Source", "Seconds_Behind_Master"]
+
+    # Set within `primary_reads`, routing read-only connections of the current context to the primary
+    __PRIMARY_READS: Final[ContextVar] = ContextVar("primary_reads", default = False)
+
 
     def __init__(self, p_dbtype: str) -> None:
 
         dbtype: str = p_dbtype.strip().upper()
-        dbcred: dict = CredUtil().get_db_credential(dbtype)
+        dbcred: dict = (
+            CredUtil.get_db_file_credential(dbtype)
+                if dbtype in self.__FILE_DBTYPES else CredUtil().get_db_credential(dbtype)
+        )
         
         if dbtype not in self.__DBINSTANCE.keys():
             raise ValueError(f"Unsupported database type detected: {dbtype}, supported databases: {', '.join(self.__DBINSTANCE)}.")
         
+        self.dbtype: str = dbtype
+        
         self.db_instance: IDatabase = self.__DBINSTANCE[dbtype](
             p_username = dbcred["username"],
             p_password = dbcred["password"],
             p_hostname = dbcred["hostname"],
             p_port     = dbcred["port"]
         )
+
+        # Read replicas of the primary database, only serving read-only connections
+        self.replica_instances: List[IDatabase] = [
+            self.__DBINSTANCE[dbtype](
+                p_username = replica_cred["username"],
+                p_password = replica_cred["password"],
+                p_hostname = replica_cred["hostname"],
+                p_port     = replica_cred["port"]
+            )
+            for replica_cred in (CredUtil.get_db_replica_credentials(dbtype) if dbtype not in self.__FILE_DBTYPES else [])
+        ]
+
+        FDatabase.__REPLICA_CURSORS.setdefault(dbtype, itertools.count())
     
 
-    def make_connection(self, p_dbname: str) -> namedtuple:
+    def __get_engine_options(self) -> dict:
+
+        """
+        Returns the connection pool options of the database type, defaulting to pre-pinged connections recycled every 30 minutes.
+        """
+
+        pool_config: dict = CredUtil.get_db_pool_config(self.dbtype)
+
+        engine_options: dict = {
+            "pool_pre_ping": (pool_config["pool_pre_ping"] or "TRUE").strip().upper() in ("TRUE", "1", "YES"),
+            "pool_recycle": int(pool_config["pool_recycle"] or 1800)
+        }
+
+        if pool_config["pool_size"]:
+            engine_options["pool_size"] = int(pool_config["pool_size"])
+
+        if pool_config["max_overflow"]:
+            engine_options["max_overflow"] = int(pool_config["max_overflow"])
+
+        return engine_options
+    
+
+    def __get_replica_lag(self, p_replica_instance: IDatabase, p_dbname: str) -> Optional[float]:
+
+        """
+        Returns the replication lag of a replica in seconds, read at most once every 30 seconds per replica,
+            or None if the replica can't tell its lag. An unreachable replica is reported with an infinite lag,
+            and so is a replica whose status row has no lag, as MySQL reports a broken replication with a NULL lag.
+        """
+
+        db_connection_str: str = p_replica_instance.connection_string(p_dbname)
+        checked_at, replica_lag = FDatabase.__REPLICA_LAGS.get(db_connection_str, (float("-inf"), None))
+
+        if time.monotonic() - checked_at < FDatabase.__REPLICA_LAG_TTL_SECONDS:
+            return replica_lag
+
+        lag_query: Optional[str] = p_replica_instance.replica_lag_query()
+
+        if lag_query is None:
+            return None
+
+        try:
+
+            lag_df: pd.DataFrame = DfUtil.read_sql(p_query = lag_query, p_engine = self.__get_engine(p_replica_instance, p_dbname).engine)
+            lag_columns: List[str] = [column for column in FDatabase.__REPLICA_LAG_COLUMNS if column in lag_df.columns]
+
+            if lag_df.empty or not lag_columns:
+                replica_lag = None
+
+            elif pd.isna(lag_df[lag_columns[0]].iloc[0]):
+
+                logger.warning(f"A {self.dbtype} replica reports no replication lag, leaving it out as its replication is broken.")
+
+                replica_lag = float("inf")
+
+            else:
+                replica_lag = float(lag_df[lag_columns[0]].iloc[0])
+
+        except SQLAlchemyError as error:
+
+            logger.warning(f"Replication lag check failed for a {self.dbtype} replica, leaving it out: {error}")
+
+            replica_lag = float("inf")
+
+        FDatabase.__REPLICA_LAGS[db_connection_str] = (time.monotonic(), replica_lag)
+
+        return replica_lag
+
+
+    def __resolve_instance(self, p_dbname: str, p_read_only: bool) -> IDatabase:
+
+        """
+        Returns the database instance serving a connection. Read-only connections go to the replicas in round-robin,
+            skipping replicas lagging behind more than the configured maximum, and fall back to the primary when none qualifies.
+            Within `primary_reads`, every connection goes to the primary.
+        """
+
+        if not p_read_only or not self.replica_instances or FDatabase.__PRIMARY_READS.get():
+            return self.db_instance
+
+        max_lag_seconds: Optional[str] = CredUtil.get_db_replica_config(self.dbtype)["max_lag_seconds"]
+        start_index: int = next(FDatabase.__REPLICA_CURSORS[self.dbtype])
+
+        for offset in range(len(self.replica_instances)):
+
+            replica_instance: IDatabase = self.replica_instances[(start_index + offset) % len(self.replica_instances)]
+
+            if not max_lag_seconds:
+                return replica_instance
+
+            replica_lag: Optional[float] = self.__get_replica_lag(replica_instance, p_dbname)
+
+            if replica_lag is None or replica_lag <= float(max_lag_seconds):
+                return replica_instance
+
+        logger.warning(f"No {self.dbtype} replica within {max_lag_seconds} seconds of replication lag, reading from the primary.")
+
+        return self.db_instance
+
+
+    @staticmethod
+    @contextmanager
+    def primary_reads(p_enabled: bool = True) -> Iterator[None]:
+
+        """
+        Context manager routing the read-only connections made within the block (and its asyncio tasks) to the primary,
+            for reads that must be consistent with the watermarks and fingerprints, which are read from the primary.
+        """
+
+        token = FDatabase.__PRIMARY_READS.set(p_enabled or FDatabase.__PRIMARY_READS.get())
+
+        try:
+            yield
+
+        finally:
+            FDatabase.__PRIMARY_READS.reset(token)
+
+
+    def make_connection(self, p_dbname: str, p_read_only: bool = False) -> namedtuple:
 
         """
         Establishes a database connection and returns a named tuple containing 
-            the database engine and connection string.
+            the database engine and connection string. Engines are created once per connection string and process.
+            Read-only connections are routed to a read replica, if any is configured.
         """
 
-        db_connection_str: str = self.db_instance.connection_string(p_dbname)
-        db_engine: Engine = self.db_instance.create_engine(db_connection_str)
+        return self.__get_engine(self.__resolve_instance(p_dbname, p_read_only), p_dbname)
+
+
+    def __get_engine(self, p_db_instance: IDatabase, p_dbname: str) -> namedtuple:
+
+        """
+        Returns the registered engine and connection string of a database instance, creating the engine on first use.
+        """
+
+        db_connection_str: str = p_db_instance.connection_string(p_dbname)
+
+        with FDatabase.__ENGINES_LOCK:
+
+            if db_connection_str not in FDatabase.__ENGINES:
+                FDatabase.__ENGINES[db_connection_str] = p_db_instance.create_engine(db_connection_str, **self.__get_engine_options())
+
+            db_engine: Engine = FDatabase.__ENGINES[db_connection_str]
+
         DbConnection = namedtuple("DbConnection", ["engine", "connection_string"])
 
         return DbConnection(engine = db_engine, connection_string = db_connection_str)
         
 
-    def prepare_read_query(self, p_schema: Optional[str], p_table: str, p_query: Optional[str]) -> str:
+    @staticmethod
+    def dispose_engines() -> None:
+
+        """
+        Disposes every registered engine, closing their pooled connections. Registered to run at interpreter exit.
+        """
+
+        with FDatabase.__ENGINES_LOCK:
+
+            for db_engine in FDatabase.__ENGINES.values():
+                db_engine.dispose()
+
+            FDatabase.__ENGINES.clear()
+    
+
+    def make_async_engine(self, p_dbname: str, p_read_only: bool = False) -> "AsyncEngine":
+
+        """
+        Creates an asyncio database engine, the caller is responsible for disposing it.
+            Read-only engines are routed to a read replica, if any is configured.
+        """
+
+        # Optional dependency, only required by the asyncio execution mode
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        return create_async_engine(self.__resolve_instance(p_dbname, p_read_only).async_connection_string(p_dbname))
+    
+
+    def prepare_read_query(self, p_schema: Optional[str], p_table: str, p_query: Optional[str], p_columns: Optional[List[str]] = None) -> str:
 
         """
         Prepares a SQL read query based on the provided table and optional query.
+            When columns are provided, only those columns are selected, quoted for the database dialect.
         """
 
+        if p_query and p_columns:
+
+            _projected_columns: str = ", ".join(map(self.db_instance.quote_identifier, p_columns))
+
+            return f"SELECT {_projected_columns} FROM ({p_query.strip().rstrip(';')}) AS projection_query;"
+
         _read_query: str = (
             p_query
                 if p_query
                     else self.db_instance.select_query(
-                        self.db_instance.table_identifier(p_schema, p_table)
+                        self.db_instance.table_identifier(p_schema, p_table), p_columns
                     )
         )
 
         return _read_query
+
+
+    def prepare_window_query(self, p_schema: Optional[str], p_table: str, p_query: Optional[str], p_watermark_column: str, p_low_watermark: Optional[str], p_high_watermark: Optional[str]) -> str:
+
+        """
+        Prepares a SQL read query of the provided table and optional query, restricted to the rows whose watermark column
+            is above the low watermark and up to the high watermark. A missing bound leaves that side of the window open.
+        """
+
+        _read_query: str = self.prepare_read_query(p_schema, p_table, p_query).strip().rstrip(";")
+        _watermark_column: str = self.db_instance.quote_identifier(p_watermark_column)
+
+        _window_predicates: List[str] = []
+
+        for _operator, _watermark in ((">", p_low_watermark), ("<=", p_high_watermark)):
+
+            if _watermark is not None:
+                _watermark_literal: str = _watermark.replace("'", "''")
+                _window_predicates.append(f"{_watermark_column} {_operator} '{_watermark_literal}'")
+
+        if not _window_predicates:
+            return self.prepare_read_query(p_schema, p_table, p_query)
+
+        return f"SELECT * FROM ({_read_query}) AS window_query WHERE {' AND '.join(_window_predicates)};"
+
+
+    def get_max_watermark(self, p_dbname: str, p_schema: Optional[str], p_table: str, p_query: Optional[str], p_watermark_column: str) -> Optional[str]:
+
+        """
+        Returns the maximum value of the watermark column of the provided table and optional query, as a string,
+            or None if there are no rows. Read from the primary, since replicas may not have caught up yet.
+        """
+
+        _read_query: str = self.prepare_read_query(p_schema, p_table, p_query).strip().rstrip(";")
+
+        watermark_df: pd.DataFrame = DfUtil.read_sql(
+            p_query = f"SELECT MAX({self.db_instance.quote_identifier(p_watermark_column)}) AS watermark FROM ({_read_query}) AS watermark_query;",
+            p_engine = self.make_connection(p_dbname).engine
+        )
+
+        if watermark_df.empty or pd.isna(watermark_df.iloc[0, 0]):
+            return None
+
+        return str(watermark_df.iloc[0, 0])
+
+
+    def get_columns(self, p_dbname: str, p_schema: Optional[str], p_table: str, p_query: Optional[str]) -> List[str]:
+
+        """
+        Returns the column names of the provided table and optional query, without reading any row.
+        """
+
+        _read_query: str = self.prepare_read_query(p_schema, p_table, p_query).strip().rstrip(";")
+
+        return DfUtil.read_sql(
+            p_query = f"SELECT * FROM ({_read_query}) AS column_query WHERE 1 = 0;",
+            p_engine = self.make_connection(p_dbname, p_read_only = True).engine
+        ).columns.to_list()
+    
+
+    def get_column_types(self, p_dbname: str, p_schema: Optional[str], p_table: str, p_query: Optional[str]) -> Dict[str, Optional[TypeEngine]]:
+
+        """
+        Returns the SQL types of the columns of the provided table, reflected from the database catalog.
+            Custom queries aren't reflected, their types come from the result description of a zero-row run of the query,
+            None standing for the types the database driver doesn't describe.
+        """
+
+        _engine: Engine = self.make_connection(p_dbname, p_read_only = True).engine
+
+        if p_query:
+
+            _read_query: str = self.prepare_read_query(p_schema, p_table, p_query).strip().rstrip(";")
+
+            with GovernorUtil.slot(_engine), _engine.connect() as connection:
+
+                _cursor_description: tuple = connection.execute(text(f"SELECT * FROM ({_read_query}) AS column_query WHERE 1 = 0;")).cursor.description
+
+            return {_column[0]: self.db_instance.result_column_type(_column[1]) for _column in _cursor_description}
+
+        with GovernorUtil.slot(_engine):
+
+            return {_column["name"]: _column["type"] for _column in inspect(_engine).get_columns(p_table, schema = p_schema)}
+
+
+    def prepare_row_hash_query(self, p_schema: Optional[str], p_table: str, p_query: Optional[str], p_key_columns: List[str], p_hash_columns: Dict[str, Optional[TypeEngine]], p_bucket_filter: Optional[str] = None) -> Optional[str]:
+
+        """
+        Prepares a SQL query reading the key columns of the provided table and optional query, along with a `row_hash` column
+            hashing the other columns in the given order, computed by the database so that only keys and hashes are transferred.
+            A bucket filter from `prepare_bucket_filter` restricts the rows read. Returns None if the database can't hash rows.
+        """
+
+        _row_hash: Optional[str] = self.db_instance.row_hash_expression(p_hash_columns)
+
+        if _row_hash is None:
+            return None
+
+        _read_query: str = self.prepare_read_query(p_schema, p_table, p_query).strip().rstrip(";")
+        _key_columns: str = ", ".join(map(self.db_instance.quote_identifier, p_key_columns))
+
+        _bucket_predicate: str = f" WHERE {p_bucket_filter}" if p_bucket_filter else ""
+
+        return f"SELECT {_key_columns}, {_row_hash} AS row_hash FROM ({_read_query}) AS row_hash_query{_bucket_predicate};"
+
+
+    def prepare_bucket_filter(self, p_key_columns: Dict[str, Optional[TypeEngine]], p_buckets: List[str]) -> Optional[str]:
+
+        """
+        Prepares a SQL predicate restricting rows to the given buckets, a bucket being a prefix of the hash of the key columns,
+            all buckets having the same length. Returns None if the database can't hash rows.
+        """
+
+        _key_hash: Optional[str] = self.db_instance.row_hash_expression(p_key_columns)
+
+        if _key_hash is None:
+            return None
+
+        if not p_buckets:
+            return "1 = 0"
+
+        _bucket_literals: str = ", ".join(f"'{_bucket}'" for _bucket in p_buckets)
+
+        return f"LEFT({_key_hash}, {len(p_buckets[0])}) IN ({_bucket_literals})"
+
+
+    def prepare_checksum_query(self, p_schema: Optional[str], p_table: str, p_query: Optional[str], p_key_columns: Dict[str, Optional[TypeEngine]], p_row_columns: Dict[str, Optional[TypeEngine]], p_digits: int, p_bucket_filter: Optional[str] = None) -> Optional[str]:
+
+        """
+        Prepares a SQL query aggregating the rows of the provided table and optional query into buckets of the leading digits
+            of the hash of the key columns, returning the `row_count` and an order-independent `checksum` of the row hashes
+            of each `bucket`. A bucket filter from `prepare_bucket_filter` restricts the rows aggregated.
+            Returns None if the database can't checksum rows.
+        """
+
+        _key_hash: Optional[str] = self.db_instance.row_hash_expression(p_key_columns)
+        _row_hash: Optional[str] = self.db_instance.row_hash_expression(p_row_columns)
+        _hash_sum: Optional[str] = self.db_instance.hash_sum_expression("row_hash")
+
+        if _key_hash is None or _row_hash is None or _hash_sum is None:
+            return None
+
+        _read_query: str = self.prepare_read_query(p_schema, p_table, p_query).strip().rstrip(";")
+        _bucket_predicate: str = f" WHERE {p_bucket_filter}" if p_bucket_filter else ""
+
+        return (
+            f"SELECT LEFT(key_hash, {p_digits}) AS bucket, COUNT(*) AS row_count, {_hash_sum} AS checksum "
+            f"FROM (SELECT {_key_hash} AS key_hash, {_row_hash} AS row_hash FROM ({_read_query}) AS checksum_read{_bucket_predicate}) AS checksum_query "
+            f"GROUP BY LEFT(key_hash, {p_digits});"
+        )
+
+
+    @staticmethod
+    def __to_sql_literal(p_value: Any) -> str:
+
+        """Renders a key value as a SQL literal, numbers as they are and anything else as a quoted string."""
+
+        if isinstance(p_value, (int, float, Decimal, np.number)) and not isinstance(p_value, (bool, np.bool_)):
+            return str(p_value)
+
+        return "'" + str(p_value).replace("'", "''") + "'"
+
+
+    def prepare_key_filter_query(self, p_schema: Optional[str], p_table: str, p_query: Optional[str], p_columns: Optional[List[str]], p_key_columns: List[str], p_keys: List[tuple]) -> str:
+
+        """
+        Prepares a SQL read query of the provided table and optional query, restricted to the rows of the given keys,
+            each key being a tuple of values of the key columns.
+        """
+
+        _read_query: str = self.prepare_read_query(p_schema, p_table, p_query, p_columns).strip().rstrip(";")
+
+        _key_predicates: List[str] = [
+            "(" + " AND ".join(
+                f"{self.db_instance.quote_identifier(_column)} IS NULL"
+                    if pd.isna(_value)
+                        else f"{self.db_instance.quote_identifier(_column)} = {FDatabase.__to_sql_literal(_value)}"
+                for _column, _value in zip(p_key_columns, _key)
+            ) + ")"
+            for _key in p_keys
+        ]
+
+        return f"SELECT * FROM ({_read_query}) AS key_query WHERE {' OR '.join(_key_predicates) or '1 = 0'};"
+
+
+    def prepare_count_query(self, p_schema: Optional[str], p_table: str, p_query: Optional[str]) -> str:
+
+        """
+        Prepares a SQL query counting the rows returned by the read query of the provided table and optional query.
+        """
+
+        _read_query: str = self.prepare_read_query(p_schema, p_table, p_query).strip().rstrip(";")
+
+        return f"SELECT COUNT(*) FROM ({_read_query}) AS count_query;"
+    
+
+    def get_fingerprint(self, p_dbname: str, p_schema: Optional[str], p_table: str, p_query: Optional[str], p_watermark_column: Optional[str] = None) -> Optional[str]:
+
+        """
+        Returns a cheap fingerprint of the data read from the provided table and optional query, changing whenever the data changes.
+            With a watermark column, the fingerprint is the maximum watermark and the row count of the read query,
+            otherwise it comes from the table statistics of the database, if reliable, which don't cover custom queries.
+            Read from the primary, since replicas don't keep table statistics of replayed changes.
+            Returns None when no reliable fingerprint is available.
+        """
+
+        if p_watermark_column:
+
+            _read_query: str = self.prepare_read_query(p_schema, p_table, p_query).strip().rstrip(";")
+
+            fingerprint_query: str = f"SELECT MAX({self.db_instance.quote_identifier(p_watermark_column)}) AS watermark, COUNT(*) AS row_count FROM ({_read_query}) AS fingerprint_query;"
+
+        elif p_query:
+            return None
+
+        else:
+            fingerprint_query: Optional[str] = self.db_instance.fingerprint_query(p_dbname, p_schema, p_table)
+
+            if fingerprint_query is None:
+                return None
+
+        fingerprint_df: pd.DataFrame = DfUtil.read_sql(p_query = fingerprint_query, p_engine = self.make_connection(p_dbname).engine)
+
+        if fingerprint_df.empty or fingerprint_df.isna().to_numpy().any():
+            return None
+
+        return json.dumps(fingerprint_df.iloc[0].tolist(), default = str)
+    
+
+    def count_rows(self, p_dbname: str, p_schema: Optional[str], p_table: str, p_query: Optional[str]) -> int:
+
+        """
+        Counts the rows of the provided table and optional query on the pooled engine.
+        """
+
+        return int(DfUtil.read_sql(
+            p_query = self.prepare_count_query(p_schema, p_table, p_query),
+            p_engine = self.make_connection(p_dbname, p_read_only = True).engine
+        ).iloc[0, 0])
+    
+
+    async def count_rows_async(self, p_dbname: str, p_schema: Optional[str], p_table: str, p_query: Optional[str]) -> int:
+
+        """
+        Counts the rows of the provided table and optional query on a short-lived asyncio engine.
+            Databases without an asyncio driver are counted on the pooled engine in the loop's default thread pool.
+        """
+
+        if self.db_instance.async_connection_string(p_dbname) is None:
+
+            return await asyncio.to_thread(self.count_rows, p_dbname, p_schema, p_table, p_query)
+
+        async_engine: "AsyncEngine" = self.make_async_engine(p_dbname, p_read_only = True)
+
+        try:
+            return await DfUtil.read_scalar_async(
+                p_query = self.prepare_count_query(p_schema, p_table, p_query),
+                p_engine = async_engine
+            )
+        
+        finally:
+            await async_engine.dispose()
     
 
     def execute_query(self, p_dbname: str, p_query: str) -> None:
@@ -102,4 +591,8 @@ class FDatabase:
 
                 session.rollback()
 
-                raise
\ No newline at end of file
+                raise
+
+
+# Close pooled connections cleanly at exit
+atexit.register(FDatabase.dispose_engines)
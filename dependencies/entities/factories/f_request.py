@@ -2,7 +2,10 @@
 # Packages                                          #
 #####################################################
 
-from typing import Dict, Final
+import copy
+import time
+import threading
+from typing import Dict, Final, Optional, Tuple
 from dependencies.entities.interfaces.i_request import IRequestAuth
 from dependencies.entities.models.process_enum import ApiAuthKeyEnum
 from dependencies.entities.classes.requests.basic_auth import BasicAuth
@@ -22,6 +25,13 @@ class FApiAuth:
         ApiAuthKeyEnum.DEX_TC: BearerTokenAuth
     }
 
+    # Auth configs (including tokens) are reused across tasks and jobs of a process until their token expires,
+    # tokens without a known lifetime are renewed after a default lifetime, and early by a safety margin
+    __AUTH_CONFIG_DEFAULT_TTL_SECONDS: Final[int] = 15 * 60
+    __AUTH_CONFIG_EXPIRY_MARGIN_SECONDS: Final[int] = 60
+    __AUTH_CONFIG_CACHE: Dict[ApiAuthKeyEnum, Tuple[Optional[float], dict]] = {}
+    __AUTH_CONFIG_LOCK: Final[threading.Lock] = threading.Lock()
+
     @classmethod
     def get_auth_instance(cls, p_auth_key: ApiAuthKeyEnum) -> IRequestAuth:
         
@@ -30,4 +40,44 @@ class FApiAuth:
 
         auth_instance: IRequestAuth = cls.__AUTH_INSTANCE[p_auth_key]
 
-        return auth_instance
\ No newline at end of file
+        return auth_instance
+    
+
+    @classmethod
+    def get_auth_config(cls, p_auth_key: ApiAuthKeyEnum) -> dict:
+
+        """
+        Returns a copy of the request auth config for the given auth key, requesting a new one only once the cached one expired.
+            Configs without a token, such as basic auth, never expire.
+        """
+
+        with cls.__AUTH_CONFIG_LOCK:
+
+            expires_at, auth_config = cls.__AUTH_CONFIG_CACHE.get(p_auth_key, (None, None))
+
+            if auth_config is None or (expires_at is not None and time.monotonic() >= expires_at):
+
+                auth_config = cls.get_auth_instance(p_auth_key).get_config(auth_key = p_auth_key)
+
+                if "expires_in" in auth_config:
+
+                    expires_in: int = auth_config.pop("expires_in") or cls.__AUTH_CONFIG_DEFAULT_TTL_SECONDS
+                    expires_at = time.monotonic() + max(expires_in - cls.__AUTH_CONFIG_EXPIRY_MARGIN_SECONDS, 0)
+
+                else:
+                    expires_at = None
+
+                cls.__AUTH_CONFIG_CACHE[p_auth_key] = (expires_at, auth_config)
+
+            return copy.deepcopy(auth_config)
+
+
+    @classmethod
+    def invalidate_auth_config(cls, p_auth_key: ApiAuthKeyEnum) -> None:
+
+        """
+        Drops the cached request auth config of the given auth key, to be called when a request using it failed to authenticate.
+        """
+
+        with cls.__AUTH_CONFIG_LOCK:
+            cls.__AUTH_CONFIG_CACHE.pop(p_auth_key, None)
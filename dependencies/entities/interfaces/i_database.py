@@ -2,9 +2,10 @@
 # Packages                                          #
 #####################################################
 
-from typing import Optional, Union
 from abc import ABC, abstractmethod
+from sqlalchemy.types import TypeEngine
 from sqlalchemy.engine.base import Engine
+from typing import Any, Dict, Final, List, Optional, Union
 
 
 #####################################################
@@ -12,6 +13,10 @@ from sqlalchemy.engine.base import Engine
 #####################################################
 
 class IDatabase(ABC):
+
+    # Decimal places floats are rounded to before row hashing, alike on every database,
+    # as their binary values render differently once converted to decimals
+    FLOAT_HASH_SCALE: Final[int] = 6
     
     @abstractmethod
     def __init__(self, p_username: str, p_password: str, p_hostname: str, p_port: Optional[int]) -> None: ...
@@ -20,10 +25,31 @@ class IDatabase(ABC):
     def connection_string(self, p_dbname: str) -> str: ...
 
     @abstractmethod
-    def create_engine(self, p_connection_string: str) -> Engine: ...
+    def create_engine(self, p_connection_string: str, **kwargs) -> Engine: ...
+
+    @abstractmethod
+    def async_connection_string(self, p_dbname: str) -> Optional[str]: ...
 
     @abstractmethod
     def table_identifier(self, p_schema: Union[str, Optional[str]], p_table: str) -> str: ...
 
     @abstractmethod
-    def select_query(self, p_table_identifier: str) -> str: ...
\ No newline at end of file
+    def quote_identifier(self, p_identifier: str) -> str: ...
+
+    @abstractmethod
+    def select_query(self, p_table_identifier: str, p_columns: Optional[List[str]] = None) -> str: ...
+
+    @abstractmethod
+    def replica_lag_query(self) -> Optional[str]: ...
+
+    @abstractmethod
+    def fingerprint_query(self, p_dbname: str, p_schema: Optional[str], p_table: str) -> Optional[str]: ...
+
+    @abstractmethod
+    def row_hash_expression(self, p_columns: Dict[str, Optional[TypeEngine]]) -> Optional[str]: ...
+
+    @abstractmethod
+    def hash_sum_expression(self, p_hash_expression: str) -> Optional[str]: ...
+
+    @abstractmethod
+    def result_column_type(self, p_type_code: Any) -> Optional[TypeEngine]: ...
\ No newline at end of file
@@ -2,6 +2,7 @@
 # Packages                                          #
 #####################################################
 
+import asyncio
 from abc import ABC, abstractmethod
 
 
@@ -10,9 +11,27 @@ from abc import ABC, abstractmethod
 #####################################################
 
 class IDiagnose(ABC):
+
+    # Whether the rule is dominated by in-memory DataFrame work, such rules may be evaluated in a worker process
+    CPU_BOUND: bool = False
     
     @classmethod
     @abstractmethod
     def evaluate(
         cls, p_task_name: str, p_src_config: dict, p_tgt_config: dict, p_rule_parameter: dict
-    ) -> dict: ...
\ No newline at end of file
+    ) -> dict: ...
+
+    @classmethod
+    async def evaluate_async(
+        cls, p_task_name: str, p_src_config: dict, p_tgt_config: dict, p_task_parameter: dict
+    ) -> dict:
+        
+        """Evaluates the rule on the running event loop, by default its blocking `evaluate` runs in a thread."""
+
+        return await asyncio.to_thread(
+            cls.evaluate,
+            p_task_name = p_task_name,
+            p_src_config = p_src_config,
+            p_tgt_config = p_tgt_config,
+            p_task_parameter = p_task_parameter
+        )
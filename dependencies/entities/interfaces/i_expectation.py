@@ -2,6 +2,7 @@
 # Packages                                          #
 #####################################################
 
+import threading
 from typing import Any
 import great_expectations as gx
 from abc import ABC, abstractmethod
@@ -30,8 +31,19 @@ class IExpectation(ABC):
         store_backend_defaults = InMemoryStoreBackendDefaults()
     )
 
-    # Initialize the context
-    context: EphemeralDataContext = gx.get_context(project_config = config)
+    # Contexts are not thread-safe, hence one context is kept per thread
+    __thread_local = threading.local()
+
+
+    @property
+    def context(self) -> EphemeralDataContext:
+
+        """Returns the ephemeral data context bound to the current thread, creating it on first use."""
+
+        if not hasattr(IExpectation.__thread_local, "context"):
+            IExpectation.__thread_local.context = gx.get_context(project_config = IExpectation.config)
+
+        return IExpectation.__thread_local.context
 
 
     @abstractmethod
@@ -9,9 +9,9 @@ from typing import Dict, List, Optional, Tuple
 from dependencies.entities.models.config_prm_model import *
 from dependencies.entities.models.standard_schema import StandardModel
 from dependencies.functions.core.config_validator import ConfigValidator
-from dependencies.entities.models.process_enum import TaskRuleEnum, ConfigTypeEnum
+from dependencies.entities.models.process_enum import TaskRuleEnum, ConfigTypeEnum, RestartModeEnum
 from pydantic import model_validator, AfterValidator, BeforeValidator, Field, StrictInt, StrictBool
-from dependencies.entities.models.config_sub_model import SourceApiTaskConfigModel, SourceTableTaskConfigModel, TargetTableActiveTaskConfigModel, TargetTableInActiveTaskConfigModel
+from dependencies.entities.models.config_sub_model import IncrementalTaskConfigModel, SourceApiTaskConfigModel, SourceTableTaskConfigModel, TargetTableActiveTaskConfigModel, TargetTableInActiveTaskConfigModel
 
 
 #####################################################
@@ -22,11 +22,16 @@ class JobConfigModel(StandardModel):
 
     job_id: StrictInt = Field(ge = 0)
     job_name: str
+    job_group: Optional[str] = None
     email_to: Annotated[List[str], AfterValidator(ConfigValidator.validate_email)]
     email_cc: Annotated[Optional[List[str]], AfterValidator(ConfigValidator.validate_email)]
     alert_channel: str
     job_wait_minute: int = Field(ge = 0)
+    max_workers: Optional[int] = Field(default = None, ge = 1)
+    max_processes: Optional[int] = Field(default = None, ge = 1)
+    is_async: Optional[StrictBool] = False
     is_restart: StrictBool
+    restart_mode: Annotated[Optional[RestartModeEnum], BeforeValidator(ConfigValidator.to_uppercase)] = RestartModeEnum.TAIL
     is_active: StrictBool
     dw_created_ts: Annotated[datetime, AfterValidator(ConfigValidator.convert_utc_to_ist)]
     dw_updated_ts: Annotated[Optional[datetime], AfterValidator(ConfigValidator.convert_utc_to_ist)]
@@ -44,7 +49,10 @@ class TaskConfigModel(StandardModel):
     src_config: dict
     tgt_config: dict
     task_parameter: Optional[dict]
+    depends_on: Optional[List[StrictInt]] = None
     fail_fast: StrictBool
+    is_cacheable: Optional[StrictBool] = False
+    incremental: Optional[dict] = None
     is_active: StrictBool
     dw_created_ts: Annotated[datetime, AfterValidator(ConfigValidator.convert_utc_to_ist)]
     dw_updated_ts: Annotated[Optional[datetime], AfterValidator(ConfigValidator.convert_utc_to_ist)]
@@ -53,6 +61,16 @@ class TaskConfigModel(StandardModel):
     @model_validator(mode = "after")
     def validate_model(self: Self):
 
+        # Validate task dependencies, cross task checks are done while reading the job's tasks
+        if self.depends_on:
+
+            if self.task_id in self.depends_on:
+                raise ValueError(f"Task ID '{self.task_id}' can't depend on itself.")
+
+            if len(set(self.depends_on)) != len(self.depends_on):
+                raise ValueError(f"Duplicate Task IDs found in 'depends_on': {self.depends_on}.")
+            
+
         if self.config_type == ConfigTypeEnum.API:
             
             _src_config = SourceApiTaskConfigModel(**self.src_config).model_dump()
@@ -100,9 +118,38 @@ class TaskConfigModel(StandardModel):
         
         _task_parameter: dict = _task_parameter_model(**self.task_parameter).model_dump()
 
+
+        # Validate incremental validation settings
+        _incremental: Optional[dict] = None
+
+        incremental_task_rules: List[TaskRuleEnum] = [
+            TaskRuleEnum.CHECK_NULLS, TaskRuleEnum.CHECK_DUPLICATE, TaskRuleEnum.CHECK_THRESHOLD, TaskRuleEnum.MATCH_ROW
+        ]
+
+        if self.incremental is not None:
+
+            if self.config_type != ConfigTypeEnum.TBL or self.task_rule not in incremental_task_rules:
+                raise ValueError(
+                    f"Incremental validation is not supported for config_type '{self.config_type}' and task_rule '{self.task_rule}', "
+                    f"supported task rules: {', '.join(map(str, incremental_task_rules))}."
+                )
+
+            if not _src_config.get("src_watermark_column"):
+                raise ValueError("Incremental validation requires 'src_watermark_column' in 'src_config'.")
+
+            if self.task_rule.value.startswith("MATCH_") and not _tgt_config.get("tgt_watermark_column"):
+                raise ValueError("Incremental validation requires 'tgt_watermark_column' in 'tgt_config'.")
+
+            # The cache key fingerprints the whole tables, so a cache hit would replay the results of another window
+            if self.is_cacheable:
+                raise ValueError("Incremental validation can't be combined with 'is_cacheable'.")
+
+            _incremental = IncrementalTaskConfigModel(**self.incremental).model_dump()
+
         # Forces the setting of an attribute, and set values to it.
         self._force_set_attribute("src_config", _src_config)
         self._force_set_attribute("tgt_config", _tgt_config)
         self._force_set_attribute("task_parameter", _task_parameter)
+        self._force_set_attribute("incremental", _incremental)
 
         return self
\ No newline at end of file
@@ -2,9 +2,10 @@
 # Packages                                          #
 #####################################################
 
-from typing import Any, List, Literal
 from typing_extensions import Annotated, Self
+from typing import Any, List, Literal, Optional
 from pydantic import model_validator, StrictBool, BeforeValidator
+from dependencies.entities.models.process_enum import CompareModeEnum
 from dependencies.entities.models.standard_schema import StandardModel
 from dependencies.functions.core.config_validator import ConfigValidator
 
@@ -63,6 +64,20 @@ class MatchAggregateTblParamModel(StandardModel):
 class MatchRowTblParamModel(StandardModel):
 
     join_columns: List[str]
+    ignore_columns: Optional[List[str]] = None
+    partitions: Optional[int] = None
+    compare_mode: Annotated[CompareModeEnum, BeforeValidator(ConfigValidator.to_uppercase)] = CompareModeEnum.ROW
+
+    @model_validator(mode = "after")
+    def validate_model(self: Self):
+
+        if self.ignore_columns and set(self.ignore_columns) & set(self.join_columns):
+            raise ValueError("'ignore_columns' can't contain any of the 'join_columns'.")
+
+        if self.partitions is not None and self.partitions < 1:
+            raise ValueError("'partitions' must be a positive number of buckets.")
+        
+        return self
 
 
 class CheckThresholdTblParamModel(StandardModel):
@@ -5,10 +5,10 @@
 from typing_extensions import Self
 from typing import Literal, Optional
 from typing_extensions import Annotated
-from pydantic import model_validator, BeforeValidator
-from dependencies.entities.models.process_enum import ApiAuthKeyEnum, ApiAuthTypeEnum
 from dependencies.entities.models.standard_schema import StandardModel
+from pydantic import model_validator, BeforeValidator, Field, StrictInt
 from dependencies.functions.core.config_validator import ConfigValidator
+from dependencies.entities.models.process_enum import ApiAuthKeyEnum, ApiAuthTypeEnum, ReadModeEnum
 
 
 #####################################################
@@ -28,13 +28,15 @@ class SourceTableTaskConfigModel(StandardModel):
     """Configuration model for source table tasks."""
 
     src_dbtype: Annotated[
-        Literal["MYSQL", "POSTGRE"],
+        Literal["MYSQL", "POSTGRE", "SQLITE", "DUCKDB"],
         BeforeValidator(ConfigValidator.to_uppercase)
     ]
     src_dbname: str
     src_schema: Optional[str]
     src_table: str
     src_query: Optional[str]
+    src_watermark_column: Optional[str] = None
+    src_read_mode: Annotated[Optional[ReadModeEnum], BeforeValidator(ConfigValidator.to_uppercase)] = None
 
 
     @model_validator(mode = "after")
@@ -53,13 +55,15 @@ class TargetTableActiveTaskConfigModel(StandardModel):
     """Configuration model for active target table tasks."""
 
     tgt_dbtype: Annotated[
-        Literal["MYSQL", "POSTGRE"],
+        Literal["MYSQL", "POSTGRE", "SQLITE", "DUCKDB"],
         BeforeValidator(ConfigValidator.to_uppercase)
     ]
     tgt_dbname: str
     tgt_schema: Optional[str]
     tgt_table: str
     tgt_query: Optional[str]
+    tgt_watermark_column: Optional[str] = None
+    tgt_read_mode: Annotated[Optional[ReadModeEnum], BeforeValidator(ConfigValidator.to_uppercase)] = None
 
 
     @model_validator(mode = "after")
@@ -81,4 +85,15 @@ class TargetTableInActiveTaskConfigModel(StandardModel):
     tgt_dbname: Literal[None]
     tgt_schema: Literal[None]
     tgt_table : Literal[None]
-    tgt_query : Literal[None]
\ No newline at end of file
+    tgt_query : Literal[None]
+
+
+class IncrementalTaskConfigModel(StandardModel):
+
+    """
+    Configuration model for incremental task validation, over the rows changed since the last successful run,
+        as tracked by the source and target watermark columns. The lookback re-validates that much before the last watermark,
+        in minutes for temporal watermark columns and in watermark units for numeric ones.
+    """
+
+    lookback: StrictInt = Field(default = 0, ge = 0)
@@ -53,4 +53,8 @@ class TaskLogModel(StandardModel):
     config_passed: dict
     start_time: Annotated[datetime, AfterValidator(ConfigValidator.convert_utc_to_ist)]
     end_time: Annotated[datetime, AfterValidator(ConfigValidator.convert_utc_to_ist)]
+    origin_batch_id: Optional[str] = None
+    config_hash: Optional[str] = None
+    data_fingerprint: Optional[str] = None
+    is_cached: Optional[StrictBool] = None
     time_taken: timedelta
\ No newline at end of file
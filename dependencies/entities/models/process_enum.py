@@ -65,3 +65,42 @@ class TaskStatusEnum(StandardEnum):
     FAILURE: str = "FAILURE"
     WARNING: str = "WARNING"
     SKIPPED: str = "SKIPPED"
+
+
+@unique
+class RestartModeEnum(StandardEnum):
+
+    TAIL: str = "TAIL"
+    INCREMENTAL: str = "INCREMENTAL"
+
+
+@unique
+class ReadModeEnum(StandardEnum):
+
+    CURSOR: str = "CURSOR"
+    ARROW: str = "ARROW"
+    COPY: str = "COPY"
+
+
+@unique
+class CompareModeEnum(StandardEnum):
+
+    ROW: str = "ROW"
+    HASH: str = "HASH"
+    CHECKSUM: str = "CHECKSUM"
+
+
+@unique
+class QueueStatusEnum(StandardEnum):
+
+    PENDING: str = "PENDING"
+    CLAIMED: str = "CLAIMED"
+    COMPLETED: str = "COMPLETED"
+    FAILED: str = "FAILED"
+
+
+@unique
+class QueuePolicyEnum(StandardEnum):
+
+    FIFO: str = "FIFO"
+    REJECT: str = "REJECT"
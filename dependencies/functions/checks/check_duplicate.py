@@ -4,12 +4,14 @@
 
 import logging
 import pandas as pd
-from typing import List, Optional
+from collections import namedtuple
 import great_expectations.expectations as gxe
 from dependencies.utilities.df_util import DfUtil
+from typing import Final, Iterator, List, Optional, Tuple
 from dependencies.entities.factories.f_database import FDatabase
 from dependencies.entities.interfaces.i_database import IDatabase
 from dependencies.entities.interfaces.i_diagnose import IDiagnose
+from dependencies.entities.models.process_enum import ReadModeEnum
 from dependencies.entities.classes.expectations.df_expectation import DfExpectation
 from great_expectations.core.expectation_validation_result import ExpectationSuiteValidationResult
 
@@ -22,21 +24,63 @@ logger = logging.getLogger(__name__)
 
 
 class CheckDuplicate(IDiagnose):
-        
+
+    CPU_BOUND: bool = True
+
+
+    # Two differently keyed 64-bit row hashes, making collisions negligible even for billions of rows
+    __HASH_KEYS: Final[Tuple[str, str]] = ("0123456789123456", "6543219876543210")
+
 
     @classmethod
-    def __prepare_df(cls, p_dbtype: str, p_dbname: str, p_schema: Optional[str], p_table: str, p_query: Optional[str]) -> pd.DataFrame:
+    def __prepare_df_chunks(cls, p_dbtype: str, p_dbname: str, p_schema: Optional[str], p_table: str, p_query: Optional[str], p_columns: Optional[List[str]] = None, p_read_mode: Optional[ReadModeEnum] = None) -> Iterator[pd.DataFrame]:
 
-        """Prepares a dataframe by querying a database table."""
+        """
+        Prepares dataframe chunks by streaming a database table.
+            Values are kept as returned by the database driver, so that a column hashes the same way in every chunk.
+            Only the provided columns are fetched, if any.
+        """
 
         f_database: IDatabase = FDatabase(p_dbtype)
 
-        return DfUtil.read_sql(
-            p_query = f_database.prepare_read_query(p_schema, p_table, p_query),
-            p_engine = f_database.make_connection(p_dbname).engine
+        return DfUtil.read_sql_chunks(
+            p_query = f_database.prepare_read_query(p_schema, p_table, p_query, p_columns),
+            p_engine = f_database.make_connection(p_dbname, p_read_only = True).engine,
+            p_dtype = object,
+            p_read_mode = p_read_mode,
+            p_use_snapshot = True
         )
 
 
+    @classmethod
+    def __find_duplicate_hashes(cls, p_df_chunks: Iterator[pd.DataFrame], p_subset: Optional[List[str]]) -> namedtuple:
+
+        """
+        Hashes the rows of every chunk on the subset columns and returns the hashes of the duplicate rows (beyond their first occurrence)
+            along with the observed row count, keeping only 16 bytes per row in memory instead of the rows themselves.
+        """
+
+        row_hash_chunks: List[pd.DataFrame] = []
+
+        for df_chunk in p_df_chunks:
+
+            subset_df: pd.DataFrame = df_chunk[p_subset or df_chunk.columns]
+
+            row_hash_chunks.append(pd.DataFrame({
+                f"row_hash_{index}": pd.util.hash_pandas_object(subset_df, index = False, hash_key = hash_key).to_numpy()
+                for index, hash_key in enumerate(cls.__HASH_KEYS)
+            }))
+
+        row_hash_df: pd.DataFrame = (
+            pd.concat(row_hash_chunks, ignore_index = True) if row_hash_chunks
+                else pd.DataFrame(columns = [f"row_hash_{index}" for index in range(len(cls.__HASH_KEYS))])
+        )
+
+        DuplicateHashInfo = namedtuple("DuplicateHashInfo", ["df", "observed_count"])
+
+        return DuplicateHashInfo(df = DfUtil.find_duplicate_records(p_df = row_hash_df).df, observed_count = row_hash_df.shape[0])
+
+
     @classmethod
     def evaluate(cls, p_task_name: str, p_src_config: dict, p_tgt_config: dict, p_task_parameter: dict) -> dict:
 
@@ -47,14 +91,17 @@ class CheckDuplicate(IDiagnose):
         inp_schema : Optional[str] = p_src_config["src_schema"]
         inp_table  : str           = p_src_config["src_table"]
         inp_query  : Optional[str] = p_src_config["src_query"]
+        inp_read_mode: ReadModeEnum = DfUtil.resolve_read_mode(p_src_config.get("src_read_mode"))
         inp_columns: Optional[List[str]] = p_task_parameter.get("columns") if p_task_parameter else None
 
-        # Load source and target data
-        src_df: pd.DataFrame = cls.__prepare_df(inp_dbtype, inp_dbname, inp_schema, inp_table, inp_query)
+        # Stream source data and identify duplicates chunk by chunk
+        duplicate_info: namedtuple = cls.__find_duplicate_hashes(
+            p_df_chunks = cls.__prepare_df_chunks(inp_dbtype, inp_dbname, inp_schema, inp_table, inp_query, inp_columns, inp_read_mode),
+            p_subset = inp_columns
+        )
 
-        # Identify duplicates
-        duplicate_df: pd.DataFrame = DfUtil.find_duplicate_records(p_df = src_df, p_subset = inp_columns or src_df.columns).df
-        logger.debug(f"Duplicate dataframe:\n{duplicate_df}")
+        duplicate_df: pd.DataFrame = duplicate_info.df
+        logger.debug(f"Duplicate row hashes dataframe:\n{duplicate_df}")
 
 
         # Initiate validation
@@ -80,7 +127,7 @@ class CheckDuplicate(IDiagnose):
                 {
                     "success": _result["success"],
                     "result": {
-                        "observed_count": src_df.shape[0],
+                        "observed_count": duplicate_info.observed_count,
                         "duplicate_count": _result["result"]["observed_value"]
                     }
                 } for _result in validation_result_object["results"]
@@ -5,7 +5,7 @@
 import logging
 import numpy as np
 import pandas as pd
-from typing import List
+from typing import Dict, List, Optional
 from dependencies.utilities.df_util import DfUtil
 from dependencies.utilities.const_util import ConstUtil
 from dependencies.entities.models.config_core_model import JobConfigModel, TaskConfigModel
@@ -22,6 +22,27 @@ class ConfigReader:
 
     """A class to handle reading and validating job configurations from a database."""
 
+    @staticmethod
+    def get_job_ids(p_job_group: str) -> List[int]:
+
+        """Retrieves the job IDs belonging to a given job group, in job ID order."""
+
+        job_df: pd.DataFrame = DfUtil.read_sql(
+            p_engine = ConstUtil.PRCS_DB_ENGINE,
+            p_query = f"""
+                SELECT job_id FROM {ConstUtil.PRCS_DB_SCHEMA}.{ConstUtil.PRCS_JOB_CONFIG_TBL_NAME}
+                WHERE UPPER(TRIM(job_group)) = UPPER(TRIM('{p_job_group}'))
+                ORDER BY job_id
+                ;
+            """
+        )
+
+        if job_df.empty:
+            raise ValueError(f"Job group '{p_job_group}' not found in the configuration table.")
+        
+        return job_df["job_id"].to_list()
+    
+
     @staticmethod
     def get_job_config(p_job_id: int) -> JobConfigModel:
 
@@ -57,6 +78,57 @@ class ConfigReader:
         return job_config_model
     
 
+    @staticmethod
+    def __validate_task_dependencies(p_job_id: int, p_task_models: List[TaskConfigModel]) -> None:
+
+        """Validates that task dependencies refer to tasks of the same job and do not form a cycle."""
+
+        task_dependencies: Dict[int, List[int]] = {
+            task_model.task_id: task_model.depends_on or [] for task_model in p_task_models
+        }
+
+        for task_id, upstream_task_ids in task_dependencies.items():
+
+            unknown_task_ids: List[int] = [_task_id for _task_id in upstream_task_ids if _task_id not in task_dependencies]
+
+            if unknown_task_ids:
+                raise ValueError(f"Task ID '{task_id}' of Job ID '{p_job_id}' depends on unknown Task IDs: {unknown_task_ids}.")
+            
+
+        # Depth first search, a task met again while still on the path closes a cycle
+        visited_task_ids: set = set()
+
+        def _find_cycle(_task_id: int, _path: List[int]) -> Optional[List[int]]:
+
+            if _task_id in _path:
+                return _path[_path.index(_task_id):] + [_task_id]
+            
+            if _task_id in visited_task_ids:
+                return None
+            
+            visited_task_ids.add(_task_id)
+
+            for _upstream_task_id in task_dependencies[_task_id]:
+
+                _cycle: Optional[List[int]] = _find_cycle(_upstream_task_id, _path + [_task_id])
+
+                if _cycle:
+                    return _cycle
+                
+            return None
+        
+
+        for task_id in sorted(task_dependencies):
+
+            cycle_task_ids: Optional[List[int]] = _find_cycle(task_id, [])
+
+            if cycle_task_ids:
+                raise RuntimeError(
+                    f"Cyclic task dependency found for Job ID '{p_job_id}' in the configuration table: "
+                    f"{' -> '.join(map(str, cycle_task_ids))}."
+                )
+
+
     @staticmethod
     def get_task_configs(p_job_id: int) -> List[TaskConfigModel]:
 
@@ -66,7 +138,7 @@ class ConfigReader:
             p_engine = ConstUtil.PRCS_DB_ENGINE,
             p_query = f"""
                 SELECT
-                    job_id, task_id, task_name, task_rule, config_type, src_reference, tgt_reference, src_config, tgt_config, COALESCE(task_parameter, '{{}}'::JSON) AS task_parameter, fail_fast, is_active, dw_created_ts, dw_updated_ts
+                    job_id, task_id, task_name, task_rule, config_type, src_reference, tgt_reference, src_config, tgt_config, COALESCE(task_parameter, '{{}}'::JSON) AS task_parameter, depends_on, fail_fast, is_cacheable, incremental, is_active, dw_created_ts, dw_updated_ts
                 FROM {ConstUtil.PRCS_DB_SCHEMA}.{ConstUtil.PRCS_TASK_CONFIG_TBL_NAME}
                 WHERE job_id = {p_job_id}
                 ORDER BY job_id, task_id
@@ -103,6 +175,8 @@ class ConfigReader:
 
             task_models.append(task_model)
 
+        ConfigReader.__validate_task_dependencies(p_job_id, task_models)
+
         logger.info("***\n")
             
         return task_models
\ No newline at end of file
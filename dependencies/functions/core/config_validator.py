@@ -70,6 +70,10 @@ class ConfigValidator:
     def validate_schema(p_dbtype: str, p_schema: Optional[str]) -> None:
 
         _mandatory_schema_dbtypes: List[str] = ["POSTGRE"]
+        _optional_schema_dbtypes: List[str] = ["DUCKDB"]
+
+        if p_dbtype in _optional_schema_dbtypes:
+            return
 
         if (p_dbtype in _mandatory_schema_dbtypes and p_schema is None):
             raise ValueError(
@@ -0,0 +1,143 @@
+#####################################################
+# Packages                                          #
+#####################################################
+
+import json
+import hashlib
+import logging
+import pandas as pd
+from typing import List, Optional
+from collections import namedtuple
+from dependencies.utilities.df_util import DfUtil
+from dependencies.utilities.const_util import ConstUtil
+from dependencies.entities.factories.f_database import FDatabase
+from dependencies.entities.models.config_core_model import TaskConfigModel
+from dependencies.entities.models.process_enum import ConfigTypeEnum, TaskStatusEnum
+
+
+#####################################################
+# Main Class                                        #
+#####################################################
+
+logger = logging.getLogger(__name__)
+
+
+class HelperCache:
+
+    """
+    A class to answer tasks from previous task results, keyed by the task configuration hash and the data fingerprint
+        of the source and target tables. Cached results are read back from the task log table.
+    """
+
+    CacheKey = namedtuple("CacheKey", ["config_hash", "data_fingerprint"])
+    CachedResult = namedtuple("CachedResult", ["batch_id", "diagnose_results"])
+
+
+    @staticmethod
+    def __get_config_hash(p_task_config: TaskConfigModel) -> str:
+
+        """
+        Returns a hash of the task configuration fields affecting the task results.
+        """
+
+        task_config: dict = p_task_config.model_dump(include = {"config_type", "task_rule", "src_config", "tgt_config", "task_parameter"})
+
+        return hashlib.sha256(json.dumps(task_config, sort_keys = True, default = str).encode()).hexdigest()
+
+
+    @staticmethod
+    def __get_data_fingerprint(p_task_config: TaskConfigModel) -> Optional[str]:
+
+        """
+        Returns a hash of the fingerprints of the source and target tables of a task,
+            or None if any of them has no reliable fingerprint.
+        """
+
+        if p_task_config.config_type != ConfigTypeEnum.TBL:
+            return None
+
+        table_fingerprints: List[str] = []
+
+        for prefix, table_config in (("src", p_task_config.src_config), ("tgt", p_task_config.tgt_config)):
+
+            if table_config.get(f"{prefix}_dbtype") is None:
+                continue
+
+            table_fingerprint: Optional[str] = FDatabase(table_config[f"{prefix}_dbtype"]).get_fingerprint(
+                p_dbname = table_config[f"{prefix}_dbname"],
+                p_schema = table_config[f"{prefix}_schema"],
+                p_table  = table_config[f"{prefix}_table"],
+                p_query  = table_config[f"{prefix}_query"],
+                p_watermark_column = table_config.get(f"{prefix}_watermark_column")
+            )
+
+            if table_fingerprint is None:
+                return None
+
+            table_fingerprints.append(table_fingerprint)
+
+        return hashlib.sha256(json.dumps(table_fingerprints).encode()).hexdigest()
+
+
+    @staticmethod
+    def get_cache_key(p_task_config: TaskConfigModel) -> Optional[namedtuple]:
+
+        """
+        Returns the result cache key of a cacheable task, or None if the task is not cacheable or its data can't be fingerprinted.
+            The key must be taken before the task runs, so that data changing during the run invalidates the cached results.
+        """
+
+        if not p_task_config.is_cacheable:
+            return None
+
+        data_fingerprint: Optional[str] = HelperCache.__get_data_fingerprint(p_task_config)
+
+        if data_fingerprint is None:
+
+            logger.info("Task result cache bypassed, no reliable data fingerprint available.")
+
+            return None
+
+        return HelperCache.CacheKey(config_hash = HelperCache.__get_config_hash(p_task_config), data_fingerprint = data_fingerprint)
+
+
+    @staticmethod
+    def get_cached_result(p_cache_key: Optional[namedtuple]) -> Optional[namedtuple]:
+
+        """
+        Returns the most recent executed results logged for the cache key, along with the batch which computed them, if any.
+        """
+
+        if p_cache_key is None:
+            return None
+
+        cached_result_df: pd.DataFrame = DfUtil.read_sql(
+            p_query = f"""
+                SELECT
+                    COALESCE(origin_batch_id, batch_id) AS origin_batch_id, UPPER(TRIM(task_status)) AS task_status, task_results
+                FROM {ConstUtil.PRCS_DB_SCHEMA}.{ConstUtil.PRCS_TASK_LOG_TBL_NAME}
+                WHERE config_hash = '{p_cache_key.config_hash}'
+                  AND data_fingerprint = '{p_cache_key.data_fingerprint}'
+                  AND UPPER(TRIM(task_status)) IN ('{TaskStatusEnum.SUCCESS}', '{TaskStatusEnum.FAILURE}')
+                  AND task_results IS NOT NULL
+                ORDER BY start_time DESC
+                LIMIT 1
+                ;
+            """,
+            p_engine = ConstUtil.PRCS_DB_ENGINE
+        )
+
+        if cached_result_df.empty:
+            return None
+
+        origin_batch_id, task_status, task_results = cached_result_df.values[0]
+
+        logger.info(f"Task result cache hit, results reused from Task Batch ID '{origin_batch_id}'.")
+
+        return HelperCache.CachedResult(
+            batch_id = origin_batch_id,
+            diagnose_results = {
+                "success": task_status == TaskStatusEnum.SUCCESS,
+                "results": list(task_results)
+            }
+        )
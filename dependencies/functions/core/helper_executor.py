@@ -0,0 +1,396 @@
+#####################################################
+# Packages                                          #
+#####################################################
+
+import time
+import asyncio
+import logging
+import multiprocessing
+from typing import Dict, List, Optional, Set
+from dependencies.utilities.governor_util import GovernorUtil
+from dependencies.functions.core.helper_task import HelperTask
+from dependencies.entities.models.process_enum import TaskStatusEnum
+from dependencies.entities.models.config_core_model import TaskConfigModel
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+
+#####################################################
+# Main Class                                        #
+#####################################################
+
+logger = logging.getLogger(__name__)
+
+
+class HelperExecutor:
+
+    """
+    A class to dispatch the tasks of a job batch, either one after another, concurrently on a thread pool
+        or concurrently on an asyncio event loop, honouring the `depends_on` task dependencies.
+        Concurrent modes dispatch the ready tasks with the longest expected duration first.
+    """
+
+    @staticmethod
+    def __resolve_ready_tasks(p_job_batch_id: str, p_waiting_tasks: Dict[int, TaskConfigModel], p_task_statuses: Dict[int, TaskStatusEnum], p_task_ids: Set[int]) -> List[TaskConfigModel]:
+
+        """
+        Pops and returns the waiting tasks whose upstream tasks all succeeded, ordered by task ID.
+            Waiting tasks having an upstream task that did not succeed are logged as skipped,
+            which may in turn resolve their own downstream tasks, hence the resolution runs until stable.
+            Upstream tasks outside the executed tasks (e.g. below a restart task ID) are considered satisfied.
+        """
+
+        ready_tasks: List[TaskConfigModel] = []
+        resolved: bool = True
+
+        while resolved:
+
+            resolved = False
+
+            for task_id in sorted(p_waiting_tasks):
+
+                task_config: TaskConfigModel = p_waiting_tasks[task_id]
+
+                upstream_task_ids: List[int] = [
+                    _task_id for _task_id in (task_config.depends_on or []) if _task_id in p_task_ids
+                ]
+
+                # Upstream tasks are still waiting or running
+                if any(_task_id not in p_task_statuses for _task_id in upstream_task_ids):
+                    continue
+
+                del p_waiting_tasks[task_id]
+
+                if all(p_task_statuses[_task_id] == TaskStatusEnum.SUCCESS for _task_id in upstream_task_ids):
+                    ready_tasks.append(task_config)
+
+                else:
+                    logger.warning(f"Task id '{task_id}' skipped as its upstream task ids {upstream_task_ids} did not all succeed.")
+                    p_task_statuses[task_id] = HelperTask.skip(p_job_batch_id, task_config)
+                    resolved = True
+
+        return sorted(ready_tasks, key = lambda _task_config: _task_config.task_id)
+
+
+    @staticmethod
+    def __prioritize_tasks(p_ready_tasks: List[TaskConfigModel], p_expected_durations: Dict[int, float]) -> List[TaskConfigModel]:
+
+        """
+        Orders ready tasks by longest expected duration first, then by task ID.
+        """
+
+        return sorted(p_ready_tasks, key = lambda _task_config: (-p_expected_durations[_task_config.task_id], _task_config.task_id))
+
+
+    @staticmethod
+    def __log_duration(p_task_id: int, p_expected_duration: float, p_start_time: float) -> None:
+
+        """
+        Logs the expected against the actual duration of a task.
+        """
+
+        logger.info(f"Task id '{p_task_id}' duration: expected {p_expected_duration:.1f}s, actual {time.monotonic() - p_start_time:.1f}s")
+
+
+    @staticmethod
+    def __diagnose(p_job_batch_id: str, p_task_config: TaskConfigModel, p_process_pool: Optional[ProcessPoolExecutor], p_expected_duration: float) -> TaskStatusEnum:
+
+        """
+        Diagnoses a task and logs its expected against its actual duration.
+        """
+
+        start_time: float = time.monotonic()
+
+        try:
+            return HelperTask.diagnose(p_job_batch_id, p_task_config, p_process_pool)
+
+        finally:
+            HelperExecutor.__log_duration(p_task_config.task_id, p_expected_duration, start_time)
+
+
+    @staticmethod
+    async def __diagnose_async(p_job_batch_id: str, p_task_config: TaskConfigModel, p_process_pool: Optional[ProcessPoolExecutor], p_expected_duration: float) -> TaskStatusEnum:
+
+        """
+        Asynchronous counterpart of `__diagnose`.
+        """
+
+        start_time: float = time.monotonic()
+
+        try:
+            return await HelperTask.diagnose_async(p_job_batch_id, p_task_config, p_process_pool)
+
+        finally:
+            HelperExecutor.__log_duration(p_task_config.task_id, p_expected_duration, start_time)
+
+
+    @staticmethod
+    def __raise_first_failure(p_failed_tasks: Dict[int, BaseException]) -> None:
+
+        """
+        Logs every failure and raises the one of the lowest task id, to stay close to the sequential behaviour.
+        """
+
+        failed_task_ids: List[int] = sorted(p_failed_tasks)
+
+        for task_id in failed_task_ids[1:]:
+            logger.error(f"Task id '{task_id}' also failed: {p_failed_tasks[task_id]}")
+
+        raise p_failed_tasks[failed_task_ids[0]]
+
+
+    @staticmethod
+    def __execute_sequential(p_job_batch_id: str, p_task_configs: List[TaskConfigModel], p_process_pool: Optional[ProcessPoolExecutor], p_expected_durations: Dict[int, float]) -> None:
+
+        """
+        Executes tasks one after another on the calling thread, in task ID order within the dependency order.
+        """
+
+        task_ids: Set[int] = {task_config.task_id for task_config in p_task_configs}
+        waiting_tasks: Dict[int, TaskConfigModel] = {task_config.task_id: task_config for task_config in p_task_configs}
+        task_statuses: Dict[int, TaskStatusEnum] = {}
+
+        ready_tasks: List[TaskConfigModel] = HelperExecutor.__resolve_ready_tasks(p_job_batch_id, waiting_tasks, task_statuses, task_ids)
+
+        while ready_tasks:
+
+            task_config: TaskConfigModel = ready_tasks.pop(0)
+
+            task_statuses[task_config.task_id] = HelperExecutor.__diagnose(
+                p_job_batch_id, task_config, p_process_pool, p_expected_durations[task_config.task_id]
+            )
+
+            ready_tasks = sorted(
+                ready_tasks + HelperExecutor.__resolve_ready_tasks(p_job_batch_id, waiting_tasks, task_statuses, task_ids),
+                key = lambda _task_config: _task_config.task_id
+            )
+
+            logger.info("---" if ready_tasks else "***\n")
+
+
+    @staticmethod
+    def __execute_concurrent(p_job_batch_id: str, p_task_configs: List[TaskConfigModel], p_max_workers: int, p_process_pool: Optional[ProcessPoolExecutor], p_expected_durations: Dict[int, float]) -> None:
+
+        """
+        Executes tasks concurrently on a thread pool, dispatching each task as soon as its upstream tasks succeeded
+            and a worker is free, longest expected task first.
+            On the first raised error (including `fail_fast` failures), tasks not yet started are cancelled,
+            running tasks are awaited so that their log rows are written, and the first error is re-raised.
+        """
+
+        task_ids: Set[int] = {task_config.task_id for task_config in p_task_configs}
+        waiting_tasks: Dict[int, TaskConfigModel] = {task_config.task_id: task_config for task_config in p_task_configs}
+        task_statuses: Dict[int, TaskStatusEnum] = {}
+        ready_tasks: List[TaskConfigModel] = []
+        running_futures: Dict[Future, TaskConfigModel] = {}
+        failed_tasks: Dict[int, BaseException] = {}
+
+        executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers = p_max_workers, thread_name_prefix = "dq_task")
+
+        def _dispatch_ready_tasks() -> None:
+
+            ready_tasks[:] = HelperExecutor.__prioritize_tasks(
+                ready_tasks + HelperExecutor.__resolve_ready_tasks(p_job_batch_id, waiting_tasks, task_statuses, task_ids),
+                p_expected_durations
+            )
+
+            # Submit only what free workers can start, so that later ready tasks still compete on expected duration
+            while ready_tasks and len(running_futures) < p_max_workers:
+
+                _task_config: TaskConfigModel = ready_tasks.pop(0)
+
+                running_futures[executor.submit(
+                    HelperExecutor.__diagnose, p_job_batch_id, _task_config, p_process_pool, p_expected_durations[_task_config.task_id]
+                )] = _task_config
+
+        def _collect_done_futures(_done_futures: Set[Future]) -> None:
+
+            for _future in _done_futures:
+
+                _task_config: TaskConfigModel = running_futures.pop(_future)
+
+                if _future.exception():
+                    failed_tasks[_task_config.task_id] = _future.exception()
+                    task_statuses[_task_config.task_id] = TaskStatusEnum.FAILURE
+
+                else:
+                    task_statuses[_task_config.task_id] = _future.result()
+
+        try:
+
+            _dispatch_ready_tasks()
+
+            while running_futures and not failed_tasks:
+
+                done_futures, _ = wait(running_futures, return_when = FIRST_COMPLETED)
+
+                _collect_done_futures(done_futures)
+
+                if not failed_tasks:
+                    _dispatch_ready_tasks()
+
+
+            if failed_tasks:
+
+                # Cancel tasks which are not yet started and wait for the running ones to finish
+                logger.warning(f"Cancelled not yet started task ids: {sorted([task_config.task_id for task_config in ready_tasks] + list(waiting_tasks))}")
+
+                done_futures, _ = wait(running_futures)
+
+                _collect_done_futures(done_futures)
+
+                HelperExecutor.__raise_first_failure(failed_tasks)
+
+            logger.info("***\n")
+
+        finally:
+
+            # Never block on running tasks here, e.g. when a termination signal interrupts the wait
+            executor.shutdown(wait = False, cancel_futures = True)
+
+
+    @staticmethod
+    async def __execute_async(p_job_batch_id: str, p_task_configs: List[TaskConfigModel], p_max_workers: Optional[int], p_process_pool: Optional[ProcessPoolExecutor], p_expected_durations: Dict[int, float]) -> None:
+
+        """
+        Executes tasks concurrently on the running event loop, dispatching each task as soon as its upstream tasks succeeded,
+            longest expected task first. The number of tasks in flight is bounded by the number of workers, or unbounded if none is configured.
+            On the first raised error (including `fail_fast` failures), tasks not yet started are cancelled,
+            running tasks are awaited so that their log rows are written, and the first error is re-raised.
+        """
+
+        task_ids: Set[int] = {task_config.task_id for task_config in p_task_configs}
+        waiting_tasks: Dict[int, TaskConfigModel] = {task_config.task_id: task_config for task_config in p_task_configs}
+        task_statuses: Dict[int, TaskStatusEnum] = {}
+        ready_tasks: List[TaskConfigModel] = []
+        running_tasks: Dict[asyncio.Task, TaskConfigModel] = {}
+        failed_tasks: Dict[int, BaseException] = {}
+
+        max_running_tasks: int = p_max_workers or max(len(p_task_configs), 1)
+
+        def _dispatch_ready_tasks() -> None:
+
+            ready_tasks[:] = HelperExecutor.__prioritize_tasks(
+                ready_tasks + HelperExecutor.__resolve_ready_tasks(p_job_batch_id, waiting_tasks, task_statuses, task_ids),
+                p_expected_durations
+            )
+
+            while ready_tasks and len(running_tasks) < max_running_tasks:
+
+                _task_config: TaskConfigModel = ready_tasks.pop(0)
+
+                running_tasks[asyncio.create_task(
+                    HelperExecutor.__diagnose_async(p_job_batch_id, _task_config, p_process_pool, p_expected_durations[_task_config.task_id]),
+                    name = f"dq_task_{_task_config.task_id}"
+                )] = _task_config
+
+        def _collect_done_tasks(_done_tasks: Set[asyncio.Task]) -> None:
+
+            for _task in _done_tasks:
+
+                _task_config: TaskConfigModel = running_tasks.pop(_task)
+
+                if _task.cancelled():
+                    continue
+
+                if _task.exception():
+                    failed_tasks[_task_config.task_id] = _task.exception()
+                    task_statuses[_task_config.task_id] = TaskStatusEnum.FAILURE
+
+                else:
+                    task_statuses[_task_config.task_id] = _task.result()
+
+        try:
+
+            _dispatch_ready_tasks()
+
+            while running_tasks and not failed_tasks:
+
+                done_tasks, _ = await asyncio.wait(running_tasks, return_when = asyncio.FIRST_COMPLETED)
+
+                _collect_done_tasks(done_tasks)
+
+                if not failed_tasks:
+                    _dispatch_ready_tasks()
+
+
+            if failed_tasks:
+
+                # Cancel tasks which are not yet started and wait for the running ones to finish
+                logger.warning(f"Cancelled not yet started task ids: {sorted([task_config.task_id for task_config in ready_tasks] + list(waiting_tasks))}")
+
+                if running_tasks:
+
+                    done_tasks, _ = await asyncio.wait(running_tasks)
+
+                    _collect_done_tasks(done_tasks)
+
+                HelperExecutor.__raise_first_failure(failed_tasks)
+
+            logger.info("***\n")
+
+        finally:
+
+            # Never leave tasks behind, e.g. when a termination signal interrupts the wait
+            for task in running_tasks:
+                task.cancel()
+
+
+    @staticmethod
+    def execute(p_job_batch_id: str, p_task_configs: List[TaskConfigModel], p_starting_task_id: int, p_max_workers: Optional[int], p_max_processes: Optional[int] = None, p_is_async: Optional[bool] = False) -> None:
+
+        """
+        Executes every task starting from the given task ID, concurrently if more than one worker is configured.
+            If a number of processes is configured, CPU bound rules are evaluated in a process pool of that size,
+            their query slots being held by this process so that the governor limits stay process wide.
+            If asynchronous execution is enabled, tasks run on an asyncio event loop bounded by the number of workers.
+            Expected task durations are read once from the task log history of the job, only when tasks run concurrently,
+            as they merely order the dispatch of ready tasks.
+        """
+
+        eligible_task_configs: List[TaskConfigModel] = [
+            task_config for task_config in p_task_configs if task_config.task_id >= p_starting_task_id
+        ]
+
+        if not eligible_task_configs:
+            return
+
+        is_sequential: bool = not p_is_async and (not p_max_workers or p_max_workers == 1 or len(eligible_task_configs) <= 1)
+
+        expected_durations: Dict[int, float] = (
+            HelperTask.get_default_durations(eligible_task_configs)
+                if is_sequential else HelperTask.get_expected_durations(eligible_task_configs[0].job_id, eligible_task_configs)
+        )
+
+        logger.debug(f"Expected task durations (seconds): {expected_durations}")
+
+        # Spawned processes don't inherit the threads and open connections of the current process,
+        # and run with their governor disabled, as the query slots of their tasks are held by this process
+        process_pool: Optional[ProcessPoolExecutor] = (
+            ProcessPoolExecutor(max_workers = p_max_processes, mp_context = multiprocessing.get_context("spawn"), initializer = GovernorUtil.disable)
+                if p_max_processes else None
+        )
+
+        try:
+
+            if p_is_async:
+
+                logger.info(f"Job execution mode: ASYNC with {p_max_workers or 'unbounded'} workers{f' and {p_max_processes} processes' if process_pool else ''}")
+
+                asyncio.run(HelperExecutor.__execute_async(p_job_batch_id, eligible_task_configs, p_max_workers, process_pool, expected_durations))
+
+            elif is_sequential:
+
+                logger.info(f"Job execution mode: SEQUENTIAL{f' with {p_max_processes} processes' if process_pool else ''}")
+
+                HelperExecutor.__execute_sequential(p_job_batch_id, eligible_task_configs, process_pool, expected_durations)
+
+            else:
+
+                logger.info(f"Job execution mode: CONCURRENT with {p_max_workers} workers{f' and {p_max_processes} processes' if process_pool else ''}")
+
+                HelperExecutor.__execute_concurrent(p_job_batch_id, eligible_task_configs, p_max_workers, process_pool, expected_durations)
+
+        finally:
+
+            if process_pool is not None:
+                process_pool.shutdown(wait = False, cancel_futures = True)
@@ -0,0 +1,209 @@
+#####################################################
+# Packages                                          #
+#####################################################
+
+import os
+import socket
+import logging
+import threading
+from sqlalchemy import text
+from datetime import timedelta
+from sqlalchemy.engine import Row
+from collections import namedtuple
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from dependencies.utilities.dt_util import DtUtil
+from dependencies.utilities.cred_util import CredUtil
+from dependencies.utilities.const_util import ConstUtil
+from dependencies.functions.core.helper_vault import HelperVault
+from dependencies.entities.models.process_enum import QueueStatusEnum
+
+
+#####################################################
+# Main Class                                        #
+#####################################################
+
+logger = logging.getLogger(__name__)
+
+
+class HelperQueue:
+
+    """
+    A class to claim and close job requests of the job queue table, used by long-running workers.
+        Queue columns: request_id, job_id, is_scheduled, request_status, claimed_by, lease_expires_ts, batch_id, dw_created_ts, dw_updated_ts.
+        A claim is leased for QUEUE_LEASE_SECONDS and renewed by a heartbeat while the job runs,
+        so that the request of a killed worker is reclaimed by another worker once the lease expires.
+    """
+
+    # Class Private Variables
+    __WORKER_ID: str = f"{socket.gethostname()}:{os.getpid()}"
+    __LEASE_SECONDS: int = int(CredUtil.getenv("QUEUE_LEASE_SECONDS", raise_expection = False) or 300)
+
+
+    @classmethod
+    def get_worker_id(cls) -> str:
+
+        """
+        Returns the identifier of the current worker process.
+        """
+
+        return cls.__WORKER_ID
+
+
+    @classmethod
+    @HelperVault.retry_connection_error(max_retries = None)
+    def claim_job_request(cls) -> Optional[namedtuple]:
+
+        """
+        Claims the oldest pending job request, or a claimed one whose lease has expired, skipping the ones locked by other workers.
+            Returns None if no claimable job request is available.
+        """
+
+        current_ts = DtUtil.get_current_ist_datetime()
+
+        with ConstUtil.PRCS_DB_ENGINE.begin() as connection:
+
+            claimed_row: Optional[Row] = connection.execute(
+                text(f"""
+                    UPDATE {ConstUtil.PRCS_DB_SCHEMA}.{ConstUtil.PRCS_JOB_QUEUE_TBL_NAME}
+                    SET
+                        request_status = :claimed_status,
+                        claimed_by = :worker_id,
+                        lease_expires_ts = :lease_expires_ts,
+                        dw_updated_ts = :updated_ts
+                    WHERE request_id = (
+                        SELECT request_id
+                        FROM {ConstUtil.PRCS_DB_SCHEMA}.{ConstUtil.PRCS_JOB_QUEUE_TBL_NAME}
+                        WHERE UPPER(TRIM(request_status)) = :pending_status
+                            OR (
+                                UPPER(TRIM(request_status)) = :claimed_status
+                                AND (lease_expires_ts IS NULL OR lease_expires_ts < :updated_ts)
+                            )
+                        ORDER BY request_id
+                        LIMIT 1
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    RETURNING request_id, job_id, COALESCE(is_scheduled, FALSE) AS is_scheduled
+                    ;
+                """),
+                {
+                    "claimed_status": QueueStatusEnum.CLAIMED.value,
+                    "pending_status": QueueStatusEnum.PENDING.value,
+                    "worker_id": cls.__WORKER_ID,
+                    "lease_expires_ts": current_ts + timedelta(seconds = cls.__LEASE_SECONDS),
+                    "updated_ts": current_ts
+                }
+            ).first()
+
+        if claimed_row is None:
+            return None
+        
+        JobRequest = namedtuple("JobRequest", ["request_id", "job_id", "is_scheduled"])
+        job_request: namedtuple = JobRequest(*claimed_row)
+
+        logger.info(f"Job request claimed by worker '{cls.__WORKER_ID}': {job_request}")
+
+        return job_request
+
+
+    @classmethod
+    def renew_job_request(cls, p_request_id: int) -> bool:
+
+        """
+        Extends the lease of a job request claimed by the current worker.
+            Returns False if the job request is no longer held by the current worker.
+        """
+
+        current_ts = DtUtil.get_current_ist_datetime()
+
+        with ConstUtil.PRCS_DB_ENGINE.begin() as connection:
+
+            renewed_count: int = connection.execute(
+                text(f"""
+                    UPDATE {ConstUtil.PRCS_DB_SCHEMA}.{ConstUtil.PRCS_JOB_QUEUE_TBL_NAME}
+                    SET
+                        lease_expires_ts = :lease_expires_ts,
+                        dw_updated_ts = :updated_ts
+                    WHERE request_id = :request_id
+                        AND claimed_by = :worker_id
+                        AND UPPER(TRIM(request_status)) = :claimed_status
+                    ;
+                """),
+                {
+                    "request_id": p_request_id,
+                    "worker_id": cls.__WORKER_ID,
+                    "claimed_status": QueueStatusEnum.CLAIMED.value,
+                    "lease_expires_ts": current_ts + timedelta(seconds = cls.__LEASE_SECONDS),
+                    "updated_ts": current_ts
+                }
+            ).rowcount
+
+        return renewed_count > 0
+
+
+    @classmethod
+    @contextmanager
+    def heartbeat(cls, p_request_id: int) -> Iterator[None]:
+
+        """
+        Renews the lease of a claimed job request from a daemon thread while the enclosed block runs.
+            The lease is renewed three times per lease period, so a single failed renewal does not lose the claim.
+        """
+
+        stop_event = threading.Event()
+
+        def __renew() -> None:
+
+            while not stop_event.wait(cls.__LEASE_SECONDS / 3):
+
+                try:
+                    if not cls.renew_job_request(p_request_id):
+                        logger.warning(f"Job request '{p_request_id}' is no longer held by worker '{cls.__WORKER_ID}'.")
+                        return
+
+                except Exception as error:
+                    logger.warning(f"Lease renewal of job request '{p_request_id}' failed: {error}")
+
+        heartbeat_thread = threading.Thread(target = __renew, name = f"queue-heartbeat-{p_request_id}", daemon = True)
+        heartbeat_thread.start()
+
+        try:
+            yield
+
+        finally:
+            stop_event.set()
+            heartbeat_thread.join()
+
+
+    @classmethod
+    @HelperVault.retry_connection_error()
+    def close_job_request(cls, p_request_id: int, p_request_status: QueueStatusEnum, p_job_batch_id: Optional[str]) -> None:
+
+        """
+        Closes a job request claimed by the current worker with its final status and the batch ID of the job run.
+        """
+
+        with ConstUtil.PRCS_DB_ENGINE.begin() as connection:
+
+            connection.execute(
+                text(f"""
+                    UPDATE {ConstUtil.PRCS_DB_SCHEMA}.{ConstUtil.PRCS_JOB_QUEUE_TBL_NAME}
+                    SET
+                        request_status = :request_status,
+                        batch_id = :batch_id,
+                        lease_expires_ts = NULL,
+                        dw_updated_ts = :updated_ts
+                    WHERE request_id = :request_id
+                        AND claimed_by = :worker_id
+                    ;
+                """),
+                {
+                    "request_id": p_request_id,
+                    "worker_id": cls.__WORKER_ID,
+                    "request_status": p_request_status.value,
+                    "batch_id": p_job_batch_id,
+                    "updated_ts": DtUtil.get_current_ist_datetime()
+                }
+            )
+
+        logger.info(f"Job request '{p_request_id}' closed with the values {{'request_status': {p_request_status}, 'batch_id': {p_job_batch_id}}}.")
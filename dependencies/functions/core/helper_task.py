@@ -3,24 +3,30 @@
 #####################################################
 
 import json
+import asyncio
 import logging
 import pandas as pd
 from datetime import datetime
-from typing import List, Optional
 from collections import namedtuple
 from dependencies.utilities.df_util import DfUtil
 from dependencies.utilities.dt_util import DtUtil
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Final, List, Optional, Set
 from dependencies.utilities.const_util import ConstUtil
 from dependencies.functions.core.helper_job import HelperJob
+from dependencies.utilities.governor_util import GovernorUtil
 from dependencies.entities.models.log_model import TaskLogModel
+from dependencies.entities.factories.f_database import FDatabase
+from dependencies.functions.core.helper_cache import HelperCache
 from dependencies.entities.factories.f_diagnose import FDiagnose
 from dependencies.entities.interfaces.i_diagnose import IDiagnose
 from dependencies.functions.core.log_auditor_job import LogAuditorJob
 from dependencies.functions.core.log_auditor_task import LogAuditorTask
+from dependencies.functions.core.helper_watermark import HelperWatermark
 from dependencies.entities.models.config_core_model import TaskConfigModel
 from great_expectations.exceptions import GreatExpectationsValidationError
 from dependencies.entities.models.result_model import ValidationResultsModel
-from dependencies.entities.models.process_enum import JobStatusEnum, TaskStatusEnum
+from dependencies.entities.models.process_enum import ConfigTypeEnum, JobStatusEnum, TaskRuleEnum, TaskStatusEnum
 
 
 #####################################################
@@ -32,6 +38,20 @@ logger = logging.getLogger(__name__)
 
 class HelperTask:
 
+    # Class Private Variables
+    __DURATION_HISTORY_RUNS: Final[int] = 5
+    __DURATION_HISTORY_JOB_BATCHES: Final[int] = 20
+    __DEFAULT_RULE_DURATIONS: Final[Dict[TaskRuleEnum, float]] = {
+        TaskRuleEnum.MATCH_ROW: 600.0,
+        TaskRuleEnum.MATCH_AGGREGATION: 300.0,
+        TaskRuleEnum.CHECK_DUPLICATE: 300.0,
+        TaskRuleEnum.CHECK_THRESHOLD: 120.0,
+        TaskRuleEnum.CHECK_NULLS: 60.0,
+        TaskRuleEnum.CHECK_VALUES: 60.0,
+        TaskRuleEnum.MATCH_COUNT: 60.0,
+        TaskRuleEnum.CHECK_COLUMNS: 30.0
+    }
+
 
     @staticmethod
     def __get_first_failed_task_id(p_job_batch_id: str) -> int:
@@ -65,18 +85,18 @@ class HelperTask:
 
 
     @staticmethod
-    def get_starting_task_id(p_job_id: int, p_job_batch_id: str, p_scheduled: bool, p_restart_enabled: bool) -> int:
+    def __get_restart_batch_id(p_job_id: int, p_job_batch_id: str, p_scheduled: bool, p_restart_enabled: bool) -> Optional[str]:
 
         """
         Determines whether the current job is a restart of a previous failed validation job.
-            If so, retrieves the ID of the first failed task from the previous job batch.
+            If so, returns the batch ID of the previous job batch.
         """
 
         if p_scheduled or not p_restart_enabled:
             
             LogAuditorJob.update_log(is_restart = False)
 
-            return 1
+            return None
 
         # Retrieve information about the most recently run job
         previous_job_info: namedtuple = HelperJob.get_previous_job_info(p_job_id, p_job_batch_id)
@@ -88,34 +108,297 @@ class HelperTask:
             and previous_job_info.validation_status == TaskStatusEnum.FAILURE
         )
 
-        if restart_condition:
+        LogAuditorJob.update_log(is_restart = restart_condition)
 
-            # If this is a restart, fetch the first failed task ID from the previous batch
+        return previous_job_info.batch_id if restart_condition else None
 
-            LogAuditorJob.update_log(is_restart = True)
 
-            return HelperTask.__get_first_failed_task_id(p_job_batch_id = previous_job_info.batch_id)
-        
-        LogAuditorJob.update_log(is_restart = False)
+    @staticmethod
+    def get_starting_task_id(p_job_id: int, p_job_batch_id: str, p_scheduled: bool, p_restart_enabled: bool) -> int:
+
+        """
+        Determines whether the current job is a restart of a previous failed validation job.
+            If so, retrieves the ID of the first failed task from the previous job batch.
+        """
+
+        previous_job_batch_id: Optional[str] = HelperTask.__get_restart_batch_id(p_job_id, p_job_batch_id, p_scheduled, p_restart_enabled)
+
+        if previous_job_batch_id:
+
+            # If this is a restart, fetch the first failed task ID from the previous batch
+            return HelperTask.__get_first_failed_task_id(p_job_batch_id = previous_job_batch_id)
 
         return 1
 
 
     @staticmethod
-    def diagnose(p_job_batch_id: str, p_task_config: TaskConfigModel) -> None:
+    def carry_forward_passed_tasks(p_job_id: int, p_job_batch_id: str, p_scheduled: bool, p_restart_enabled: bool, p_task_configs: List[TaskConfigModel]) -> Set[int]:
 
         """
-        Executes diagnostic validation for a given task configuration within a job batch.
+        Determines whether the current job is a restart of a previous failed validation job.
+            If so, carries forward the log rows of the tasks which passed in the previous job batch with an unchanged
+            configuration, and returns their task IDs so that only failed or never run tasks are executed again.
         """
 
-        # Initialize a task log auditor for the current task
-        task_log_auditor: LogAuditorTask = LogAuditorTask(p_job_batch_id, p_task_config)
+        previous_job_batch_id: Optional[str] = HelperTask.__get_restart_batch_id(p_job_id, p_job_batch_id, p_scheduled, p_restart_enabled)
+
+        if not previous_job_batch_id:
+            return set()
+
+        task_batch_id_pattern: str = previous_job_batch_id.replace("_", r"\_") + r"\_%"
+
+        previous_task_df: pd.DataFrame = DfUtil.read_sql(
+            p_query = f"""
+                SELECT
+                    task_id, UPPER(TRIM(task_status)) AS task_status, config_passed
+                FROM {ConstUtil.PRCS_DB_SCHEMA}.{ConstUtil.PRCS_TASK_LOG_TBL_NAME}
+                WHERE batch_id LIKE '{task_batch_id_pattern}'
+                ;
+            """,
+            p_engine = ConstUtil.PRCS_DB_ENGINE
+        )
+
+        previous_tasks: Dict[int, tuple] = {
+            int(task_id): (task_status, json.loads(config_passed) if isinstance(config_passed, str) else config_passed)
+            for task_id, task_status, config_passed in previous_task_df.itertuples(index = False)
+        }
+
+        passed_task_ids: List[int] = []
+
+        for task_config in p_task_configs:
+
+            previous_task_status, previous_config_passed = previous_tasks.get(task_config.task_id, (None, None))
+
+            # A changed configuration may change the outcome, hence such tasks are executed again
+            if (
+                    previous_task_status in (TaskStatusEnum.SUCCESS, TaskStatusEnum.WARNING)
+                and previous_config_passed == json.loads(json.dumps(task_config.model_dump(), default = str))
+            ):
+                passed_task_ids.append(task_config.task_id)
+
+        LogAuditorTask.carry_forward_logs(p_job_batch_id, previous_job_batch_id, passed_task_ids)
+
+        return set(passed_task_ids)
+
+
+    @staticmethod
+    def get_default_durations(p_task_configs: List[TaskConfigModel]) -> Dict[int, float]:
+
+        """
+        Returns the per rule default duration in seconds of each task, keyed by task ID, without reading the task log history.
+        """
+
+        return {
+            task_config.task_id: HelperTask.__DEFAULT_RULE_DURATIONS.get(task_config.task_rule, 60.0)
+            for task_config in p_task_configs
+        }
+
+
+    @staticmethod
+    def get_expected_durations(p_job_id: int, p_task_configs: List[TaskConfigModel]) -> Dict[int, float]:
+
+        """
+        Returns the expected duration in seconds of each task of a job, keyed by task ID, with a single query.
+            The expectation is the median duration of the task's recent executed runs, or a per rule default without history.
+            Only the most recent job batches are read, and their task batch IDs are built upfront, so that both
+            log tables are looked up by their indexed columns. Log rows carried forward by an incremental restart are not executions, hence left out.
+        """
+
+        task_ids_values: str = ", ".join(f"({task_config.task_id})" for task_config in p_task_configs)
+
+        duration_df: pd.DataFrame = DfUtil.read_sql(
+            p_query = f"""
+                WITH recent_job_batches AS (
+                    SELECT batch_id
+                    FROM {ConstUtil.PRCS_DB_SCHEMA}.{ConstUtil.PRCS_JOB_LOG_TBL_NAME}
+                    WHERE job_id = {p_job_id}
+                    ORDER BY batch_date DESC, batch_seq DESC
+                    LIMIT {HelperTask.__DURATION_HISTORY_JOB_BATCHES}
+                ),
+                recent_task_runs AS (
+                    SELECT
+                        task_log.task_id,
+                        EXTRACT(EPOCH FROM task_log.end_time - task_log.start_time) AS duration_seconds,
+                        ROW_NUMBER() OVER (PARTITION BY task_log.task_id ORDER BY task_log.start_time DESC) AS run_rank
+                    FROM {ConstUtil.PRCS_DB_SCHEMA}.{ConstUtil.PRCS_TASK_LOG_TBL_NAME} AS task_log
+                    WHERE task_log.batch_id IN (
+                        SELECT job_batch.batch_id || '_' || task_ids.task_id
+                        FROM recent_job_batches AS job_batch
+                        CROSS JOIN (VALUES {task_ids_values}) AS task_ids (task_id)
+                    )
+                      AND UPPER(TRIM(task_log.task_status)) IN ('{TaskStatusEnum.SUCCESS}', '{TaskStatusEnum.FAILURE}')
+                      AND task_log.origin_batch_id IS NULL
+                )
+                SELECT
+                    task_id,
+                    PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY duration_seconds) AS expected_seconds
+                FROM recent_task_runs
+                WHERE run_rank <= {HelperTask.__DURATION_HISTORY_RUNS}
+                GROUP BY task_id
+                ;
+            """,
+            p_engine = ConstUtil.PRCS_DB_ENGINE
+        )
+
+        history_durations: Dict[int, float] = {
+            int(task_id): float(expected_seconds) for task_id, expected_seconds in duration_df.itertuples(index = False)
+        }
+
+        return {
+            task_id: history_durations.get(task_id, default_duration)
+            for task_id, default_duration in HelperTask.get_default_durations(p_task_configs).items()
+        }
+
+
+    @staticmethod
+    def skip(p_job_batch_id: str, p_task_config: TaskConfigModel) -> TaskStatusEnum:
+
+        """
+        Logs a task of a job batch as skipped without executing it.
+        """
+
+        return LogAuditorTask(p_job_batch_id, p_task_config).create_log(p_start_datetime = DtUtil.get_current_ist_datetime())
+
+
+    @staticmethod
+    def evaluate(p_config_type: ConfigTypeEnum, p_task_rule: TaskRuleEnum, p_task_name: str, p_src_config: dict, p_tgt_config: dict, p_task_parameter: dict, p_primary_reads: bool = False) -> dict:
+
+        """
+        Evaluates the diagnose function of a task rule and returns its raw results.
+            Kept free of any task logging, so that it can also be run in a worker process.
+            With `p_primary_reads`, the rule reads its data from the primary databases.
+        """
+
+        diagnose_instance: IDiagnose = FDiagnose().get_instance(p_config_type = p_config_type, p_task_rule = p_task_rule)
+
+        with FDatabase.primary_reads(p_primary_reads):
+
+            return diagnose_instance.evaluate(
+                p_task_name = p_task_name,
+                p_src_config = p_src_config,
+                p_tgt_config = p_tgt_config,
+                p_task_parameter = p_task_parameter
+            )
+
+
+    @staticmethod
+    def __needs_primary_reads(p_task_config: TaskConfigModel) -> bool:
+
+        """
+        Returns True if the task must read its data from the primary databases, as its watermarks or data fingerprints
+            are read from the primary, and a lagging replica would miss rows of the window or cache stale results.
+        """
+
+        return bool(p_task_config.incremental or p_task_config.is_cacheable)
+
+
+    @staticmethod
+    def __get_read_connections(p_src_config: dict, p_tgt_config: dict, p_primary_reads: bool = False) -> List[str]:
+
+        """
+        Returns the read-only connection strings of the source and target databases of a task, if any,
+            so that a process pool task holds the query slots of its databases in the parent process.
+        """
+
+        with FDatabase.primary_reads(p_primary_reads):
+
+            return [
+                FDatabase(table_config[f"{prefix}_dbtype"]).make_connection(table_config[f"{prefix}_dbname"], p_read_only = True).connection_string
+                for prefix, table_config in (("src", p_src_config), ("tgt", p_tgt_config))
+                if (table_config or {}).get(f"{prefix}_dbtype") is not None
+            ]
+
+
+    @staticmethod
+    def diagnose(p_job_batch_id: str, p_task_config: TaskConfigModel, p_process_pool: Optional[ProcessPoolExecutor] = None) -> TaskStatusEnum:
+
+        """
+        Executes diagnostic validation for a given task configuration within a job batch and returns the logged task status.
+            CPU bound rules are evaluated in the given process pool, if any, holding the query slots of their databases
+            in this process, as the governor of the worker processes is disabled. Worker processes don't share the batch snapshots.
+        """
 
         if not p_task_config.is_active:
+            return HelperTask.skip(p_job_batch_id, p_task_config)
+        
+        # Initialize a task log auditor for the current task
+        task_log_auditor: LogAuditorTask = LogAuditorTask(p_job_batch_id, p_task_config)
             
-            task_log_auditor.create_log(p_start_datetime = DtUtil.get_current_ist_datetime())
+        # Get the corresponding diagnose instance
+        diagnose_instance: IDiagnose = FDiagnose().get_instance(
+            p_config_type = p_task_config.config_type,
+            p_task_rule = p_task_config.task_rule
+        )
+
+        logger.info(f"Task picked function for ('{p_task_config.config_type}', '{p_task_config.task_rule}'): {type(diagnose_instance).__name__}")
+
+        # Execute validation with source and target configurations
+
+        diagnose_start_datetime: datetime = DtUtil.get_current_ist_datetime()
+
+        # Narrow incremental tasks down to the rows changed since their last successful run
+        watermark_window: Optional[namedtuple] = HelperWatermark.get_window(p_task_config)
+        src_config: dict = watermark_window.src_config if watermark_window else p_task_config.src_config
+        tgt_config: dict = watermark_window.tgt_config if watermark_window else p_task_config.tgt_config
+
+        # Reuse the results of a previous run over unchanged data, for cacheable tasks
+        cache_key: Optional[namedtuple] = HelperCache.get_cache_key(p_task_config)
+        cached_result: Optional[namedtuple] = HelperCache.get_cached_result(cache_key)
+
+        if cached_result is not None:
+
+            diagnose_results: dict = cached_result.diagnose_results
+
+        elif p_process_pool is not None and diagnose_instance.CPU_BOUND:
+
+            logger.info("Task evaluated in a worker process.")
+
+            # The rule reads its own data within the worker process, so only the results are sent back
+            with GovernorUtil.slots(HelperTask.__get_read_connections(src_config, tgt_config, HelperTask.__needs_primary_reads(p_task_config))):
+
+                diagnose_results: dict = p_process_pool.submit(
+                    HelperTask.evaluate,
+                    p_task_config.config_type,
+                    p_task_config.task_rule,
+                    p_task_config.task_name,
+                    src_config,
+                    tgt_config,
+                    p_task_config.task_parameter,
+                    HelperTask.__needs_primary_reads(p_task_config)
+                ).result()
+
+        else:
+
+            with FDatabase.primary_reads(HelperTask.__needs_primary_reads(p_task_config)):
+
+                diagnose_results: dict = diagnose_instance.evaluate(
+                    p_task_name = p_task_config.task_name,
+                    p_src_config = src_config,
+                    p_tgt_config = tgt_config,
+                    p_task_parameter = p_task_config.task_parameter
+                )
+
+        diagnose_end_datetime: datetime = DtUtil.get_current_ist_datetime()
+
+        return HelperTask.__audit(
+            task_log_auditor, p_task_config, diagnose_start_datetime, diagnose_end_datetime, diagnose_results,
+            cache_key, cached_result.batch_id if cached_result else None, watermark_window
+        )
+
+
+    @staticmethod
+    async def diagnose_async(p_job_batch_id: str, p_task_config: TaskConfigModel, p_process_pool: Optional[ProcessPoolExecutor] = None) -> TaskStatusEnum:
 
-            return
+        """
+        Asynchronous counterpart of `diagnose`, awaiting the rule's `evaluate_async` on the running event loop.
+            Blocking task logging runs in the loop's default thread pool.
+        """
+
+        if not p_task_config.is_active:
+            return await asyncio.to_thread(HelperTask.skip, p_job_batch_id, p_task_config)
+        
+        # Initialize a task log auditor for the current task
+        task_log_auditor: LogAuditorTask = LogAuditorTask(p_job_batch_id, p_task_config)
             
         # Get the corresponding diagnose instance
         diagnose_instance: IDiagnose = FDiagnose().get_instance(
@@ -129,30 +412,92 @@ class HelperTask:
 
         diagnose_start_datetime: datetime = DtUtil.get_current_ist_datetime()
 
-        diagnose_results: dict = diagnose_instance.evaluate(
-            p_task_name = p_task_config.task_name,
-            p_src_config = p_task_config.src_config,
-            p_tgt_config = p_task_config.tgt_config,
-            p_task_parameter = p_task_config.task_parameter
-        )
+        # Narrow incremental tasks down to the rows changed since their last successful run
+        watermark_window: Optional[namedtuple] = await asyncio.to_thread(HelperWatermark.get_window, p_task_config)
+        src_config: dict = watermark_window.src_config if watermark_window else p_task_config.src_config
+        tgt_config: dict = watermark_window.tgt_config if watermark_window else p_task_config.tgt_config
+
+        # Reuse the results of a previous run over unchanged data, for cacheable tasks
+        cache_key: Optional[namedtuple] = await asyncio.to_thread(HelperCache.get_cache_key, p_task_config)
+        cached_result: Optional[namedtuple] = await asyncio.to_thread(HelperCache.get_cached_result, cache_key)
+
+        if cached_result is not None:
+
+            diagnose_results: dict = cached_result.diagnose_results
+
+        elif p_process_pool is not None and diagnose_instance.CPU_BOUND:
+
+            logger.info("Task evaluated in a worker process.")
+
+            read_connections: List[str] = await asyncio.to_thread(
+                HelperTask.__get_read_connections, src_config, tgt_config, HelperTask.__needs_primary_reads(p_task_config)
+            )
+
+            async with GovernorUtil.slots_async(read_connections):
+
+                diagnose_results: dict = await asyncio.wrap_future(
+                    p_process_pool.submit(
+                        HelperTask.evaluate,
+                        p_task_config.config_type,
+                        p_task_config.task_rule,
+                        p_task_config.task_name,
+                        src_config,
+                        tgt_config,
+                        p_task_config.task_parameter,
+                        HelperTask.__needs_primary_reads(p_task_config)
+                    )
+                )
+
+        else:
+
+            with FDatabase.primary_reads(HelperTask.__needs_primary_reads(p_task_config)):
+
+                diagnose_results: dict = await diagnose_instance.evaluate_async(
+                    p_task_name = p_task_config.task_name,
+                    p_src_config = src_config,
+                    p_tgt_config = tgt_config,
+                    p_task_parameter = p_task_config.task_parameter
+                )
 
         diagnose_end_datetime: datetime = DtUtil.get_current_ist_datetime()
 
+        return await asyncio.to_thread(
+            HelperTask.__audit, task_log_auditor, p_task_config, diagnose_start_datetime, diagnose_end_datetime, diagnose_results,
+            cache_key, cached_result.batch_id if cached_result else None, watermark_window
+        )
+
+
+    @staticmethod
+    def __audit(p_task_log_auditor: LogAuditorTask, p_task_config: TaskConfigModel, p_start_datetime: datetime, p_end_datetime: datetime, p_diagnose_results: dict, p_cache_key: Optional[namedtuple] = None, p_origin_batch_id: Optional[str] = None, p_watermark_window: Optional[namedtuple] = None) -> TaskStatusEnum:
+
+        """
+        Validates the raw results of a diagnose function, logs them and returns the logged task status.
+            The watermarks of an incremental task only advance when its window passed validation.
+            Raises an error for failed validations of `fail_fast` tasks.
+        """
+
         # Validate diagnostic results
-        validation_results: ValidationResultsModel = ValidationResultsModel(**diagnose_results)
+        validation_results: ValidationResultsModel = ValidationResultsModel(**p_diagnose_results)
 
         # Create task status
-        task_log_auditor.create_log(
-            p_start_datetime = diagnose_start_datetime,
-            p_end_datetime = diagnose_end_datetime,
-            p_validation_results = validation_results
+        task_status: TaskStatusEnum = p_task_log_auditor.create_log(
+            p_start_datetime = p_start_datetime,
+            p_end_datetime = p_end_datetime,
+            p_validation_results = validation_results,
+            p_cache_key = p_cache_key,
+            p_origin_batch_id = p_origin_batch_id
         )
 
+        if task_status == TaskStatusEnum.SUCCESS:
+            HelperWatermark.save_window(p_task_log_auditor.task_batch_id, p_task_config, p_watermark_window)
+
         if p_task_config.fail_fast and not validation_results.success:
 
             raise GreatExpectationsValidationError(
                 f"Validation failed for task id: '{p_task_config.task_id}' with `fail_fast = True`."
             )
+        
+        return task_status
 
 
     @staticmethod
@@ -6,7 +6,7 @@ import time
 import logging
 import argparse
 from functools import wraps
-from typing import Any, Optional
+from typing import Any, List, Optional
 from argparse import RawTextHelpFormatter
 from sqlalchemy.exc import OperationalError
 from dependencies.utilities.env_util import EnvUtil
@@ -20,6 +20,20 @@ from dependencies.utilities.env_util import EnvUtil
 
 class HelperVault:
 
+    @staticmethod
+    def __parse_job_ids(p_value: str) -> List[int]:
+
+        """
+        Parses a comma separated list of job IDs.
+        """
+
+        try:
+            return [int(job_id) for job_id in p_value.split(",") if job_id.strip()]
+        
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Invalid job IDs '{p_value}', expected a comma separated list of integers.")
+
+
     @staticmethod
     def parse_arguments() -> argparse.Namespace:
         
@@ -29,8 +43,10 @@ class HelperVault:
             description = "MGDB Data Quality Job Runner"
         )
 
-        parser.add_argument(
-            "--job_id", type = int, required = True,
+        job_group: argparse._MutuallyExclusiveGroup = parser.add_mutually_exclusive_group(required = True)
+
+        job_group.add_argument(
+            "--job_id", type = int,
             help = (
                 "Specifies the unique identifier for the job configuration.\n"
                 "This ID is used to retrieve relevant job-level and task-level settings from the configuration tables.\n\n"
@@ -42,6 +58,47 @@ class HelperVault:
             )
         )
 
+        job_group.add_argument(
+            "--job_ids", type = HelperVault.__parse_job_ids,
+            help = (
+                "Specifies a comma separated list of job IDs to run one after another within a single process.\n"
+                "Database engines, Great Expectations context and API auth tokens are shared across the jobs,\n"
+                "while each job still gets its own batch ID and job log entry.\n\n"
+                "Example:\n"
+                "  $ python main.py --job_ids 101,102,103"
+            )
+        )
+
+        job_group.add_argument(
+            "--job_group", type = str,
+            help = (
+                "Specifies a job group whose jobs are run one after another within a single process, in job ID order.\n"
+                "The jobs are resolved from the 'job_group' column of the job configuration table.\n\n"
+                "Example:\n"
+                "  $ python main.py --job_group nightly"
+            )
+        )
+
+        job_group.add_argument(
+            "--worker", action = "store_true",
+            help = (
+                "Runs a long-running worker which keeps its database engines and Great Expectations context warm,\n"
+                "and runs the pending job requests claimed from the job queue table one after another.\n"
+                "Several workers, also on different hosts, can drain the same queue without running a request twice.\n\n"
+                "Example:\n"
+                "  $ python main.py --worker"
+            )
+        )
+
+        parser.add_argument(
+            "--poll_seconds", type = int, default = 30, required = False,
+            help = (
+                "Specifies how many seconds a worker waits before polling the job queue table again once it is empty.\n\n"
+                "Example:\n"
+                "  $ python main.py --worker --poll_seconds 10"
+            )
+        )
+
         if EnvUtil.enable_auto():
             parser.add_argument(
                 "--auto", action = "store_true", required = False,
@@ -0,0 +1,165 @@
+#####################################################
+# Packages                                          #
+#####################################################
+
+import logging
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+from collections import namedtuple
+from typing import Dict, Optional, Tuple
+from decimal import Decimal, InvalidOperation
+from dependencies.utilities.df_util import DfUtil
+from dependencies.utilities.dt_util import DtUtil
+from dependencies.utilities.const_util import ConstUtil
+from dependencies.entities.factories.f_database import FDatabase
+from dependencies.entities.models.config_core_model import TaskConfigModel
+
+
+#####################################################
+# Main Class                                        #
+#####################################################
+
+logger = logging.getLogger(__name__)
+
+
+class HelperWatermark:
+
+    """
+    A class to narrow incremental tasks down to the rows changed since their last successful run.
+        The high watermarks of the source and target tables are kept per task in the watermark state table,
+        and only advance once a run over the window between the stored and current watermarks succeeds.
+    """
+
+    WatermarkWindow = namedtuple("WatermarkWindow", ["src_config", "tgt_config", "high_watermarks"])
+
+
+    @staticmethod
+    def __get_stored_watermarks(p_task_config: TaskConfigModel) -> Dict[str, Optional[str]]:
+
+        """
+        Returns the source and target high watermarks stored by the last successful run of a task, keyed by table prefix.
+        """
+
+        watermark_df: pd.DataFrame = DfUtil.read_sql(
+            p_query = f"""
+                SELECT
+                    src_watermark, tgt_watermark
+                FROM {ConstUtil.PRCS_DB_SCHEMA}.{ConstUtil.PRCS_TASK_WATERMARK_TBL_NAME}
+                WHERE job_id = {p_task_config.job_id}
+                  AND task_id = {p_task_config.task_id}
+                ;
+            """,
+            p_engine = ConstUtil.PRCS_DB_ENGINE
+        )
+
+        if watermark_df.empty:
+            return {"src": None, "tgt": None}
+
+        src_watermark, tgt_watermark = watermark_df.replace(np.nan, None).values[0]
+
+        return {"src": src_watermark, "tgt": tgt_watermark}
+
+
+    @staticmethod
+    def __apply_lookback(p_watermark: Optional[str], p_lookback: int) -> Optional[str]:
+
+        """
+        Moves a watermark back by the lookback, in minutes for temporal watermarks and in watermark units for numeric ones.
+        """
+
+        if p_watermark is None or not p_lookback:
+            return p_watermark
+
+        try:
+            return str(Decimal(p_watermark) - p_lookback)
+
+        except InvalidOperation:
+            return str(pd.Timestamp(p_watermark) - pd.Timedelta(minutes = p_lookback))
+
+
+    @staticmethod
+    def get_window(p_task_config: TaskConfigModel) -> Optional[namedtuple]:
+
+        """
+        Returns the source and target configurations of an incremental task restricted to its watermark window,
+            along with the current high watermarks to store once the task succeeds, or None if the task is not incremental.
+            The high watermarks must be taken before the task runs, so that rows landing during the run are left to the next one.
+        """
+
+        if p_task_config.incremental is None:
+            return None
+
+        lookback: int = p_task_config.incremental["lookback"]
+        stored_watermarks: Dict[str, Optional[str]] = HelperWatermark.__get_stored_watermarks(p_task_config)
+
+        window_configs: Dict[str, dict] = {"src": p_task_config.src_config, "tgt": p_task_config.tgt_config}
+        high_watermarks: Dict[str, Optional[str]] = {"src": None, "tgt": None}
+
+        for prefix, table_config in tuple(window_configs.items()):
+
+            watermark_column: Optional[str] = table_config.get(f"{prefix}_watermark_column")
+
+            if table_config.get(f"{prefix}_dbtype") is None or not watermark_column:
+                continue
+
+            f_database: FDatabase = FDatabase(table_config[f"{prefix}_dbtype"])
+
+            table_args: Tuple[Optional[str], str, Optional[str]] = (
+                table_config[f"{prefix}_schema"], table_config[f"{prefix}_table"], table_config[f"{prefix}_query"]
+            )
+
+            high_watermarks[prefix] = f_database.get_max_watermark(table_config[f"{prefix}_dbname"], *table_args, watermark_column)
+            low_watermark: Optional[str] = HelperWatermark.__apply_lookback(stored_watermarks[prefix], lookback)
+
+            logger.info(f"Incremental {prefix} window on '{watermark_column}': ({low_watermark}, {high_watermarks[prefix]}].")
+
+            window_configs[prefix] = {
+                **table_config,
+                f"{prefix}_query": f_database.prepare_window_query(*table_args, watermark_column, low_watermark, high_watermarks[prefix])
+            }
+
+        return HelperWatermark.WatermarkWindow(
+            src_config = window_configs["src"],
+            tgt_config = window_configs["tgt"],
+            high_watermarks = high_watermarks
+        )
+
+
+    @staticmethod
+    def save_window(p_task_batch_id: str, p_task_config: TaskConfigModel, p_watermark_window: Optional[namedtuple]) -> None:
+
+        """
+        Stores the high watermarks of a successfully validated window, keeping the stored watermark of a table without rows.
+        """
+
+        if p_watermark_window is None:
+            return
+
+        with ConstUtil.PRCS_DB_ENGINE.begin() as connection:
+
+            connection.execute(
+                text(f"""
+                    INSERT INTO {ConstUtil.PRCS_DB_SCHEMA}.{ConstUtil.PRCS_TASK_WATERMARK_TBL_NAME} AS watermark
+                        (job_id, task_id, src_watermark, tgt_watermark, batch_id, dw_updated_ts)
+                    VALUES
+                        (:job_id, :task_id, :src_watermark, :tgt_watermark, :batch_id, :dw_updated_ts)
+                    ON CONFLICT (job_id, task_id) DO UPDATE
+                    SET
+                        src_watermark = COALESCE(EXCLUDED.src_watermark, watermark.src_watermark),
+                        tgt_watermark = COALESCE(EXCLUDED.tgt_watermark, watermark.tgt_watermark),
+                        batch_id = EXCLUDED.batch_id,
+                        dw_updated_ts = EXCLUDED.dw_updated_ts
+                    ;
+                """),
+                {
+                    "job_id": p_task_config.job_id,
+                    "task_id": p_task_config.task_id,
+                    "src_watermark": p_watermark_window.high_watermarks["src"],
+                    "tgt_watermark": p_watermark_window.high_watermarks["tgt"],
+                    "batch_id": p_task_batch_id,
+                    "dw_updated_ts": DtUtil.get_current_ist_datetime()
+                }
+            )
+
+        logger.info(f"Task watermarks advanced to {p_watermark_window.high_watermarks}.")
@@ -4,9 +4,13 @@
 
 import json
 import logging
+import threading
 import pandas as pd
-from typing import List
+from enum import Enum
+from sqlalchemy import text
 from datetime import datetime
+from contextlib import contextmanager
+from typing import Final, Iterator, List
 from dependencies.utilities.df_util import DfUtil
 from dependencies.utilities.dt_util import DtUtil
 from dependencies.utilities.const_util import ConstUtil
@@ -27,6 +31,29 @@ class LogAuditorJob:
     A class to handle reading and validating log from a database.
     """
 
+    # Class Private Variables
+    __UPDATABLE_COLUMNS: Final[List[str]] = [
+        "job_status", "validation_status", "fail_fast", "is_restart", "job_exception_type", "job_exception_message"
+    ]
+
+    # Coalesce blocks only buffer the updates of their own thread, task threads keep writing right away
+    __COALESCE_STATE: Final[threading.local] = threading.local()
+
+
+    @classmethod
+    def __get_coalesce_state(cls) -> threading.local:
+
+        """
+        Returns the coalesce nesting depth and buffered updates of the current thread.
+        """
+
+        if not hasattr(cls.__COALESCE_STATE, "depth"):
+            cls.__COALESCE_STATE.depth = 0
+            cls.__COALESCE_STATE.pending_values = {}
+
+        return cls.__COALESCE_STATE
+
+
     @classmethod
     def initialize(cls, p_job_config: JobConfigModel) -> str:
 
@@ -106,29 +133,91 @@ class LogAuditorJob:
         
         """
         Updates the job log entry corresponding to the current batch ID with the provided fields.
+            Within a `coalesce` block, the fields are buffered and written in a single update when the block exits.
         """
 
         # Reserved columns that are either auto-handled or should not be overridden
         reserved_columns: List[str] = ["batch_id", "dw_updated_ts"]
 
-        # Build SQL SET clause for user-provided fields (excluding reserved columns)
-        set_clause = ",\n                    ".join(
-            f"{column} = '{value}'"
+        unknown_columns: List[str] = [
+            column for column in kwargs if column not in cls.__UPDATABLE_COLUMNS and column not in reserved_columns
+        ]
+
+        if unknown_columns:
+            raise ValueError(f"Unsupported job log columns: {unknown_columns}, supported columns: {', '.join(cls.__UPDATABLE_COLUMNS)}.")
+
+        column_values: dict = {
+            column: str(value) if isinstance(value, Enum) else value
             for column, value in kwargs.items()
             if column not in reserved_columns
-        )
-        
-        ConstUtil.PRCS_DB_INSTANCE.execute_query(
-            p_dbname = ConstUtil.PRCS_DB_NAME,
-            p_query  = f"""
-                UPDATE {ConstUtil.PRCS_DB_SCHEMA}.{ConstUtil.PRCS_JOB_LOG_TBL_NAME}
-                SET
-                    dw_updated_ts = '{DtUtil.get_current_ist_datetime()}'{',' if set_clause else ''}
-                    {set_clause}
-                WHERE batch_id  = '{cls.__job_batch_id}'
-                ;
-            """
-        )
+        }
+
+        coalesce_state: threading.local = cls.__get_coalesce_state()
+
+        if coalesce_state.depth:
+
+            coalesce_state.pending_values.update(column_values)
+
+            logger.info(f"Job log update buffered with the values {kwargs}.")
+
+            return
+
+        cls.__write_log(column_values)
 
         logger.info(f"Job log updated with the values {kwargs}.")
 
+
+    @classmethod
+    def __write_log(cls, p_column_values: dict) -> None:
+
+        """
+        Writes the provided fields to the job log entry of the current batch ID with a parameterized update,
+            on a pooled connection of the process database.
+        """
+
+        # Column names come from the supported columns, only values are bound
+        set_clause: str = "".join(f",\n                    {column} = :{column}" for column in p_column_values)
+
+        with ConstUtil.PRCS_DB_ENGINE.begin() as connection:
+
+            connection.execute(
+                text(f"""
+                    UPDATE {ConstUtil.PRCS_DB_SCHEMA}.{ConstUtil.PRCS_JOB_LOG_TBL_NAME}
+                    SET
+                        dw_updated_ts = :dw_updated_ts{set_clause}
+                    WHERE batch_id = :batch_id
+                    ;
+                """),
+                {**p_column_values, "dw_updated_ts": DtUtil.get_current_ist_datetime(), "batch_id": cls.__job_batch_id}
+            )
+
+
+    @classmethod
+    @contextmanager
+    def coalesce(cls) -> Iterator[None]:
+
+        """
+        Context manager buffering the job log updates issued within the block, later values overriding earlier ones,
+            and writing them in a single round trip when the block exits, even on error.
+            Only the updates issued by the thread of the block are buffered.
+        """
+
+        coalesce_state: threading.local = cls.__get_coalesce_state()
+        coalesce_state.depth += 1
+
+        try:
+            yield
+
+        finally:
+
+            coalesce_state.depth -= 1
+
+            if not coalesce_state.depth and coalesce_state.pending_values:
+
+                pending_values: dict = coalesce_state.pending_values.copy()
+                coalesce_state.pending_values.clear()
+
+                cls.__write_log(pending_values)
+
+                logger.info(f"Job log updated with the buffered values {pending_values}.")
+
@@ -7,6 +7,8 @@ import logging
 import pandas as pd
 from datetime import datetime
 from typing import List, Optional
+from collections import namedtuple
+from sqlalchemy import bindparam, text
 from dependencies.utilities.df_util import DfUtil
 from sqlalchemy.dialects.postgresql import ARRAY, JSON
 from dependencies.utilities.const_util import ConstUtil
@@ -50,10 +52,11 @@ class LogAuditorTask:
         return self.__task_batch_id
 
     
-    def create_log(self, p_start_datetime: datetime, p_end_datetime: Optional[datetime] = None, p_validation_results: Optional[ValidationResultsModel] = None) -> None:
+    def create_log(self, p_start_datetime: datetime, p_end_datetime: Optional[datetime] = None, p_validation_results: Optional[ValidationResultsModel] = None, p_cache_key: Optional[namedtuple] = None, p_origin_batch_id: Optional[str] = None) -> TaskStatusEnum:
         
         """
-        Inserts a task trigger log entry into the data quality task log table.
+        Inserts a task trigger log entry into the data quality task log table and returns the logged task status.
+            Results answered from the result cache reference the batch which originally computed them.
         """
 
         task_log_status: TaskStatusEnum = (
@@ -76,7 +79,11 @@ class LogAuditorTask:
                 "task_results": task_log_results,
                 "config_passed": json.dumps(self.__task_config.model_dump(), default = str),
                 "start_time": p_start_datetime,
-                "end_time": p_end_datetime or p_start_datetime
+                "end_time": p_end_datetime or p_start_datetime,
+                "origin_batch_id": p_origin_batch_id,
+                "config_hash": p_cache_key.config_hash if p_cache_key else None,
+                "data_fingerprint": p_cache_key.data_fingerprint if p_cache_key else None,
+                "is_cached": p_origin_batch_id is not None
             }
         ])
 
@@ -90,4 +97,48 @@ class LogAuditorTask:
             }
         )   
 
-        logger.info(f"Task log inserted with the values {{'task_status': {task_log_status}}} along with other parameters.")
\ No newline at end of file
+        logger.info(f"Task log inserted with the values {{'task_status': {task_log_status}, 'is_cached': {p_origin_batch_id is not None}}} along with other parameters.")
+
+        return task_log_status
+
+
+    @staticmethod
+    def carry_forward_logs(p_job_batch_id: str, p_previous_job_batch_id: str, p_task_ids: List[int]) -> None:
+
+        """
+        Copies the task log rows of a previous job batch into the given job batch, for the given task IDs.
+            Copied rows reference the batch which originally executed the task through `origin_batch_id`.
+            Batch IDs and task IDs are bound as parameters, on a pooled connection of the process database.
+        """
+
+        if not p_task_ids:
+            return
+
+        task_batch_id_pattern: str = p_previous_job_batch_id.replace("_", r"\_") + r"\_%"
+
+        carry_forward_query = text(f"""
+            INSERT INTO {ConstUtil.PRCS_DB_SCHEMA}.{ConstUtil.PRCS_TASK_LOG_TBL_NAME} (
+                batch_id, task_id, task_name, task_rule, task_status, task_results, config_passed, start_time, end_time,
+                origin_batch_id, config_hash, data_fingerprint, is_cached
+            )
+            SELECT
+                :job_batch_id || '_' || task_id, task_id, task_name, task_rule, task_status, task_results, config_passed, start_time, end_time,
+                COALESCE(origin_batch_id, batch_id), config_hash, data_fingerprint, is_cached
+            FROM {ConstUtil.PRCS_DB_SCHEMA}.{ConstUtil.PRCS_TASK_LOG_TBL_NAME}
+            WHERE batch_id LIKE :task_batch_id_pattern
+              AND task_id IN :task_ids
+            ;
+        """).bindparams(bindparam("task_ids", expanding = True))
+
+        with ConstUtil.PRCS_DB_ENGINE.begin() as connection:
+
+            connection.execute(
+                carry_forward_query,
+                {
+                    "job_batch_id": p_job_batch_id,
+                    "task_batch_id_pattern": task_batch_id_pattern,
+                    "task_ids": list(p_task_ids)
+                }
+            )
+
+        logger.info(f"Task logs carried forward from Job Batch ID '{p_previous_job_batch_id}' for task ids: {p_task_ids}")
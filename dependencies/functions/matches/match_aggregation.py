@@ -4,12 +4,14 @@
 
 import logging
 import pandas as pd
-from typing import List, Optional
+from collections import namedtuple
 import great_expectations.expectations as gxe
 from dependencies.utilities.df_util import DfUtil
+from typing import Dict, Final, List, Optional, Tuple
 from dependencies.entities.factories.f_database import FDatabase
 from dependencies.entities.interfaces.i_database import IDatabase
 from dependencies.entities.interfaces.i_diagnose import IDiagnose
+from dependencies.entities.models.process_enum import ReadModeEnum
 from dependencies.entities.classes.expectations.df_expectation import DfExpectation
 from great_expectations.core.expectation_validation_result import ExpectationSuiteValidationResult
 
@@ -22,18 +24,32 @@ logger = logging.getLogger(__name__)
 
 
 class MatchAggregation(IDiagnose):
-        
+
+    CPU_BOUND: bool = True
+
+    # Aggregation methods which can be combined from per chunk partial aggregates
+    __PARTIAL_AGG_METHODS: Final[Dict[str, Tuple[str, ...]]] = {
+        "sum": ("sum",),
+        "count": ("count",),
+        "size": ("size",),
+        "min": ("min",),
+        "max": ("max",),
+        "mean": ("sum", "count")
+    }
+
 
     @classmethod
-    def __prepare_df(cls, p_dbtype: str, p_dbname: str, p_schema: Optional[str], p_table: str, p_query: Optional[str]) -> pd.DataFrame:
+    def __prepare_df(cls, p_dbtype: str, p_dbname: str, p_schema: Optional[str], p_table: str, p_query: Optional[str], p_columns: Optional[List[str]] = None, p_read_mode: Optional[ReadModeEnum] = None) -> pd.DataFrame:
 
-        """Prepares a dataframe by querying a database table."""
+        """Prepares a dataframe by querying the provided columns of a database table."""
 
         f_database: IDatabase = FDatabase(p_dbtype)
 
         return DfUtil.read_sql(
-            p_query = f_database.prepare_read_query(p_schema, p_table, p_query),
-            p_engine = f_database.make_connection(p_dbname).engine
+            p_query = f_database.prepare_read_query(p_schema, p_table, p_query, p_columns),
+            p_engine = f_database.make_connection(p_dbname, p_read_only = True).engine,
+            p_read_mode = p_read_mode,
+            p_use_snapshot = True
         )
 
 
@@ -49,6 +65,66 @@ class MatchAggregation(IDiagnose):
         return agg_df.reset_index()
 
 
+    @classmethod
+    def __prepare_agg_df(cls, p_dbtype: str, p_dbname: str, p_schema: Optional[str], p_table: str, p_query: Optional[str], p_group_columns: List[str], p_agg_column: str, p_agg_method: str, p_read_mode: Optional[ReadModeEnum] = None) -> namedtuple:
+
+        """
+        Prepares an aggregated dataframe of a database table along with its observed row count.
+            Decomposable aggregation methods are computed chunk by chunk over a streamed read, keeping memory bounded
+            by the chunk size and the number of groups, other methods and the `ARROW` read mode aggregate the fully read table.
+        """
+
+        AggInfo = namedtuple("AggInfo", ["df", "observed_count"])
+
+        # Only the group and aggregated columns are fetched
+        columns: List[str] = list(dict.fromkeys([*p_group_columns, p_agg_column]))
+
+        if p_agg_method not in cls.__PARTIAL_AGG_METHODS or DfUtil.resolve_read_mode(p_read_mode) == ReadModeEnum.ARROW:
+
+            df: pd.DataFrame = cls.__prepare_df(p_dbtype, p_dbname, p_schema, p_table, p_query, columns, p_read_mode)
+
+            return AggInfo(df = cls.__aggregate_df(df, p_group_columns, p_agg_column, p_agg_method), observed_count = df.shape[0])
+
+        f_database: IDatabase = FDatabase(p_dbtype)
+
+        observed_count: int = 0
+        partial_agg_dfs: List[pd.DataFrame] = []
+
+        for df_chunk in DfUtil.read_sql_chunks(
+            p_query = f_database.prepare_read_query(p_schema, p_table, p_query, columns),
+            p_engine = f_database.make_connection(p_dbname, p_read_only = True).engine,
+            p_read_mode = p_read_mode,
+            p_use_snapshot = True
+        ):
+
+            observed_count += df_chunk.shape[0]
+
+            partial_agg_dfs.append(
+                df_chunk.groupby(p_group_columns, dropna = True).agg(**{
+                    f"partial_{partial_method}": (p_agg_column, partial_method) for partial_method in cls.__PARTIAL_AGG_METHODS[p_agg_method]
+                })
+            )
+
+        if not partial_agg_dfs:
+
+            # Keep the column layout of an aggregated empty table
+            return AggInfo(df = pd.DataFrame(columns = [*p_group_columns, "agg_value"]), observed_count = 0)
+
+        # Combine the partial aggregates of every chunk: counts add up, sums add up, minimums and maximums stay extreme
+        combined_agg_df: pd.DataFrame = pd.concat(partial_agg_dfs).groupby(level = p_group_columns, dropna = True).agg({
+            f"partial_{partial_method}": "sum" if partial_method in ("sum", "count", "size") else partial_method
+            for partial_method in cls.__PARTIAL_AGG_METHODS[p_agg_method]
+        })
+
+        if p_agg_method == "mean":
+            combined_agg_df["agg_value"] = combined_agg_df["partial_sum"] / combined_agg_df["partial_count"]
+
+        else:
+            combined_agg_df["agg_value"] = combined_agg_df[f"partial_{p_agg_method}"]
+
+        return AggInfo(df = combined_agg_df[["agg_value"]].reset_index(), observed_count = observed_count)
+
+
     @classmethod
     def evaluate(cls, p_task_name: str, p_src_config: dict, p_tgt_config: dict, p_task_parameter: dict) -> dict:
 
@@ -75,14 +151,18 @@ class MatchAggregation(IDiagnose):
         inp_tgt_agg_method: str = p_task_parameter["tgt_agg_method"]
 
 
-        # Load source and target data
-        src_df: pd.DataFrame = cls.__prepare_df(inp_src_dbtype, inp_src_dbname, inp_src_schema, inp_src_table, inp_src_table_query)
-        tgt_df: pd.DataFrame = cls.__prepare_df(inp_tgt_dbtype, inp_tgt_dbname, inp_tgt_schema, inp_tgt_table, inp_tgt_table_query)
-
+        # Load and aggregate source and target data
+        src_agg_info: namedtuple = cls.__prepare_agg_df(
+            inp_src_dbtype, inp_src_dbname, inp_src_schema, inp_src_table, inp_src_table_query, inp_src_group_columns, inp_src_agg_column, inp_src_agg_method,
+            DfUtil.resolve_read_mode(p_src_config.get("src_read_mode"))
+        )
+        tgt_agg_info: namedtuple = cls.__prepare_agg_df(
+            inp_tgt_dbtype, inp_tgt_dbname, inp_tgt_schema, inp_tgt_table, inp_tgt_table_query, inp_tgt_group_columns, inp_tgt_agg_column, inp_tgt_agg_method,
+            DfUtil.resolve_read_mode(p_tgt_config.get("tgt_read_mode"))
+        )
 
-        # Aggregate data
-        src_agg_df: pd.DataFrame = cls.__aggregate_df(src_df, inp_src_group_columns, inp_src_agg_column, inp_src_agg_method)
-        tgt_agg_df: pd.DataFrame = cls.__aggregate_df(tgt_df, inp_tgt_group_columns, inp_tgt_agg_column, inp_tgt_agg_method)
+        src_agg_df: pd.DataFrame = src_agg_info.df
+        tgt_agg_df: pd.DataFrame = tgt_agg_info.df
 
 
         # Merge source and target data on group columns
@@ -125,9 +205,9 @@ class MatchAggregation(IDiagnose):
                 {
                     "success": _result["success"],
                     "result": {
-                        "observed_source_count": src_df.shape[0],
+                        "observed_source_count": src_agg_info.observed_count,
                         "aggregated_source_count": src_agg_df.shape[0],
-                        "observed_target_count": tgt_df.shape[0],
+                        "observed_target_count": tgt_agg_info.observed_count,
                         "aggregated_target_count": tgt_agg_df.shape[0],
                         "observed_join_count": joined_df.shape[0],
                         "mismatch_count": _result["result"]["observed_value"]
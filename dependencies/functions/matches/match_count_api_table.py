@@ -2,8 +2,10 @@
 # Packages                                          #
 #####################################################
 
+import asyncio
 import requests
 from typing import Any, Optional
+from requests.auth import HTTPBasicAuth
 from sqlalchemy.engine.base import Engine
 import great_expectations.expectations as gxe
 from dependencies.utilities.js_util import JsUtil
@@ -11,7 +13,6 @@ from dependencies.utilities.df_util import DfUtil
 from dependencies.entities.factories.f_request import FApiAuth
 from dependencies.entities.factories.f_database import FDatabase
 from dependencies.entities.interfaces.i_diagnose import IDiagnose
-from dependencies.entities.interfaces.i_request import IRequestAuth
 from dependencies.entities.classes.expectations.sql_expectation import SqlExpectation
 from great_expectations.core.expectation_validation_result import ExpectationSuiteValidationResult
 
@@ -40,6 +41,21 @@ class MatchCountApiTable(IDiagnose):
         )
     
 
+    @classmethod
+    def __extract_api_data(cls, p_data: Any, p_task_parameter: dict) -> Any:
+
+        """Returns the part of the API response holding the records to be counted."""
+
+        if isinstance(p_data, dict):
+            
+            return JsUtil.drill_down_dict(
+                p_object = p_data,
+                p_nested_keys = p_task_parameter["api_response_path"].split(".")
+            )
+        
+        return p_data
+    
+
     @classmethod
     def evaluate(cls, p_task_name: str, p_src_config: dict, p_tgt_config: dict, p_task_parameter: dict) -> dict:
 
@@ -47,11 +63,7 @@ class MatchCountApiTable(IDiagnose):
         
 
         # Sets up API authentication parameters
-        auth_instance: IRequestAuth = FApiAuth().get_auth_instance(p_auth_key = p_src_config["src_auth_key"])
-        
-        get_config: dict = auth_instance.get_config(
-            auth_key = p_src_config["src_auth_key"]
-        )
+        get_config: dict = FApiAuth.get_auth_config(p_auth_key = p_src_config["src_auth_key"])
 
 
         # Make source API request
@@ -60,19 +72,22 @@ class MatchCountApiTable(IDiagnose):
             **get_config
         )
 
+        # A token may be revoked before its expiry, retry once with a new one
+        if response.status_code == 401:
+
+            FApiAuth.invalidate_auth_config(p_auth_key = p_src_config["src_auth_key"])
+
+            response = requests.get(
+                url = p_src_config["src_base_url"],
+                **FApiAuth.get_auth_config(p_auth_key = p_src_config["src_auth_key"])
+            )
+
         response.raise_for_status()
         data = response.json()
 
 
         # Process API response
-        if isinstance(data, dict):
-            
-            data: Any = JsUtil.drill_down_dict(
-                p_object = data,
-                p_nested_keys = p_task_parameter["api_response_path"].split(".")
-            )
-
-        src_api_observed_count: int = cls.__extract_api_count(data)
+        src_api_observed_count: int = cls.__extract_api_count(cls.__extract_api_data(data, p_task_parameter))
 
         # Initiate validation
         tgt_validation_engine: SqlExpectation = SqlExpectation(
@@ -107,4 +122,71 @@ class MatchCountApiTable(IDiagnose):
             ]
         }
 
-        return validation_result_output
\ No newline at end of file
+        return validation_result_output
+    
+
+    @classmethod
+    async def evaluate_async(cls, p_task_name: str, p_src_config: dict, p_tgt_config: dict, p_task_parameter: dict) -> dict:
+
+        """Executes validation by comparing row counts between a source api and a target database table, requesting both concurrently."""
+
+        # Optional dependency, only required by the asyncio execution mode
+        import aiohttp
+
+        async def _request_api() -> Any:
+
+            async with aiohttp.ClientSession() as session:
+
+                # A token may be revoked before its expiry, retry once with a new one
+                for attempt in range(2):
+
+                    # Sets up API authentication parameters
+                    get_config: dict = await asyncio.to_thread(FApiAuth.get_auth_config, p_auth_key = p_src_config["src_auth_key"])
+
+                    basic_auth: Optional[HTTPBasicAuth] = get_config.get("auth")
+
+                    async with session.get(
+                        url = p_src_config["src_base_url"],
+                        headers = get_config.get("headers"),
+                        auth = aiohttp.BasicAuth(basic_auth.username, basic_auth.password) if basic_auth else None
+                    ) as response:
+
+                        if response.status == 401 and not attempt:
+                            await asyncio.to_thread(FApiAuth.invalidate_auth_config, p_auth_key = p_src_config["src_auth_key"])
+                            continue
+
+                        response.raise_for_status()
+
+                        return await response.json(content_type = None)
+                
+
+        # Make source API request and count target rows concurrently
+        data, tgt_table_observed_count = await asyncio.gather(
+            _request_api(),
+            FDatabase(p_tgt_config["tgt_dbtype"]).count_rows_async(
+                p_dbname = p_tgt_config["tgt_dbname"],
+                p_schema = p_tgt_config["tgt_schema"],
+                p_table  = p_tgt_config["tgt_table"],
+                p_query  = p_tgt_config["tgt_query"]
+            )
+        )
+
+        # Process API response
+        src_api_observed_count: int = cls.__extract_api_count(cls.__extract_api_data(data, p_task_parameter))
+
+        validation_success: bool = src_api_observed_count == tgt_table_observed_count
+
+        validation_result_output: dict = {
+            "success": validation_success,
+            "results": [
+                {
+                    "success": validation_success,
+                    "result": {
+                        "observed_source_value": src_api_observed_count,
+                        "observed_target_value": tgt_table_observed_count
+                    }
+                }
+            ]
+        }
+
+        return validation_result_output
@@ -2,6 +2,7 @@
 # Packages                                          #
 #####################################################
 
+import asyncio
 import requests
 from typing import List
 from sqlalchemy.engine.base import Engine
@@ -81,4 +82,42 @@ class MatchCountTables(IDiagnose):
             ]
         }
 
-        return validation_result_output
\ No newline at end of file
+        return validation_result_output
+    
+
+    @classmethod
+    async def evaluate_async(cls, p_task_name: str, p_src_config: dict, p_tgt_config: dict, p_task_parameter: dict) -> dict:
+
+        """Executes validation by comparing row counts between a source and a target database table, counting both concurrently."""
+
+        src_table_observed_count, tgt_table_observed_count = await asyncio.gather(
+            FDatabase(p_src_config["src_dbtype"]).count_rows_async(
+                p_dbname = p_src_config["src_dbname"],
+                p_schema = p_src_config["src_schema"],
+                p_table  = p_src_config["src_table"],
+                p_query  = p_src_config["src_query"]
+            ),
+            FDatabase(p_tgt_config["tgt_dbtype"]).count_rows_async(
+                p_dbname = p_tgt_config["tgt_dbname"],
+                p_schema = p_tgt_config["tgt_schema"],
+                p_table  = p_tgt_config["tgt_table"],
+                p_query  = p_tgt_config["tgt_query"]
+            )
+        )
+
+        validation_success: bool = src_table_observed_count == tgt_table_observed_count
+
+        validation_result_output: dict = {
+            "success": validation_success,
+            "results": [
+                {
+                    "success": validation_success,
+                    "result": {
+                        "observed_source_value": src_table_observed_count,
+                        "observed_target_value": tgt_table_observed_count
+                    }
+                }
+            ]
+        }
+
+        return validation_result_output
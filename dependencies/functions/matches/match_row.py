@@ -4,12 +4,15 @@
 
 import logging
 import pandas as pd
-from typing import List, Optional
+from collections import namedtuple
+from typing import List, Optional, Tuple
+from sqlalchemy.engine.base import Engine
 import great_expectations.expectations as gxe
 from dependencies.utilities.df_util import DfUtil
 from dependencies.entities.factories.f_database import FDatabase
 from dependencies.entities.interfaces.i_database import IDatabase
 from dependencies.entities.interfaces.i_diagnose import IDiagnose
+from dependencies.entities.models.process_enum import CompareModeEnum, ReadModeEnum
 from dependencies.entities.classes.expectations.df_expectation import DfExpectation
 from great_expectations.core.expectation_validation_result import ExpectationSuiteValidationResult
 
@@ -22,26 +25,213 @@ logger = logging.getLogger(__name__)
 
 
 class MatchRow(IDiagnose):
-    
+
+    CPU_BOUND: bool = True
+
+    TableRead = namedtuple("TableRead", ["query", "engine", "columns"])
+    ChecksumWindow = namedtuple("ChecksumWindow", ["buckets", "source_count", "target_count", "matched_count"])
+
+    # Class Private Variables
+    __DETAIL_KEY_LIMIT: int = 100
+
+    # Buckets of the partitioned comparison when a spill directory is configured without `partitions`,
+    # as the whole table comparison builds in-memory string copies of both tables
+    __DEFAULT_SPILL_PARTITIONS: int = 16
+
+    # Checksum buckets are subdivided 256-way per level, until the mismatched buckets are small enough to be read
+    __CHECKSUM_LEVEL_DIGITS: int = 2
+    __CHECKSUM_MAX_DIGITS: int = 8
+    __CHECKSUM_MAX_BUCKETS: int = 4_096
+    __CHECKSUM_LEAF_ROWS: int = 100_000
+
 
     @classmethod
-    def __prepare_df(cls, p_dbtype: str, p_dbname: str, p_schema: Optional[str], p_table: str, p_query: Optional[str], p_primary_cols: List[str]) -> pd.DataFrame:
+    def __prepare_read(cls, p_dbtype: str, p_dbname: str, p_schema: Optional[str], p_table: str, p_query: Optional[str], p_primary_cols: List[str], p_ignore_cols: Optional[List[str]] = None, p_compare_mode: CompareModeEnum = CompareModeEnum.ROW, p_buckets: Optional[List[str]] = None) -> namedtuple:
 
-        """Prepares a dataframe by querying a database table."""
+        """
+        Prepares the read of a database table, leaving out the ignored columns: the read query, the read-only engine to run it on
+            and the read columns, if they had to be listed. With the `HASH` and `CHECKSUM` compare modes, the query reads
+            the primary columns and a hash of the other columns computed by the database, restricted to the given checksum buckets if any,
+            or is None if the database can't hash rows.
+        """
 
         f_database: IDatabase = FDatabase(p_dbtype)
 
-        f_df: pd.DataFrame = DfUtil.read_sql(
-            p_query = f_database.prepare_read_query(p_schema, p_table, p_query),
-            p_engine = f_database.make_connection(p_dbname).engine
+        columns: Optional[List[str]] = (
+            [column for column in f_database.get_columns(p_dbname, p_schema, p_table, p_query) if column not in (p_ignore_cols or [])]
+                if p_ignore_cols or p_compare_mode != CompareModeEnum.ROW else None
         )
 
+        read_engine: Engine = f_database.make_connection(p_dbname, p_read_only = True).engine
+
+        if p_compare_mode != CompareModeEnum.ROW:
+
+            # Hashed columns are sorted, so that both tables hash them in the same order
+            column_types: dict = f_database.get_column_types(p_dbname, p_schema, p_table, p_query)
+            hash_columns: dict = {column: column_types.get(column) for column in sorted(columns) if column not in p_primary_cols}
+
+            bucket_filter: Optional[str] = (
+                f_database.prepare_bucket_filter({column: column_types.get(column) for column in p_primary_cols}, p_buckets)
+                    if p_buckets is not None else None
+            )
+
+            return cls.TableRead(f_database.prepare_row_hash_query(p_schema, p_table, p_query, p_primary_cols, hash_columns, bucket_filter), read_engine, columns)
+
+        return cls.TableRead(f_database.prepare_read_query(p_schema, p_table, p_query, columns), read_engine, columns)
+
+
+    @classmethod
+    def __prepare_checksum_df(cls, p_dbtype: str, p_dbname: str, p_schema: Optional[str], p_table: str, p_query: Optional[str], p_columns: List[str], p_primary_cols: List[str], p_digits: int, p_buckets: Optional[List[str]]) -> Optional[pd.DataFrame]:
+
+        """
+        Prepares a dataframe of the row counts and checksums of the key hash buckets of a database table, of the given number of digits,
+            within the given parent buckets if any. Returns None if the database can't checksum rows.
+        """
+
+        f_database: IDatabase = FDatabase(p_dbtype)
+
+        column_types: dict = f_database.get_column_types(p_dbname, p_schema, p_table, p_query)
+        key_columns: dict = {column: column_types.get(column) for column in p_primary_cols}
+
+        checksum_query: Optional[str] = f_database.prepare_checksum_query(
+            p_schema, p_table, p_query, key_columns, {column: column_types.get(column) for column in sorted(p_columns)}, p_digits,
+            f_database.prepare_bucket_filter(key_columns, p_buckets) if p_buckets is not None else None
+        )
+
+        if checksum_query is None:
+            return None
+
+        # Checksums are exact decimals, which must not be read as floats
+        checksum_df: pd.DataFrame = DfUtil.read_sql(
+            p_query = checksum_query, p_engine = f_database.make_connection(p_dbname, p_read_only = True).engine, p_read_mode = ReadModeEnum.CURSOR
+        )
+
+        return checksum_df.astype({"bucket": str, "row_count": int, "checksum": str})
+
+
+    @classmethod
+    def __reconcile_checksums(cls, p_src_table_args: tuple, p_tgt_table_args: tuple, p_src_columns: List[str], p_tgt_columns: List[str], p_primary_cols: List[str]) -> Optional[namedtuple]:
+
+        """
+        Compares the checksums of the key hash buckets of the source and target tables, subdividing only the mismatched buckets
+            level after level, and returns the leaf buckets left to compare row by row, along with the row counts of both tables
+            and the count of rows in matching buckets. Returns None if any of the databases can't checksum rows.
+        """
+
+        digits: int = 0
+        buckets: Optional[List[str]] = None
+
+        while True:
+
+            digits += cls.__CHECKSUM_LEVEL_DIGITS
+
+            src_checksum_df: Optional[pd.DataFrame] = cls.__prepare_checksum_df(*p_src_table_args, p_src_columns, p_primary_cols, digits, buckets)
+            tgt_checksum_df: Optional[pd.DataFrame] = cls.__prepare_checksum_df(*p_tgt_table_args, p_tgt_columns, p_primary_cols, digits, buckets)
+
+            if src_checksum_df is None or tgt_checksum_df is None:
+                return None
+
+            if buckets is None:
+                source_count, target_count = int(src_checksum_df["row_count"].sum()), int(tgt_checksum_df["row_count"].sum())
+
+            joined_checksum_df: pd.DataFrame = src_checksum_df.merge(tgt_checksum_df, on = "bucket", how = "outer", suffixes = ("_src", "_tgt"))
+
+            mismatch_checksum_df: pd.DataFrame = joined_checksum_df[
+                (joined_checksum_df["row_count_src"] != joined_checksum_df["row_count_tgt"])
+                    | (joined_checksum_df["checksum_src"] != joined_checksum_df["checksum_tgt"])
+            ]
+
+            buckets = sorted(mismatch_checksum_df["bucket"])
+            mismatch_source_count: int = int(mismatch_checksum_df["row_count_src"].fillna(0).sum())
+            mismatch_target_count: int = int(mismatch_checksum_df["row_count_tgt"].fillna(0).sum())
+
+            logger.info(f"Checksum buckets of {digits} digits: {len(buckets)} of {joined_checksum_df.shape[0]} mismatched, over {mismatch_source_count} source and {mismatch_target_count} target rows.")
+
+            if (
+                not buckets
+                    or max(mismatch_source_count, mismatch_target_count) <= cls.__CHECKSUM_LEAF_ROWS
+                    or digits + cls.__CHECKSUM_LEVEL_DIGITS > cls.__CHECKSUM_MAX_DIGITS
+                    or len(buckets) * 16 ** cls.__CHECKSUM_LEVEL_DIGITS > cls.__CHECKSUM_MAX_BUCKETS
+            ):
+                break
+
+        return cls.ChecksumWindow(
+            buckets = buckets,
+            source_count = source_count,
+            target_count = target_count,
+            matched_count = source_count - mismatch_source_count
+        )
+
+
+    @classmethod
+    def __prepare_df(cls, p_table_read: namedtuple, p_primary_cols: List[str], p_read_mode: Optional[ReadModeEnum] = None) -> pd.DataFrame:
+
+        """
+        Prepares a dataframe by running a prepared table read.
+        """
+
+        f_df: pd.DataFrame = DfUtil.read_sql(p_query = p_table_read.query, p_engine = p_table_read.engine, p_read_mode = p_read_mode, p_use_snapshot = True)
+
         # Validate DataFrame
         DfUtil.find_duplicate_records(p_df = f_df, p_subset = p_primary_cols, raise_exception = True)
 
         return f_df
 
 
+    @classmethod
+    def __prepare_buckets(cls, p_table_read: namedtuple, p_primary_cols: List[str], p_partitions: int, p_read_mode: Optional[ReadModeEnum] = None) -> List[List[str]]:
+
+        """
+        Streams a prepared table read into spill store buckets hash-partitioned on the primary columns,
+            and returns the segment paths of each bucket.
+        """
+
+        return DfUtil.spill_partitioned(
+            p_df_chunks   = DfUtil.read_sql_chunks(p_query = p_table_read.query, p_engine = p_table_read.engine, p_read_mode = p_read_mode, p_use_snapshot = True),
+            p_key_columns = p_primary_cols,
+            p_partitions  = p_partitions
+        )
+
+
+    @classmethod
+    def __prepare_detail_df(cls, p_dbtype: str, p_dbname: str, p_schema: Optional[str], p_table: str, p_query: Optional[str], p_columns: Optional[List[str]], p_primary_cols: List[str], p_keys: List[tuple]) -> pd.DataFrame:
+
+        """Prepares a dataframe of the full records of the given keys of a database table."""
+
+        f_database: IDatabase = FDatabase(p_dbtype)
+
+        return DfUtil.read_sql(
+            p_query  = f_database.prepare_key_filter_query(p_schema, p_table, p_query, p_columns, p_primary_cols, p_keys),
+            p_engine = f_database.make_connection(p_dbname, p_read_only = True).engine
+        )
+
+
+    @classmethod
+    def __diff_df(cls, p_src_df: pd.DataFrame, p_tgt_df: pd.DataFrame, p_join_columns: List[str]) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+
+        """
+        Joins source and target dataframes on the join columns and returns the joined and mismatched records, as strings,
+            along with the join columns of the mismatched records, as they are.
+        """
+
+        DfUtil.have_same_columns(p_df1 = p_src_df, p_df2 = p_tgt_df, raise_exception = True)
+
+        # Merge source and target data on group columns
+        joined_df: pd.DataFrame = p_src_df.merge(
+            p_tgt_df, on = p_join_columns, how = "outer", suffixes = ("_src", "_tgt")
+        ).convert_dtypes().replace({pd.NaT: None, None: pd.NA})
+
+        joined_str_df: pd.DataFrame = joined_df.astype(str)
+
+        # Identify mismatches
+        filter_condition: bool = cls.__match_unmatched_records(
+            p_df = joined_str_df,
+            p_columns_to_be_compared = [column for column in p_src_df.columns if column not in p_join_columns]
+        )
+
+        return joined_str_df, joined_str_df[filter_condition], joined_df.loc[filter_condition, p_join_columns]
+
+
     @classmethod
     def __match_unmatched_records(cls, p_df: pd.DataFrame, p_columns_to_be_compared: List[str]) -> bool:
 
@@ -109,37 +299,124 @@ class MatchRow(IDiagnose):
         inp_tgt_table_query : Optional[str] = p_tgt_config["tgt_query"]
         
         inp_join_columns    : List[str] = p_task_parameter["join_columns"]
+        inp_ignore_columns  : Optional[List[str]] = p_task_parameter.get("ignore_columns")
+        inp_partitions      : Optional[int] = p_task_parameter.get("partitions") or (cls.__DEFAULT_SPILL_PARTITIONS if DfUtil.is_spill_enabled() else None)
+        inp_compare_mode    : CompareModeEnum = p_task_parameter.get("compare_mode") or CompareModeEnum.ROW
 
+        src_table_args: tuple = (inp_src_dbtype, inp_src_dbname, inp_src_schema, inp_src_table, inp_src_table_query)
+        tgt_table_args: tuple = (inp_tgt_dbtype, inp_tgt_dbname, inp_tgt_schema, inp_tgt_table, inp_tgt_table_query)
 
-        # Load source and target data
-        src_df: pd.DataFrame = cls.__prepare_df(inp_src_dbtype, inp_src_dbname, inp_src_schema, inp_src_table, inp_src_table_query, inp_join_columns)
-        tgt_df: pd.DataFrame = cls.__prepare_df(inp_tgt_dbtype, inp_tgt_dbname, inp_tgt_schema, inp_tgt_table, inp_tgt_table_query, inp_join_columns)
 
-        DfUtil.have_same_columns(p_df1 = src_df, p_df2 = tgt_df, raise_exception = True)
+        # Prepare source and target reads, of keys and row hashes only with the hash and checksum compare modes
+        src_read: namedtuple = cls.__prepare_read(*src_table_args, inp_join_columns, inp_ignore_columns, inp_compare_mode)
+        tgt_read: namedtuple = cls.__prepare_read(*tgt_table_args, inp_join_columns, inp_ignore_columns, inp_compare_mode)
 
+        # Rows of matching checksum buckets, which are neither read nor compared
+        matched_count: int = 0
 
-        # Merge source and target data on group columns
-        joined_df: pd.DataFrame = src_df.merge(
-            tgt_df, on = inp_join_columns, how = "outer", suffixes = ("_src", "_tgt")
-        ).convert_dtypes().replace({pd.NaT: None, None: pd.NA})
+        if inp_compare_mode != CompareModeEnum.ROW:
 
-        joined_str_df = joined_df.astype(str)
-                
+            DfUtil.have_same_columns(p_df1 = pd.DataFrame(columns = src_read.columns), p_df2 = pd.DataFrame(columns = tgt_read.columns), raise_exception = True)
 
-        # Identify mismatches
-        filter_condition: bool = cls.__match_unmatched_records(
-            p_df = joined_str_df,
-            p_columns_to_be_compared = [column for column in src_df.columns if column not in inp_join_columns]
-        )
+            if src_read.query is None or tgt_read.query is None:
+
+                logger.warning(f"Row hashing is not supported between {inp_src_dbtype} and {inp_tgt_dbtype}, rows are compared in full.")
+
+                inp_compare_mode = CompareModeEnum.ROW
+
+                src_read = cls.__prepare_read(*src_table_args, inp_join_columns, inp_ignore_columns)
+                tgt_read = cls.__prepare_read(*tgt_table_args, inp_join_columns, inp_ignore_columns)
+
+
+        if inp_compare_mode == CompareModeEnum.CHECKSUM:
+
+            checksum_window: Optional[namedtuple] = cls.__reconcile_checksums(src_table_args, tgt_table_args, src_read.columns, tgt_read.columns, inp_join_columns)
+
+            if checksum_window is None:
+                logger.warning(f"Row checksums are not supported between {inp_src_dbtype} and {inp_tgt_dbtype}, row hashes are compared in full.")
+
+            else:
+
+                # Only the rows of the mismatched leaf buckets are read, by key and row hash
+                matched_count = checksum_window.matched_count
+
+                src_read = cls.__prepare_read(*src_table_args, inp_join_columns, inp_ignore_columns, inp_compare_mode, checksum_window.buckets)
+                tgt_read = cls.__prepare_read(*tgt_table_args, inp_join_columns, inp_ignore_columns, inp_compare_mode, checksum_window.buckets)
+
+
+        if inp_partitions:
+
+            # Load source and target data into hash-partitioned buckets, so that only one bucket pair is held at a time
+            src_buckets: List[List[str]] = cls.__prepare_buckets(src_read, inp_join_columns, inp_partitions, DfUtil.resolve_read_mode(p_src_config.get("src_read_mode")))
+            tgt_buckets: List[List[str]] = cls.__prepare_buckets(tgt_read, inp_join_columns, inp_partitions, DfUtil.resolve_read_mode(p_tgt_config.get("tgt_read_mode")))
+
+            source_count, target_count, join_count = 0, 0, 0
+            mismatch_key_dfs: List[pd.DataFrame] = []
+            joined_sample_dfs: List[pd.DataFrame] = []
+            mismatch_sample_dfs: List[pd.DataFrame] = []
+
+            for bucket, (src_segment_paths, tgt_segment_paths) in enumerate(zip(src_buckets, tgt_buckets)):
+
+                src_df: pd.DataFrame = DfUtil.read_spilled(src_segment_paths)
+                tgt_df: pd.DataFrame = DfUtil.read_spilled(tgt_segment_paths)
+
+                # Validate DataFrame, duplicates of a key always share a bucket
+                DfUtil.find_duplicate_records(p_df = src_df, p_subset = inp_join_columns, raise_exception = True)
+                DfUtil.find_duplicate_records(p_df = tgt_df, p_subset = inp_join_columns, raise_exception = True)
+
+                joined_str_df, bucket_mismatch_df, bucket_mismatch_key_df = cls.__diff_df(src_df, tgt_df, inp_join_columns)
+
+                logger.debug(f"Bucket {bucket + 1}/{inp_partitions} mismatch count: {bucket_mismatch_df.shape[0]}")
+
+                source_count += src_df.shape[0]
+                target_count += tgt_df.shape[0]
+                join_count   += joined_str_df.shape[0]
+
+                # Only the keys of mismatched records are kept across buckets, along with a few sample records
+                mismatch_key_dfs.append(bucket_mismatch_key_df)
+                joined_sample_dfs.append(joined_str_df.head(5))
+                mismatch_sample_dfs.append(bucket_mismatch_df.head(5))
+
+            compared_columns: List[str] = src_df.columns
+            mismatch_df: pd.DataFrame = pd.concat(mismatch_key_dfs, ignore_index = True)
+            mismatch_key_df: pd.DataFrame = mismatch_df
+            joined_str_df: pd.DataFrame = pd.concat(joined_sample_dfs, ignore_index = True)
+            mismatch_sample_df: pd.DataFrame = pd.concat(mismatch_sample_dfs, ignore_index = True)
+
+        else:
+
+            # Load source and target data
+            src_df: pd.DataFrame = cls.__prepare_df(src_read, inp_join_columns, DfUtil.resolve_read_mode(p_src_config.get("src_read_mode")))
+            tgt_df: pd.DataFrame = cls.__prepare_df(tgt_read, inp_join_columns, DfUtil.resolve_read_mode(p_tgt_config.get("tgt_read_mode")))
+
+            joined_str_df, mismatch_df, mismatch_key_df = cls.__diff_df(src_df, tgt_df, inp_join_columns)
+
+            source_count, target_count, join_count = src_df.shape[0], tgt_df.shape[0], joined_str_df.shape[0]
+            compared_columns: List[str] = src_df.columns
+            mismatch_sample_df: pd.DataFrame = mismatch_df
+
+
+        source_count, target_count, join_count = source_count + matched_count, target_count + matched_count, join_count + matched_count
+
+
+        if inp_compare_mode != CompareModeEnum.ROW and not mismatch_key_df.empty:
+
+            # Fetch the full records of the first mismatched keys only, to report the mismatched columns
+            detail_keys: List[tuple] = list(mismatch_key_df.head(cls.__DETAIL_KEY_LIMIT).itertuples(index = False, name = None))
+
+            src_df: pd.DataFrame = cls.__prepare_detail_df(*src_table_args, src_read.columns, inp_join_columns, detail_keys)
+            tgt_df: pd.DataFrame = cls.__prepare_detail_df(*tgt_table_args, tgt_read.columns, inp_join_columns, detail_keys)
+
+            joined_str_df, mismatch_sample_df, _ = cls.__diff_df(src_df, tgt_df, inp_join_columns)
+            compared_columns: List[str] = src_df.columns
 
-        mismatch_df: pd.DataFrame = joined_str_df[filter_condition]
 
         logger.info(f"Mismatch count: {mismatch_df.shape[0]}")
 
         if not mismatch_df.empty:
 
             # Find mismatched column
-            mismatch_column_df: pd.DataFrame = cls.__fetch_unmatched_records(mismatch_df, inp_join_columns, src_df.columns)
+            mismatch_column_df: pd.DataFrame = cls.__fetch_unmatched_records(mismatch_sample_df, inp_join_columns, compared_columns)
             
             logger.info("Joined dataframe:"); DfUtil.print(DfUtil.sort_columns(joined_str_df, inp_join_columns).head(5))
             logger.info("Mismatch dataframe:"); DfUtil.print(mismatch_column_df.head(5))
@@ -168,9 +445,9 @@ class MatchRow(IDiagnose):
                 {
                     "success": _result["success"],
                     "result": {
-                        "observed_source_count": src_df.shape[0],
-                        "observed_target_count": tgt_df.shape[0],
-                        "observed_join_count": joined_df.shape[0],
+                        "observed_source_count": source_count,
+                        "observed_target_count": target_count,
+                        "observed_join_count": join_count,
                         "mismatch_count": _result["result"]["observed_value"]
                     }
                 } for _result in validation_result_object["results"]
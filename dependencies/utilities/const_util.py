@@ -29,5 +29,7 @@ class ConstUtil:
     PRCS_TASK_CONFIG_TBL_NAME: Final[str] = "v_data_quality_task_config"
     PRCS_JOB_LOG_TBL_NAME: Final[str] = "data_quality_job_log"
     PRCS_TASK_LOG_TBL_NAME: Final[str] = "data_quality_task_log"
+    PRCS_JOB_QUEUE_TBL_NAME: Final[str] = "data_quality_job_queue"
+    PRCS_TASK_WATERMARK_TBL_NAME: Final[str] = "data_quality_task_watermark"
     
     
@@ -4,7 +4,7 @@
 
 import os
 from dotenv import load_dotenv
-from typing import Optional, Literal
+from typing import List, Optional, Literal
 from dependencies.utilities.env_util import EnvUtil
 
 
@@ -43,6 +43,60 @@ class CredUtil:
             "port"    : cls.getenv(f"{p_dbtype}_PORT_{cls.__ENV}", raise_expection = False)
         }
     
+    @classmethod
+    def get_db_replica_credentials(cls, p_dbtype: str) -> List[dict]:
+        
+        replica_hosts: Optional[str] = cls.getenv(f"{p_dbtype}_REPLICA_HOST_{cls.__ENV}", raise_expection = False)
+
+        if not replica_hosts:
+            return []
+
+        return [
+            {
+                "username": cls.getenv(f"{p_dbtype}_REPLICA_USER_{cls.__ENV}", raise_expection = False) or cls.getenv(f"{p_dbtype}_USER_{cls.__ENV}"),
+                "password": cls.getenv(f"{p_dbtype}_REPLICA_PASS_{cls.__ENV}", raise_expection = False) or cls.getenv(f"{p_dbtype}_PASS_{cls.__ENV}"),
+                "hostname": replica_host.strip(),
+                "port"    : cls.getenv(f"{p_dbtype}_REPLICA_PORT_{cls.__ENV}", raise_expection = False) or cls.getenv(f"{p_dbtype}_PORT_{cls.__ENV}", raise_expection = False)
+            }
+            for replica_host in replica_hosts.split(",") if replica_host.strip()
+        ]
+    
+    @classmethod
+    def get_db_replica_config(cls, p_dbtype: str) -> dict:
+        
+        return {
+            "max_lag_seconds": cls.getenv(f"{p_dbtype}_REPLICA_MAX_LAG_SECONDS_{cls.__ENV}", raise_expection = False) or cls.getenv("DB_REPLICA_MAX_LAG_SECONDS", raise_expection = False)
+        }
+    
+    @classmethod
+    def get_db_file_credential(cls, p_dbtype: str) -> dict:
+        
+        return {
+            "username": None,
+            "password": None,
+            "hostname": cls.getenv(f"{p_dbtype}_PATH_{cls.__ENV}", raise_expection = False) or os.getcwd(),
+            "port"    : None
+        }
+    
+    @classmethod
+    def get_db_pool_config(cls, p_dbtype: str) -> dict:
+        
+        return {
+            "pool_size"      : cls.getenv(f"{p_dbtype}_POOL_SIZE_{cls.__ENV}", raise_expection = False) or cls.getenv("DB_POOL_SIZE", raise_expection = False),
+            "max_overflow"   : cls.getenv(f"{p_dbtype}_POOL_MAX_OVERFLOW_{cls.__ENV}", raise_expection = False) or cls.getenv("DB_POOL_MAX_OVERFLOW", raise_expection = False),
+            "pool_recycle"   : cls.getenv(f"{p_dbtype}_POOL_RECYCLE_SECONDS_{cls.__ENV}", raise_expection = False) or cls.getenv("DB_POOL_RECYCLE_SECONDS", raise_expection = False),
+            "pool_pre_ping"  : cls.getenv(f"{p_dbtype}_POOL_PRE_PING_{cls.__ENV}", raise_expection = False) or cls.getenv("DB_POOL_PRE_PING", raise_expection = False)
+        }
+    
+    @classmethod
+    def get_db_governor_config(cls, p_dbtype: str) -> dict:
+        
+        return {
+            "max_inflight" : cls.getenv(f"{p_dbtype}_MAX_INFLIGHT_{cls.__ENV}", raise_expection = False) or cls.getenv("DB_MAX_INFLIGHT", raise_expection = False),
+            "queue_policy" : cls.getenv("DB_QUEUE_POLICY", raise_expection = False),
+            "queue_timeout": cls.getenv("DB_QUEUE_TIMEOUT_SECONDS", raise_expection = False)
+        }
+    
     @classmethod
     def get_smtp_credential(cls) -> dict:
         
@@ -2,14 +2,33 @@
 # Packages                                          #
 #####################################################
 
+import io
+import os
+import json
+import uuid
+import atexit
+import decimal
 import logging
+import tempfile
+import threading
 import pandas as pd
 from functools import wraps
 from sqlalchemy import text
 from tabulate import tabulate
 from collections import namedtuple
+from datetime import date, datetime, time
 from sqlalchemy.engine.base import Engine
-from typing import Any, Callable, List, Optional
+from sqlalchemy.types import ARRAY, JSON, TypeEngine
+from dependencies.utilities.cred_util import CredUtil
+from dependencies.utilities.governor_util import GovernorUtil
+from dependencies.utilities.snapshot_util import SnapshotUtil
+from dependencies.entities.models.process_enum import ReadModeEnum
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+# Optional dependency, only required by the asyncio execution mode
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
 
 
 #####################################################
@@ -23,9 +42,36 @@ class DfUtil:
 
     """A utility class for handling data operations with Pandas DataFrames."""
 
+    # Class Private Variables
+    __DEFAULT_CHUNK_SIZE: int = 100_000
+    __COPY_SPOOL_SIZE: int = 64 * 1024 * 1024
+    __COPY_NULL: str = r"\N"
+
+    # Parsers of the `COPY` CSV text values by Postgres type OID, yielding the Python types of the psycopg2 cursor,
+    # other types (e.g. text, arrays) are kept as text, as the cursor does
+    __COPY_TYPE_PARSERS: Dict[int, Callable[[str], Any]] = {
+        16: lambda _value: _value == "t",
+        20: int, 21: int, 23: int, 26: int,
+        700: float, 701: float,
+        1700: decimal.Decimal,
+        1082: date.fromisoformat,
+        1083: time.fromisoformat,
+        1114: datetime.fromisoformat, 1184: datetime.fromisoformat,
+        114: json.loads, 3802: json.loads
+    }
+    __DEFAULT_WRITE_BATCH_SIZE: int = 1_000
+
+    # ConnectorX error messages of column types it can't map to Arrow, the only errors worth a cursor read retry
+    __ARROW_UNSUPPORTED_ERRORS: Tuple[str, ...] = ("not implemented", "unimplemented", "unsupported", "no conversion rule")
+
+    # Arrow IPC segment files spilled by this process, along with their total size
+    __SPILL_LOCK: threading.Lock = threading.Lock()
+    __SPILL_PATHS: List[str] = []
+    __spill_bytes: int = 0
+
     def __manage_connection(func: Callable) -> Callable:
 
-        """Decorator to manage database connections."""
+        """Decorator to manage database connections, holding an in-flight query slot of the database."""
 
         @wraps(func)
         def _wrapper(*args, **kwargs) -> Any:
@@ -33,7 +79,7 @@ class DfUtil:
             # Extract engine from function arguments
             p_engine = kwargs.get("p_engine") or args[1]
 
-            with p_engine.connect() as connection, connection.begin():
+            with GovernorUtil.slot(p_engine), p_engine.connect() as connection, connection.begin():
                 result = func(*args, **kwargs)
                 
             return result
@@ -41,24 +87,502 @@ class DfUtil:
         return _wrapper
 
 
+    @staticmethod
+    def resolve_read_mode(p_read_mode: Optional[ReadModeEnum] = None) -> ReadModeEnum:
+
+        """
+        Returns the given read mode, or the globally configured `DB_READ_MODE`, or the cursor read mode.
+            Only meant for the source reads of the rules, process database reads rely on the cursor read mode of `read_sql`.
+        """
+
+        return ReadModeEnum(
+            p_read_mode or (CredUtil.getenv("DB_READ_MODE", raise_expection = False) or ReadModeEnum.CURSOR.value).strip().upper()
+        )
+
+
+    @staticmethod
+    def read_sql(p_query: str, p_engine: Engine, p_dtype: type = None, p_read_mode: Optional[ReadModeEnum] = None, p_use_snapshot: bool = False) -> pd.DataFrame:
+
+        """
+        Executes an SQL SELECT query and returns the results as a Pandas DataFrame, with the cursor read mode unless another one is given.
+            With `p_use_snapshot`, the results are shared with the other tasks of the job batch through `SnapshotUtil`.
+            With the `ARROW` read mode, results are fetched into Arrow-backed dtypes, falling back to the cursor read mode
+            whenever the Arrow reader is not installed or does not support the column types of the query.
+            With the `COPY` read mode, Postgres results are bulk extracted with `COPY ... TO STDOUT` and parsed as CSV,
+            other databases fall back to the cursor read mode.
+        """
+
+        read_mode: ReadModeEnum = p_read_mode or ReadModeEnum.CURSOR
+
+        if p_use_snapshot:
+
+            return SnapshotUtil.get_or_load(
+                SnapshotUtil.get_key(p_engine, p_query, str(p_dtype), read_mode.value),
+                lambda: DfUtil.read_sql(p_query = p_query, p_engine = p_engine, p_dtype = p_dtype, p_read_mode = read_mode)
+            )
+
+        if read_mode == ReadModeEnum.ARROW:
+
+            arrow_df: Optional[pd.DataFrame] = DfUtil.__read_sql_arrow(p_query = p_query, p_engine = p_engine)
+
+            if arrow_df is not None:
+                return arrow_df.astype(p_dtype) if p_dtype else arrow_df
+
+        if read_mode == ReadModeEnum.COPY and DfUtil.__supports_copy(p_engine):
+
+            copy_extract: namedtuple = DfUtil.__copy_to_spool(p_query = p_query, p_engine = p_engine)
+
+            with copy_extract.spool as spool:
+                return DfUtil.__read_copy_csv(spool, copy_extract.type_codes, p_dtype = p_dtype)
+
+        return DfUtil.__read_sql_cursor(p_query = p_query, p_engine = p_engine, p_dtype = p_dtype)
+
+
     @staticmethod
     @__manage_connection
-    def read_sql(p_query: str, p_engine: Engine, p_dtype: type = None) -> pd.DataFrame:
+    def __read_sql_cursor(p_query: str, p_engine: Engine, p_dtype: type = None) -> pd.DataFrame:
 
-        """Executes an SQL SELECT query and returns the results as a Pandas DataFrame."""
+        """Executes an SQL SELECT query through a DB-API cursor and returns the results as a Pandas DataFrame."""
 
         logger.debug(f"Passed query: {p_query}")
         
         return pd.read_sql_query(sql = text(p_query), con = p_engine, dtype = p_dtype)
+
+
+    @staticmethod
+    def __read_sql_arrow(p_query: str, p_engine: Engine) -> Optional[pd.DataFrame]:
+
+        """
+        Executes an SQL SELECT query with ConnectorX, which fetches straight into Arrow columnar buffers,
+            and returns the results as a Pandas DataFrame with Arrow-backed dtypes, or None if the query can't be read this way.
+            Any other error (e.g. an invalid query) is raised as is, rather than running the query a second time.
+        """
+
+        try:
+            # Optional dependency, only required by the Arrow read mode
+            import connectorx
+
+        except ImportError:
+
+            logger.warning("Arrow read mode requested but `connectorx` is not installed, falling back to the cursor read mode.")
+
+            return None
+
+        logger.debug(f"Passed query (Arrow): {p_query}")
+
+        connection_uri: str = p_engine.url.set(drivername = p_engine.url.get_backend_name()).render_as_string(hide_password = False)
+
+        try:
+
+            with GovernorUtil.slot(p_engine):
+                arrow_table = connectorx.read_sql(connection_uri, p_query.strip().rstrip(";"), return_type = "arrow")
+
+        except Exception as error:
+
+            if not any(_message in str(error).lower() for _message in DfUtil.__ARROW_UNSUPPORTED_ERRORS):
+                raise
+
+            logger.warning(f"Arrow read mode does not support the query, falling back to the cursor read mode: {error}")
+
+            return None
+
+        return arrow_table.to_pandas(types_mapper = pd.ArrowDtype)
+
+
+    @staticmethod
+    def __supports_copy(p_engine: Engine) -> bool:
+
+        """Returns True if the engine's database supports the `COPY` read mode, logging the fallback otherwise."""
+
+        if p_engine.url.get_backend_name() == "postgresql":
+            return True
+
+        logger.debug(f"COPY read mode not supported for '{p_engine.url.get_backend_name()}', falling back to the cursor read mode.")
+
+        return False
+
+
+    @staticmethod
+    def __copy_to_spool(p_query: str, p_engine: Engine) -> namedtuple:
+
+        """
+        Bulk extracts the results of an SQL SELECT query with `COPY ... TO STDOUT` as headed CSV into a spool file,
+            kept in memory up to 64 MiB and rolled over to disk beyond. The in-flight query slot is held during the extraction only.
+            Returns the spool file along with the type OIDs of the result columns, described by a zero-row run of the query.
+        """
+
+        _read_query: str = p_query.strip().rstrip(";")
+
+        copy_query: str = f"COPY ({_read_query}) TO STDOUT WITH (FORMAT csv, HEADER true, NULL '{DfUtil.__COPY_NULL}')"
+
+        logger.debug(f"Passed query (COPY): {copy_query}")
+
+        spool: tempfile.SpooledTemporaryFile = tempfile.SpooledTemporaryFile(max_size = DfUtil.__COPY_SPOOL_SIZE, mode = "w+b")
+
+        try:
+
+            with GovernorUtil.slot(p_engine):
+
+                raw_connection = p_engine.raw_connection()
+
+                try:
+
+                    with raw_connection.cursor() as cursor:
+
+                        cursor.execute(f"SELECT * FROM ({_read_query}) AS copy_query LIMIT 0")
+                        type_codes: List[int] = [_column[1] for _column in cursor.description]
+
+                        cursor.copy_expert(copy_query, spool)
+
+                    raw_connection.commit()
+
+                finally:
+                    raw_connection.close()
+
+        except BaseException:
+
+            spool.close()
+            raise
+
+        spool.seek(0)
+
+        CopyExtract = namedtuple("CopyExtract", ["spool", "type_codes"])
+
+        return CopyExtract(spool = spool, type_codes = type_codes)
+
+
+    @staticmethod
+    def __read_copy_csv(p_spool: tempfile.SpooledTemporaryFile, p_type_codes: List[int], p_dtype: type = None, p_chunksize: Optional[int] = None) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+
+        """
+        Parses a `COPY` CSV extraction as text, telling NULLs apart from empty strings which `COPY` quotes,
+            and converts the values by the result column types, so that the DataFrame matches the one of the cursor read mode.
+        """
+
+        csv_reader: Union[pd.DataFrame, Iterator[pd.DataFrame]] = pd.read_csv(
+            p_spool, dtype = str, chunksize = p_chunksize, na_values = [DfUtil.__COPY_NULL], keep_default_na = False
+        )
+
+        if p_chunksize is None:
+            return DfUtil.__convert_copy_df(csv_reader, p_type_codes, p_dtype)
+
+        return (DfUtil.__convert_copy_df(csv_chunk, p_type_codes, p_dtype) for csv_chunk in csv_reader)
+
+
+    @staticmethod
+    def __convert_copy_df(p_csv_df: pd.DataFrame, p_type_codes: List[int], p_dtype: type = None) -> pd.DataFrame:
+
+        """
+        Converts the text values of a `COPY` CSV DataFrame into the Python values of the psycopg2 cursor,
+            and builds the DataFrame from the records the way the cursor read mode does.
+        """
+
+        column_values: List[List[Any]] = []
+
+        for column_index, type_code in enumerate(p_type_codes):
+
+            value_parser: Optional[Callable[[str], Any]] = DfUtil.__COPY_TYPE_PARSERS.get(type_code)
+
+            column_values.append([
+                None if pd.isna(_value) else (value_parser(_value) if value_parser else _value)
+                    for _value in p_csv_df.iloc[:, column_index].tolist()
+            ])
+
+        df: pd.DataFrame = pd.DataFrame.from_records(list(zip(*column_values)), columns = list(p_csv_df.columns), coerce_float = True)
+
+        return df.astype(p_dtype) if p_dtype else df
+    
+
+    @staticmethod
+    def read_sql_chunks(p_query: str, p_engine: Engine, p_chunksize: Optional[int] = None, p_dtype: type = None, p_read_mode: Optional[ReadModeEnum] = None, p_use_snapshot: bool = False) -> Iterator[pd.DataFrame]:
+
+        """
+        Executes an SQL SELECT query on a server-side cursor and yields the results as Pandas DataFrame chunks,
+            so that memory stays bounded by the chunk size (`DB_READ_CHUNK_SIZE` rows by default) instead of the result size.
+            The connection and its in-flight query slot are held until the chunks are exhausted or the generator is closed.
+            With the `COPY` read mode, Postgres results are bulk extracted first and the chunks are parsed from the extraction.
+            The `ARROW` read mode fetches whole results, hence chunked reads fall back to the cursor read mode.
+            With `p_use_snapshot`, the chunks are sliced from the job batch snapshot of the query if another task already fetched it,
+            streamed results are never cached though, as that would defeat the bounded memory.
+        """
+
+        chunksize: int = p_chunksize or int(CredUtil.getenv("DB_READ_CHUNK_SIZE", raise_expection = False) or DfUtil.__DEFAULT_CHUNK_SIZE)
+        read_mode: ReadModeEnum = p_read_mode or ReadModeEnum.CURSOR
+
+        snapshot_df: Optional[pd.DataFrame] = (
+            SnapshotUtil.get(SnapshotUtil.get_key(p_engine, p_query, str(p_dtype), read_mode.value)) if p_use_snapshot else None
+        )
+
+        if snapshot_df is not None:
+
+            logger.info("Source snapshot reused from the job batch cache.")
+
+            for chunk_start in range(0, snapshot_df.shape[0], chunksize):
+                yield snapshot_df.iloc[chunk_start:chunk_start + chunksize]
+
+            return
+
+        if read_mode == ReadModeEnum.COPY and DfUtil.__supports_copy(p_engine):
+
+            copy_extract: namedtuple = DfUtil.__copy_to_spool(p_query = p_query, p_engine = p_engine)
+
+            with copy_extract.spool as spool:
+                yield from DfUtil.__read_copy_csv(spool, copy_extract.type_codes, p_dtype = p_dtype, p_chunksize = chunksize)
+
+            return
+
+        if read_mode == ReadModeEnum.ARROW:
+            logger.warning("Arrow read mode does not support chunked reads, falling back to the cursor read mode.")
+
+        logger.debug(f"Passed query (chunks of {chunksize} rows): {p_query}")
+
+        # `stream_results` opens a named cursor with psycopg2 and an unbuffered `SSCursor` with pymysql
+        with GovernorUtil.slot(p_engine), p_engine.connect() as connection, connection.begin():
+
+            streaming_connection = connection.execution_options(stream_results = True, max_row_buffer = chunksize)
+
+            yield from pd.read_sql_query(sql = text(p_query), con = streaming_connection, dtype = p_dtype, chunksize = chunksize)
+    
+
+    @staticmethod
+    def is_spill_enabled() -> bool:
+
+        """Returns True if a spill directory is configured through `DB_SPILL_DIR`."""
+
+        return bool(CredUtil.getenv("DB_SPILL_DIR", raise_expection = False))
+
+
+    @staticmethod
+    def __write_spill_segment(p_df: pd.DataFrame) -> str:
+
+        """
+        Writes a DataFrame to an Arrow IPC segment file of the spill directory (`DB_SPILL_DIR`) and returns its path.
+            A segment which would take the spill store beyond `DB_SPILL_MAX_MB` megabytes per process raises a `MemoryError`
+            before being written, its Arrow buffer size being reserved against the cap.
+        """
+
+        # Optional dependency, only required by the spill store
+        import pyarrow as pa
+
+        spill_dir: str = CredUtil.getenv("DB_SPILL_DIR")
+        spill_max_mb: Optional[str] = CredUtil.getenv("DB_SPILL_MAX_MB", raise_expection = False)
+
+        os.makedirs(spill_dir, exist_ok = True)
+
+        segment_path: str = os.path.join(spill_dir, f"spill_{os.getpid()}_{uuid.uuid4().hex}.arrow")
+        segment_table: "pa.Table" = pa.Table.from_pandas(p_df, preserve_index = False)
+
+        with DfUtil.__SPILL_LOCK:
+
+            if spill_max_mb and DfUtil.__spill_bytes + segment_table.nbytes > float(spill_max_mb) * 1024 * 1024:
+                raise MemoryError(f"Spill store would exceed its cap of {spill_max_mb} MB in '{spill_dir}'.")
+
+            DfUtil.__spill_bytes += segment_table.nbytes
+
+        try:
+
+            with pa.OSFile(segment_path, "wb") as sink, pa.ipc.new_file(sink, segment_table.schema) as writer:
+                writer.write_table(segment_table)
+
+        except BaseException:
+
+            with DfUtil.__SPILL_LOCK:
+                DfUtil.__spill_bytes -= segment_table.nbytes
+
+            if os.path.exists(segment_path):
+                os.remove(segment_path)
+
+            raise
+
+        with DfUtil.__SPILL_LOCK:
+
+            # The reservation is settled with the size of the written file, which adds the IPC framing
+            DfUtil.__SPILL_PATHS.append(segment_path)
+            DfUtil.__spill_bytes += os.path.getsize(segment_path) - segment_table.nbytes
+
+        return segment_path
+
+
+    @staticmethod
+    def read_spilled(p_segment_paths: List[str]) -> pd.DataFrame:
+
+        """
+        Reopens spilled Arrow IPC segment files memory-mapped as a single DataFrame of Arrow-backed columns,
+            which are zero-copy views over the files, so that the OS page cache rather than the Python heap holds the data.
+        """
+
+        # Optional dependency, only required by the spill store
+        import pyarrow as pa
+
+        segment_tables: List["pa.Table"] = [
+            pa.ipc.open_file(pa.memory_map(_segment_path, "r")).read_all() for _segment_path in p_segment_paths
+        ]
+
+        # Segments may disagree on the types of columns which are null in some of them
+        return pa.concat_tables(segment_tables, promote_options = "permissive").to_pandas(types_mapper = pd.ArrowDtype)
+
+
+    @staticmethod
+    def spill_partitioned(p_df_chunks: Iterable[pd.DataFrame], p_key_columns: List[str], p_partitions: int) -> List[List[str]]:
+
+        """
+        Hash-partitions DataFrame chunks by their key columns into spill store buckets, and returns the segment paths of each bucket,
+            to be read back bucket by bucket with `read_spilled`. Rows sharing a key always land in the same bucket,
+            on both sides of a comparison, as keys are hashed on their text form once integral floats are narrowed to integers.
+            Every bucket holds at least an empty segment, so that each one carries the columns of the chunks.
+        """
+
+        bucket_paths: List[List[str]] = [[] for _ in range(p_partitions)]
+        empty_df: Optional[pd.DataFrame] = None
+
+        for df_chunk in p_df_chunks:
+
+            if empty_df is None:
+                empty_df = df_chunk.iloc[:0]
+
+            key_hashes = pd.util.hash_pandas_object(df_chunk[p_key_columns].convert_dtypes().astype(str), index = False)
+
+            for bucket, bucket_df in df_chunk.groupby((key_hashes % p_partitions).to_numpy(), sort = False):
+                bucket_paths[bucket].append(DfUtil.__write_spill_segment(bucket_df))
+
+        for segment_paths in bucket_paths:
+
+            if not segment_paths and empty_df is not None:
+                segment_paths.append(DfUtil.__write_spill_segment(empty_df))
+
+        logger.debug(f"Spilled {sum(map(len, bucket_paths))} segments into {p_partitions} buckets, {DfUtil.__spill_bytes} bytes spilled in total.")
+
+        return bucket_paths
+
+
+    @staticmethod
+    def clear_spill() -> None:
+
+        """
+        Removes the spill segment files of this process, unless `DB_SPILL_CLEANUP` is false to keep them for inspection.
+            Frames still mapping removed files stay readable until released.
+        """
+
+        with DfUtil.__SPILL_LOCK:
+
+            spill_paths: List[str] = DfUtil.__SPILL_PATHS.copy()
+
+            DfUtil.__SPILL_PATHS.clear()
+            DfUtil.__spill_bytes = 0
+
+        if (CredUtil.getenv("DB_SPILL_CLEANUP", raise_expection = False) or "TRUE").strip().upper() not in ("TRUE", "1", "YES"):
+            return
+
+        for spill_path in spill_paths:
+
+            if os.path.exists(spill_path):
+                os.remove(spill_path)
+
+
+    @staticmethod
+    async def read_scalar_async(p_query: str, p_engine: "AsyncEngine") -> Any:
+
+        """Executes an SQL SELECT query on an asyncio engine and returns the first column of the first row."""
+
+        logger.debug(f"Passed query: {p_query}")
+
+        async with GovernorUtil.slot_async(p_engine.url), p_engine.connect() as connection:
+
+            return (await connection.execute(text(p_query))).scalar()
     
 
     @staticmethod
-    @__manage_connection
     def insert_df_to_sql(p_df: pd.DataFrame, p_schema: str, p_table: str, p_engine: Engine, p_if_exists: str = "append", p_dtype: dict = None) -> None:
 
-        """Writes a Pandas DataFrame to a SQL database table."""
-        
-        p_df.to_sql(p_table, schema = p_schema, con = p_engine, if_exists = p_if_exists, method = "multi", index = False, dtype = p_dtype)
+        """
+        Writes a Pandas DataFrame to a SQL database table.
+            Appends to Postgres tables are bulk loaded with `COPY ... FROM STDIN`, other writes are inserted in executemany batches
+            of `DB_WRITE_BATCH_SIZE` rows.
+        """
+
+        if p_if_exists == "append" and p_engine.url.get_backend_name() == "postgresql":
+            return DfUtil.__copy_df_to_sql(p_df = p_df, p_schema = p_schema, p_table = p_table, p_engine = p_engine, p_dtype = p_dtype)
+
+        DfUtil.__insert_df_batches(p_df = p_df, p_schema = p_schema, p_table = p_table, p_engine = p_engine, p_if_exists = p_if_exists, p_dtype = p_dtype)
+
+
+    @staticmethod
+    @__manage_connection
+    def __insert_df_batches(p_df: pd.DataFrame, p_schema: str, p_table: str, p_engine: Engine, p_if_exists: str = "append", p_dtype: dict = None) -> None:
+
+        """Writes a Pandas DataFrame to a SQL database table with executemany batched inserts."""
+
+        batch_size: int = int(CredUtil.getenv("DB_WRITE_BATCH_SIZE", raise_expection = False) or DfUtil.__DEFAULT_WRITE_BATCH_SIZE)
+
+        p_df.to_sql(p_table, schema = p_schema, con = p_engine, if_exists = p_if_exists, method = None, chunksize = batch_size, index = False, dtype = p_dtype)
+
+
+    @staticmethod
+    def __to_copy_value(p_value: Any, p_dtype: Optional[TypeEngine]) -> Any:
+
+        """
+        Serializes a value for a `COPY` CSV load, rendering arrays as Postgres array literals
+            and JSON values (including JSON array items) as JSON documents.
+        """
+
+        if p_value is None or (not isinstance(p_value, (list, tuple, dict)) and pd.isna(p_value)):
+            return None
+
+        if isinstance(p_dtype, ARRAY):
+
+            items: List[Optional[str]] = [DfUtil.__to_copy_value(_item, p_dtype.item_type) for _item in p_value]
+
+            return "{" + ",".join(
+                "NULL" if _item is None else '"' + str(_item).replace("\\", "\\\\").replace('"', '\\"') + '"'
+                    for _item in items
+            ) + "}"
+
+        if isinstance(p_dtype, JSON) or isinstance(p_value, (list, tuple, dict)):
+            return json.dumps(p_value, default = str)
+
+        return p_value
+
+
+    @staticmethod
+    def __copy_df_to_sql(p_df: pd.DataFrame, p_schema: str, p_table: str, p_engine: Engine, p_dtype: dict = None) -> None:
+
+        """
+        Appends a Pandas DataFrame to a Postgres table with `COPY ... FROM STDIN`, streaming the rows as CSV.
+            Values are serialized according to `p_dtype` when given, so that `ARRAY(JSON)` columns load as arrays of JSON documents.
+        """
+
+        copy_df: pd.DataFrame = p_df.astype(object)
+
+        for column_name in copy_df.columns:
+            copy_df[column_name] = [DfUtil.__to_copy_value(_value, (p_dtype or {}).get(column_name)) for _value in copy_df[column_name]]
+
+        csv_buffer: io.StringIO = io.StringIO()
+        copy_df.to_csv(csv_buffer, index = False, header = False, na_rep = DfUtil.__COPY_NULL)
+        csv_buffer.seek(0)
+
+        column_identifiers: str = ", ".join(f'"{_column_name}"' for _column_name in copy_df.columns)
+        copy_query: str = f"COPY {p_schema}.{p_table} ({column_identifiers}) FROM STDIN WITH (FORMAT csv, NULL '{DfUtil.__COPY_NULL}')"
+
+        logger.debug(f"Passed query (COPY, {copy_df.shape[0]} rows): {copy_query}")
+
+        with GovernorUtil.slot(p_engine):
+
+            raw_connection = p_engine.raw_connection()
+
+            try:
+
+                with raw_connection.cursor() as cursor:
+                    cursor.copy_expert(copy_query, csv_buffer)
+
+                raw_connection.commit()
+
+            except BaseException:
+
+                raw_connection.rollback()
+                raise
+
+            finally:
+                raw_connection.close()
         
 
     @staticmethod
@@ -142,4 +666,8 @@ class DfUtil:
         if p_grains:
             sorted_columns = primary_columns + sorted_columns
 
-        return p_df[sorted_columns]
\ No newline at end of file
+        return p_df[sorted_columns]
+
+
+# Remove the spill segment files when the interpreter exits
+atexit.register(DfUtil.clear_spill)
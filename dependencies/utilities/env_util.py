@@ -6,7 +6,7 @@ import os
 import hashlib
 import platform
 import subprocess
-from typing import List
+from typing import List, Optional
 
 
 #####################################################
@@ -30,13 +30,19 @@ class EnvUtil:
         }
     }
 
+    __HASHED_MACHINE_ID: Optional[str] = None
+
 
     @classmethod
     def __get_hashed_machine_id(cls) -> str:
 
         """
         Retrieves and returns a SHA-256 hash of the machine's unique identifier (UUID), based on the operating system.
+            The hash is computed once per process as the machine ID does not change.
         """
+
+        if cls.__HASHED_MACHINE_ID:
+            return cls.__HASHED_MACHINE_ID
         
         _machine_id: str = None
         _system_name: str = platform.system().lower()
@@ -73,7 +79,9 @@ class EnvUtil:
         if not _machine_id:
             raise Exception("Critical error: Machine ID could not be retrieved. Ensure system compatibility.")
 
-        return hashlib.sha256(_machine_id.encode()).hexdigest()
+        cls.__HASHED_MACHINE_ID = hashlib.sha256(_machine_id.encode()).hexdigest()
+
+        return cls.__HASHED_MACHINE_ID
         
 
     @classmethod
@@ -0,0 +1,249 @@
+#####################################################
+# Packages                                          #
+#####################################################
+
+import time
+import asyncio
+import logging
+import threading
+from collections import deque
+from sqlalchemy.engine.base import Engine
+from sqlalchemy.engine import URL, make_url
+from dependencies.utilities.cred_util import CredUtil
+from dependencies.entities.models.process_enum import QueuePolicyEnum
+from typing import Deque, Dict, Final, Iterator, List, Optional, Tuple, Union
+from contextlib import AsyncExitStack, ExitStack, asynccontextmanager, contextmanager
+
+
+#####################################################
+# Class                                             #
+#####################################################
+
+logger = logging.getLogger(__name__)
+
+
+class GovernorUtil:
+
+    """
+    A utility class bounding the number of in-flight queries per source database, keyed by `(dbtype, host, dbname)`.
+        Limits are read once per key through `CredUtil.get_db_governor_config`, an unset limit leaves the database ungoverned.
+        With the `FIFO` queue policy, callers wait for a free slot in arrival order (optionally up to a timeout),
+        with the `REJECT` queue policy, callers fail right away when every slot is taken.
+        Slots are tracked per process, so process pool workers run disabled while the parent process holds their slots.
+    """
+
+    # Class Private Variables
+    __BACKEND_DBTYPES: Final[Dict[str, str]] = {
+        "mysql": "MYSQL",
+        "postgresql": "POSTGRE",
+        "sqlite": "SQLITE",
+        "duckdb": "DUCKDB"
+    }
+
+    __LOCK: Final[threading.Condition] = threading.Condition()
+    __SLOTS: Final[Dict[Tuple[str, str, str], dict]] = {}
+    __ENABLED: bool = True
+
+
+    @classmethod
+    def disable(cls) -> None:
+
+        """Disables the governor in the current process, used as the initializer of process pool workers."""
+
+        cls.__ENABLED = False
+
+
+    @classmethod
+    def __resolve_key(cls, p_connection: Union[str, URL, Engine]) -> Tuple[str, str, str]:
+
+        """Resolves the `(dbtype, host, dbname)` key of an engine, URL or connection string."""
+
+        url: URL = p_connection.url if isinstance(p_connection, Engine) else make_url(p_connection)
+        backend: str = url.get_backend_name()
+
+        return (cls.__BACKEND_DBTYPES.get(backend, backend.upper()), url.host or "", url.database or "")
+
+
+    @classmethod
+    def __get_slot(cls, p_key: Tuple[str, str, str]) -> dict:
+
+        """Returns the slot state of a key, reading its configuration on first use. Must be called holding the lock."""
+
+        if p_key not in cls.__SLOTS:
+
+            governor_config: dict = CredUtil.get_db_governor_config(p_key[0])
+
+            cls.__SLOTS[p_key] = {
+                "max_inflight": int(governor_config["max_inflight"]) if governor_config["max_inflight"] else None,
+                "queue_policy": QueuePolicyEnum((governor_config["queue_policy"] or QueuePolicyEnum.FIFO.value).strip().upper()),
+                "queue_timeout": float(governor_config["queue_timeout"]) if governor_config["queue_timeout"] else None,
+                "inflight": 0,
+                "waiters": deque()
+            }
+
+        return cls.__SLOTS[p_key]
+
+
+    @classmethod
+    def acquire(cls, p_connection: Union[str, URL, Engine]) -> Tuple[str, str, str]:
+
+        """
+        Acquires an in-flight query slot on the database and returns its key, to be passed back to `release`.
+            Raises a `TimeoutError` if the slot could not be acquired under the queue policy.
+        """
+
+        key: Tuple[str, str, str] = cls.__resolve_key(p_connection)
+
+        if not cls.__ENABLED:
+            return key
+
+        with cls.__LOCK:
+
+            slot: dict = cls.__get_slot(key)
+
+            if slot["max_inflight"] is None:
+                return key
+
+            waiters: Deque[object] = slot["waiters"]
+
+            if slot["inflight"] < slot["max_inflight"] and not waiters:
+                slot["inflight"] += 1
+                return key
+
+            if slot["queue_policy"] == QueuePolicyEnum.REJECT:
+                raise TimeoutError(f"All {slot['max_inflight']} query slots are in use for database {key}, rejected by the queue policy.")
+
+            ticket: object = object()
+            waiters.append(ticket)
+
+            queued_at: float = time.monotonic()
+            logger.info(f"Queued for a query slot on database {key}: {slot['inflight']} in flight, {len(waiters)} waiting.")
+
+            try:
+
+                while waiters[0] is not ticket or slot["inflight"] >= slot["max_inflight"]:
+
+                    remaining_timeout: Optional[float] = (
+                        slot["queue_timeout"] - (time.monotonic() - queued_at) if slot["queue_timeout"] is not None else None
+                    )
+
+                    if remaining_timeout is not None and remaining_timeout <= 0:
+                        raise TimeoutError(f"Timed out after {slot['queue_timeout']} seconds waiting for a query slot on database {key}.")
+
+                    cls.__LOCK.wait(remaining_timeout)
+
+            finally:
+
+                waiters.remove(ticket)
+                cls.__LOCK.notify_all()
+
+            slot["inflight"] += 1
+
+            logger.info(f"Acquired a query slot on database {key} after {time.monotonic() - queued_at:.2f} seconds.")
+
+        return key
+
+
+    @classmethod
+    def release(cls, p_key: Tuple[str, str, str]) -> None:
+
+        """Releases an in-flight query slot acquired with `acquire`."""
+
+        if not cls.__ENABLED:
+            return
+
+        with cls.__LOCK:
+
+            slot: dict = cls.__get_slot(p_key)
+
+            if slot["max_inflight"] is not None:
+                slot["inflight"] -= 1
+                cls.__LOCK.notify_all()
+
+
+    @classmethod
+    @contextmanager
+    def slot(cls, p_connection: Union[str, URL, Engine]) -> Iterator[None]:
+
+        """Context manager holding an in-flight query slot on the database for the duration of the block."""
+
+        key: Tuple[str, str, str] = cls.acquire(p_connection)
+
+        try:
+            yield
+
+        finally:
+            cls.release(key)
+
+
+    @classmethod
+    @asynccontextmanager
+    async def slot_async(cls, p_connection: Union[str, URL, Engine]):
+
+        """
+        Asynchronous counterpart of `slot`, waiting for the slot in the loop's default thread pool.
+            A slot acquired after the waiting coroutine got cancelled is released right away.
+        """
+
+        acquire_future: asyncio.Future = asyncio.ensure_future(asyncio.to_thread(cls.acquire, p_connection))
+
+        try:
+            key: Tuple[str, str, str] = await asyncio.shield(acquire_future)
+
+        except asyncio.CancelledError:
+
+            acquire_future.add_done_callback(
+                lambda _future: cls.release(_future.result()) if not _future.cancelled() and not _future.exception() else None
+            )
+
+            raise
+
+        try:
+            yield
+
+        finally:
+            cls.release(key)
+
+
+    @classmethod
+    def __resolve_distinct_connections(cls, p_connections: List[Union[str, URL, Engine]]) -> List[Union[str, URL, Engine]]:
+
+        """Returns one connection per distinct database key, ordered by key, so that slots are always taken in the same order."""
+
+        distinct_connections: Dict[Tuple[str, str, str], Union[str, URL, Engine]] = {}
+
+        for connection in p_connections:
+            distinct_connections.setdefault(cls.__resolve_key(connection), connection)
+
+        return [distinct_connections[key] for key in sorted(distinct_connections)]
+
+
+    @classmethod
+    @contextmanager
+    def slots(cls, p_connections: List[Union[str, URL, Engine]]) -> Iterator[None]:
+
+        """
+        Context manager holding one in-flight query slot per distinct database for the duration of the block,
+            used around the work delegated to another process.
+        """
+
+        with ExitStack() as exit_stack:
+
+            for connection in cls.__resolve_distinct_connections(p_connections):
+                exit_stack.enter_context(cls.slot(connection))
+
+            yield
+
+
+    @classmethod
+    @asynccontextmanager
+    async def slots_async(cls, p_connections: List[Union[str, URL, Engine]]):
+
+        """Asynchronous counterpart of `slots`."""
+
+        async with AsyncExitStack() as exit_stack:
+
+            for connection in cls.__resolve_distinct_connections(p_connections):
+                await exit_stack.enter_async_context(cls.slot_async(connection))
+
+            yield
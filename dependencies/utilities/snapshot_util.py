@@ -0,0 +1,229 @@
+#####################################################
+# Packages                                          #
+#####################################################
+
+import os
+import uuid
+import atexit
+import logging
+import threading
+import pandas as pd
+from collections import OrderedDict
+from sqlalchemy.engine.base import Engine
+from dependencies.utilities.cred_util import CredUtil
+from typing import Callable, Dict, Final, Hashable, List, Optional, Tuple
+
+
+#####################################################
+# Class                                             #
+#####################################################
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotUtil:
+
+    """
+    A utility class caching the source frames fetched by the rules within a job batch, keyed by `(dbtype, host, port, dbname, query)`,
+        so that tasks reading the same source data don't query the source again.
+        The cache holds up to `DB_SNAPSHOT_CACHE_MB` megabytes and evicts the least recently used frames,
+        an unset budget disables it, and frames larger than the budget are never cached. With `DB_SNAPSHOT_SPILL_DIR` set, evicted frames are spilled to Arrow IPC files
+        and read back on their next use instead of being dropped.
+    """
+
+    # Class Private Variables
+    __LOCK: Final[threading.Lock] = threading.Lock()
+    __FRAMES: Final["OrderedDict[Tuple[Hashable, ...], Tuple[pd.DataFrame, int]]"] = OrderedDict()
+    __SPILLED: Final[Dict[Tuple[Hashable, ...], str]] = {}
+    __LOADING: Final[Dict[Tuple[Hashable, ...], threading.Event]] = {}
+    __cached_bytes: int = 0
+
+
+    @staticmethod
+    def __get_budget_bytes() -> int:
+
+        """Returns the memory budget of the cache in bytes, zero when the cache is disabled."""
+
+        return int(float(CredUtil.getenv("DB_SNAPSHOT_CACHE_MB", raise_expection = False) or 0) * 1024 * 1024)
+
+
+    @staticmethod
+    def get_key(p_engine: Engine, p_query: str, *p_read_options: Hashable) -> Tuple[Hashable, ...]:
+
+        """
+        Returns the cache key of a query on an engine. The host is part of the key, so that tasks pinned to the primary
+            never reuse a frame read from a lagging replica, as are read options changing the fetched frame (such as dtypes or read modes).
+        """
+
+        return (p_engine.url.get_backend_name(), p_engine.url.host, p_engine.url.port, p_engine.url.database, " ".join(p_query.split()).rstrip(";"), *p_read_options)
+
+
+    @classmethod
+    def get(cls, p_key: Tuple[Hashable, ...]) -> Optional[pd.DataFrame]:
+
+        """Returns the cached frame of a key, reading it back from its spill file if it was spilled, or None if not cached."""
+
+        with cls.__LOCK:
+
+            if p_key in cls.__FRAMES:
+
+                cls.__FRAMES.move_to_end(p_key)
+
+                return cls.__FRAMES[p_key][0].copy(deep = False)
+
+            spill_path: Optional[str] = cls.__SPILLED.pop(p_key, None)
+
+        if spill_path is None:
+            return None
+
+        try:
+            df: pd.DataFrame = pd.read_feather(spill_path)
+
+        finally:
+            os.remove(spill_path)
+
+        logger.info(f"Source snapshot read back from its spill file: {spill_path}")
+
+        cls.put(p_key, df)
+
+        return df.copy(deep = False)
+
+
+    @classmethod
+    def put(cls, p_key: Tuple[Hashable, ...], p_df: pd.DataFrame) -> None:
+
+        """
+        Caches the frame of a key, evicting the least recently used frames beyond the memory budget.
+            A frame larger than the whole budget is not cached, as it would evict every other frame and itself right away.
+        """
+
+        budget_bytes: int = cls.__get_budget_bytes()
+
+        if not budget_bytes:
+            return
+
+        frame_bytes: int = int(p_df.memory_usage(deep = True).sum())
+
+        if frame_bytes > budget_bytes:
+
+            logger.info(f"Source snapshot not cached, its {frame_bytes / 1024 / 1024:.1f} MB exceed the cache budget.")
+
+            return
+
+        evicted_frames: Dict[Tuple[Hashable, ...], pd.DataFrame] = {}
+
+        with cls.__LOCK:
+
+            if p_key in cls.__FRAMES:
+                cls.__cached_bytes -= cls.__FRAMES.pop(p_key)[1]
+
+            cls.__FRAMES[p_key] = (p_df, frame_bytes)
+            cls.__cached_bytes += frame_bytes
+
+            while cls.__cached_bytes > budget_bytes and cls.__FRAMES:
+
+                evicted_key, (evicted_df, evicted_bytes) = cls.__FRAMES.popitem(last = False)
+                cls.__cached_bytes -= evicted_bytes
+
+                evicted_frames[evicted_key] = evicted_df
+
+        for evicted_key, evicted_df in evicted_frames.items():
+            cls.__spill(evicted_key, evicted_df)
+
+
+    @classmethod
+    def __spill(cls, p_key: Tuple[Hashable, ...], p_df: pd.DataFrame) -> None:
+
+        """Spills an evicted frame to an Arrow IPC file of the spill directory, if any, dropping it otherwise."""
+
+        spill_dir: Optional[str] = CredUtil.getenv("DB_SNAPSHOT_SPILL_DIR", raise_expection = False)
+
+        if not spill_dir:
+            return
+
+        spill_path: str = os.path.join(spill_dir, f"snapshot_{os.getpid()}_{uuid.uuid4().hex}.arrow")
+
+        try:
+
+            os.makedirs(spill_dir, exist_ok = True)
+            p_df.reset_index(drop = True).to_feather(spill_path)
+
+        except Exception as error:
+
+            # E.g. object columns of mixed types, which Arrow can't convert
+            logger.warning(f"Source snapshot dropped, it could not be spilled: {error}")
+
+            if os.path.exists(spill_path):
+                os.remove(spill_path)
+
+            return
+
+        with cls.__LOCK:
+            cls.__SPILLED[p_key] = spill_path
+
+
+    @classmethod
+    def get_or_load(cls, p_key: Tuple[Hashable, ...], p_loader: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+
+        """
+        Returns the cached frame of a key, loading and caching it with the loader on a miss.
+            Concurrent tasks missing the same key wait for a single load instead of querying the source each.
+        """
+
+        if not cls.__get_budget_bytes():
+            return p_loader()
+
+        while True:
+
+            cached_df: Optional[pd.DataFrame] = cls.get(p_key)
+
+            if cached_df is not None:
+
+                logger.info("Source snapshot reused from the job batch cache.")
+
+                return cached_df
+
+            with cls.__LOCK:
+
+                loading_event: Optional[threading.Event] = cls.__LOADING.get(p_key)
+
+                if loading_event is None:
+                    cls.__LOADING[p_key] = threading.Event()
+                    break
+
+            loading_event.wait()
+
+        try:
+
+            df: pd.DataFrame = p_loader()
+            cls.put(p_key, df)
+
+            return df.copy(deep = False)
+
+        finally:
+
+            with cls.__LOCK:
+                cls.__LOADING.pop(p_key).set()
+
+
+    @classmethod
+    def clear(cls) -> None:
+
+        """Drops every cached frame and spill file, to be called once the job batch is over."""
+
+        with cls.__LOCK:
+
+            spill_paths: List[str] = list(cls.__SPILLED.values())
+
+            cls.__FRAMES.clear()
+            cls.__SPILLED.clear()
+            cls.__cached_bytes = 0
+
+        for spill_path in spill_paths:
+
+            if os.path.exists(spill_path):
+                os.remove(spill_path)
+
+
+# Remove leftover spill files when the interpreter exits
+atexit.register(SnapshotUtil.clear)
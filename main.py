@@ -12,23 +12,28 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 # Packages                                          #
 #####################################################
 
+import time
 import signal
 import logging
 import argparse
 import warnings
 from types import FrameType
-from typing import List, Optional
+from typing import List, Optional, Set
+from dependencies.utilities.df_util import DfUtil
 from dependencies.utilities.env_util import EnvUtil
+from dependencies.utilities.snapshot_util import SnapshotUtil
 from dependencies.functions.core.helper_job import HelperJob
 from dependencies.functions.core.helper_task import HelperTask
+from dependencies.functions.core.helper_queue import HelperQueue
 from dependencies.functions.core.helper_alert import HelperAlert
 from dependencies.functions.core.helper_vault import HelperVault
 from dependencies.functions.core.config_reader import ConfigReader
 from dependencies.functions.core.log_auditor_job import LogAuditorJob
+from dependencies.functions.core.helper_executor import HelperExecutor
 from great_expectations.exceptions import GreatExpectationsValidationError
-from dependencies.entities.models.process_enum import JobStatusEnum, TaskStatusEnum
 from great_expectations.datasource.fluent.sql_datasource import GxDatasourceWarning
 from dependencies.entities.models.config_core_model import JobConfigModel, TaskConfigModel
+from dependencies.entities.models.process_enum import JobStatusEnum, QueueStatusEnum, RestartModeEnum, TaskStatusEnum
 
 
 #####################################################
@@ -38,6 +43,7 @@ from dependencies.entities.models.config_core_model import JobConfigModel, TaskC
 JOB_ID: int = 1002
 JOB_DEBUG: bool = False
 JOB_BATCH_ID: Optional[str] = None
+JOB_REQUEST_ID: Optional[int] = None
 
 
 #####################################################
@@ -46,7 +52,7 @@ JOB_BATCH_ID: Optional[str] = None
 
 # Get input argument
 args: argparse.Namespace = (
-    argparse.Namespace(job_id = JOB_ID, debug = JOB_DEBUG)
+    argparse.Namespace(job_id = JOB_ID, job_ids = None, job_group = None, worker = False, poll_seconds = 30, debug = JOB_DEBUG)
         if EnvUtil.is_dev() else HelperVault.parse_arguments()
 )
 
@@ -79,11 +85,34 @@ def __get_job_batch_id() -> Optional[str]:
     return globals().get("JOB_BATCH_ID")
 
 
+def __close_job_request(p_request_status: QueueStatusEnum) -> None:
+
+    """
+    Closes the job request held by the worker, if any, so that it is never left in the 'CLAIMED' status.
+    """
+
+    global JOB_REQUEST_ID
+
+    request_id: Optional[int] = JOB_REQUEST_ID
+
+    if request_id is None:
+        return
+
+    # Released before closing, so that a termination signal during the close does not close it twice
+    JOB_REQUEST_ID = None
+
+    try:
+        HelperQueue.close_job_request(p_request_id = request_id, p_request_status = p_request_status, p_job_batch_id = __get_job_batch_id())
+
+    except Exception as error:
+        logging.error(f"Job request '{request_id}' could not be closed, it is reclaimed once its lease expires: {error}")
+
+
 @HelperVault.retry_connection_error()
 def __update_job_termination(p_closing_status: JobStatusEnum, p_error: Exception) -> None:
 
     """
-    Attempts to update the job log with a termination status and error details
+    Attempts to update the job log with a termination status and error details.
     """
 
     # Log termination error
@@ -97,11 +126,9 @@ def __update_job_termination(p_closing_status: JobStatusEnum, p_error: Exception
         LogAuditorJob.update_log(
             job_status = p_closing_status,
             job_exception_type = p_error.__class__.__name__,
-            job_exception_message = str(p_error).replace("'", "''")
+            job_exception_message = str(p_error)
         )
 
-    sys.exit(1)
-
 
 def __handle_job_termination(signum: int, frame: FrameType) -> None:
 
@@ -125,19 +152,29 @@ def __handle_job_termination(signum: int, frame: FrameType) -> None:
         
         __update_job_termination(JobStatusEnum.STOPPED, SystemExit(error_message))
 
+    # Close the job request of a worker, which is otherwise left claimed by the stopped worker
+    __close_job_request(QueueStatusEnum.FAILED)
+
+    sys.exit(1)
+
 
 #####################################################
 # Main Function                                     #
 #####################################################
 
-def main() -> None:
+def run_job(p_job_id: int, p_job_scheduled: bool = arg_job_scheduled) -> bool:
+
+    """
+    Runs a single data quality job and returns whether it terminated without an error.
+    """
+
+    # Reset the batch ID of a previously run job of the same process
+    global JOB_BATCH_ID; JOB_BATCH_ID = None
         
     try:
 
-        logging.info(f"Input arguments: {args}")
-
         # Validate job configuration
-        job_config: JobConfigModel = ConfigReader.get_job_config(args.job_id)
+        job_config: JobConfigModel = ConfigReader.get_job_config(p_job_id)
 
 
         # Validate task configuration
@@ -146,11 +183,11 @@ def main() -> None:
 
         # Initialize job logger
         logging.info("Batch Setup:")
-        global JOB_BATCH_ID; JOB_BATCH_ID = LogAuditorJob.initialize(p_job_config = job_config)
+        JOB_BATCH_ID = LogAuditorJob.initialize(p_job_config = job_config)
 
 
         # Log trigger status
-        LogAuditorJob.insert_log(p_job_scheduled = arg_job_scheduled)
+        LogAuditorJob.insert_log(p_job_scheduled = p_job_scheduled)
 
 
         # Registering termination signals
@@ -162,53 +199,70 @@ def main() -> None:
         if not job_config.is_active:
 
             LogAuditorJob.update_log(job_status = JobStatusEnum.IN_ACTIVE)
-            return
+            return True
 
 
         # Check previous active job runs
         HelperJob.validate_previous_jobs(job_config.job_id, JOB_BATCH_ID, job_config.job_wait_minute)
 
 
-        # Restart from failure (Only for manual run)
-        starting_task_id: int = HelperTask.get_starting_task_id(job_config.job_id, JOB_BATCH_ID, arg_job_scheduled, job_config.is_restart)
-        logging.info(f"Job starting task id: {starting_task_id}")
+        # Job log updates issued before the first task starts are written in a single round trip
+        with LogAuditorJob.coalesce():
+
+            # Restart from failure (Only for manual run)
+            if job_config.restart_mode == RestartModeEnum.INCREMENTAL:
+
+                carried_task_ids: Set[int] = HelperTask.carry_forward_passed_tasks(job_config.job_id, JOB_BATCH_ID, p_job_scheduled, job_config.is_restart, task_configs)
+                logging.info(f"Job carried forward task ids: {sorted(carried_task_ids)}")
+
+                task_configs = [task_config for task_config in task_configs if task_config.task_id not in carried_task_ids]
+                starting_task_id: int = 1
 
+            else:
 
-        # Task Validation
-        LogAuditorJob.update_log(job_status = JobStatusEnum.IN_PROGRESS); logging.info("***\n")
+                starting_task_id: int = HelperTask.get_starting_task_id(job_config.job_id, JOB_BATCH_ID, p_job_scheduled, job_config.is_restart)
+                logging.info(f"Job starting task id: {starting_task_id}")
+
+
+            # Task Validation
+            LogAuditorJob.update_log(job_status = JobStatusEnum.IN_PROGRESS); logging.info("***\n")
         
         logging.info("Data Quality Checks:")
 
-        for task_index, task_config in enumerate(task_configs, start = 1):
-                        
-            if task_config.task_id >= starting_task_id:
+        try:
+            HelperExecutor.execute(JOB_BATCH_ID, task_configs, starting_task_id, job_config.max_workers, job_config.max_processes, job_config.is_async)
 
-                try:
-                    HelperTask.diagnose(JOB_BATCH_ID, task_config)
-                    logging.info("---" if task_index != len(task_configs) else "***\n")
+        except GreatExpectationsValidationError as gx_error:
+            logging.error(gx_error)
+            logging.info("***\n")
+            LogAuditorJob.update_log(fail_fast = True)
 
-                except GreatExpectationsValidationError as gx_error:
-                    logging.error(gx_error)
-                    logging.info("***\n")
-                    LogAuditorJob.update_log(fail_fast = True)
-                    break
+        finally:
 
+            # Source snapshots and spilled frames are scoped to the job batch
+            SnapshotUtil.clear()
+            DfUtil.clear_spill()
 
-        # Update validation status
-        job_validation_status: TaskStatusEnum = HelperTask.get_validation_status(JOB_BATCH_ID)
-        LogAuditorJob.update_log(validation_status = job_validation_status)
-        
 
-        # Mark job as 'COMPLETED'
-        LogAuditorJob.update_log(job_status = JobStatusEnum.COMPLETED)
+        with LogAuditorJob.coalesce():
+
+            # Update validation status
+            job_validation_status: TaskStatusEnum = HelperTask.get_validation_status(JOB_BATCH_ID)
+            LogAuditorJob.update_log(validation_status = job_validation_status)
+            
+
+            # Mark job as 'COMPLETED'
+            LogAuditorJob.update_log(job_status = JobStatusEnum.COMPLETED)
 
     
     except TimeoutError as error:
         __update_job_termination(JobStatusEnum.TIMEOUT, error)
+        return False
 
 
     except Exception as error:
         __update_job_termination(JobStatusEnum.ERROR, error)
+        return False
 
             
     finally:
@@ -224,6 +278,87 @@ def main() -> None:
                 # HelperAlert.send_teams_notification(job_config, job_log_model, notification_info)
                 pass
 
+    return True
+
+
+def run_worker(p_poll_seconds: int) -> None:
+
+    """
+    Runs the pending job requests of the job queue table until the process is terminated.
+        Engines, Great Expectations context and API auth tokens stay warm between the job runs.
+        The claimed job request is leased by a heartbeat and always closed, even if the job run raises.
+    """
+
+    global JOB_REQUEST_ID
+
+    # Registering termination signals, so that an idle worker also stops gracefully
+    signal.signal(signal.SIGINT, __handle_job_termination)
+    signal.signal(signal.SIGTERM, __handle_job_termination)
+
+    logging.info(f"Worker '{HelperQueue.get_worker_id()}' started, polling every {p_poll_seconds} seconds.")
+
+    while True:
+
+        job_request = HelperQueue.claim_job_request()
+
+        if job_request is None:
+            time.sleep(p_poll_seconds)
+            continue
+
+        JOB_REQUEST_ID = job_request.request_id
+        job_succeeded: bool = False
+
+        try:
+
+            with HelperQueue.heartbeat(job_request.request_id):
+                job_succeeded = run_job(job_request.job_id, job_request.is_scheduled)
+
+        finally:
+            __close_job_request(QueueStatusEnum.COMPLETED if job_succeeded else QueueStatusEnum.FAILED)
+
+
+def main() -> None:
+
+    """
+    Runs every requested job one after another within the current process.
+        Jobs share the process wide database engines, Great Expectations context and API auth tokens.
+    """
+
+    logging.info(f"Input arguments: {args}")
+
+    if args.worker:
+        return run_worker(args.poll_seconds)
+
+    try:
+
+        if args.job_ids:
+            job_ids: List[int] = args.job_ids
+
+        elif args.job_group:
+            job_ids: List[int] = ConfigReader.get_job_ids(args.job_group)
+
+        else:
+            job_ids: List[int] = [args.job_id]
+
+    except Exception as error:
+        logging.error(error)
+        sys.exit(1)
+
+    failed_job_ids: List[int] = []
+
+    for job_index, job_id in enumerate(job_ids, start = 1):
+
+        if len(job_ids) > 1:
+            logging.info(f"Job {job_index}/{len(job_ids)}: Job ID '{job_id}'")
+
+        if not run_job(job_id):
+            failed_job_ids.append(job_id)
+
+    if failed_job_ids:
+
+        logging.error(f"Jobs terminated with an error: {failed_job_ids}")
+        sys.exit(1)
+
 
 #####################################################
 # Main Execution                                    #